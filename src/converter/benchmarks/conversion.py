@@ -0,0 +1,216 @@
+"""Benchmark of the stages of the conversion on synthetic measurement modules.
+
+Writes the timings as JSON so that the results of two versions of the converter can be
+compared with `--baseline`.
+"""
+
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+from corpus import MEASUREMENT_FUNCTION, CorpusCase, generate_measurement, get_default_cases
+
+from ni_measurement_plugin_converter import __version__
+from ni_measurement_plugin_converter._constants import DEBUG_LOGGER
+from ni_measurement_plugin_converter._utils import (
+    AnalysisContext,
+    Profiler,
+    convert_measurement,
+)
+from ni_measurement_plugin_converter._utils._cache import (
+    CACHE_DIR_ENV_VAR,
+    FORMATTED_CODE_DIR_NAME,
+)
+
+ANALYSIS_STAGE = "analysis"
+TOTAL = "total"
+DISPLAY_NAME = "Benchmark"
+MEASUREMENT_FILENAME = "measurement.py"
+WARM_UP_CASE = CorpusCase("warm-up", parameters=1, outputs=1, sessions=1, lines=0)
+# Faster stages are not compared, as their timings are dominated by noise.
+MIN_COMPARED_TIME_IN_MS = 1.0
+
+RUNNING_CASE = (
+    "{name}: {lines} lines, {parameters} parameters, {outputs} outputs, {sessions} sessions"
+)
+CASE_RESULT = "  {stage:<20} {time:>10.1f} ms"
+COMPARISON_RESULT = "  {stage:<20} {baseline:>10.1f} ms {time:>10.1f} ms {ratio:>8.2f}x{flag}"
+COMPARISON_HEADER = "{name}: {baseline_version} -> {version}"
+MISSING_CASE = "{name}: not in the baseline."
+REGRESSION_FLAG = "  REGRESSION"
+REGRESSIONS_FOUND = "{count} stages are slower than the baseline by more than {tolerance:.0%}."
+RESULTS_WRITTEN = "Results are written to {path}"
+
+
+def _benchmark_case(case: CorpusCase, work_dir: Path, repeat: int) -> Dict[str, Any]:
+    measurement_file_path = work_dir / case.name / MEASUREMENT_FILENAME
+    measurement_file_path.parent.mkdir(parents=True)
+    source_code = generate_measurement(case)
+    measurement_file_path.write_text(source_code, encoding="utf-8")
+    case_result: Dict[str, Any] = {**case._asdict(), "lines": source_code.count("\n")}
+    click.echo(RUNNING_CASE.format(**case_result))
+
+    logger = logging.getLogger(DEBUG_LOGGER)
+    stage_times: Dict[str, List[float]] = {}
+
+    for index in range(repeat):
+        # Format the migrated file every time, as the formatted code is otherwise cached.
+        shutil.rmtree(work_dir / "cache" / FORMATTED_CODE_DIR_NAME, ignore_errors=True)
+        directory_out = work_dir / case.name / f"out{index}"
+        directory_out.mkdir()
+        profiler = Profiler()
+
+        start_time = time.perf_counter()
+        analysis_context = AnalysisContext.from_file(measurement_file_path)
+        analysis_time = time.perf_counter() - start_time
+
+        convert_measurement(
+            display_name=DISPLAY_NAME,
+            function=MEASUREMENT_FUNCTION,
+            directory_out=directory_out,
+            analysis_context=analysis_context,
+            logger=logger,
+            use_cache=False,
+            profiler=profiler,
+        )
+        total_time = time.perf_counter() - start_time
+
+        times = {ANALYSIS_STAGE: analysis_time}
+        times.update({name: stage.wall_time for name, stage in profiler.stages.items()})
+        times[TOTAL] = total_time
+        for stage, stage_time in times.items():
+            stage_times.setdefault(stage, []).append(stage_time)
+
+    case_result["stages"] = {
+        stage: statistics.median(times) * 1000 for stage, times in stage_times.items()
+    }
+    for stage, stage_time in case_result["stages"].items():
+        click.echo(CASE_RESULT.format(stage=stage, time=stage_time))
+
+    return case_result
+
+
+def _compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> int:
+    baseline_cases = {case["name"]: case for case in baseline["cases"]}
+    regressions = 0
+
+    for case in results["cases"]:
+        click.echo(
+            COMPARISON_HEADER.format(
+                name=case["name"],
+                baseline_version=baseline["converter_version"],
+                version=results["converter_version"],
+            )
+        )
+        baseline_case = baseline_cases.get(case["name"])
+        if not baseline_case:
+            click.echo(MISSING_CASE.format(name=case["name"]))
+            continue
+
+        for stage, stage_time in case["stages"].items():
+            baseline_time = baseline_case["stages"].get(stage)
+            if not baseline_time or baseline_time < MIN_COMPARED_TIME_IN_MS:
+                continue
+
+            ratio = stage_time / baseline_time
+            is_regression = ratio > 1 + tolerance
+            regressions += is_regression
+            click.echo(
+                COMPARISON_RESULT.format(
+                    stage=stage,
+                    baseline=baseline_time,
+                    time=stage_time,
+                    ratio=ratio,
+                    flag=REGRESSION_FLAG if is_regression else "",
+                )
+            )
+
+    return regressions
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.option(
+    "-o",
+    "--output",
+    default="benchmark_results.json",
+    show_default=True,
+    help="Path of the JSON file to write the results to.",
+)
+@click.option(
+    "-n",
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Number of conversions per case. The median time of each stage is reported.",
+)
+@click.option(
+    "-k",
+    "--case",
+    "case_names",
+    multiple=True,
+    help="Name of a case to run. Repeat the option to run several cases. Defaults to all cases.",
+)
+@click.option(
+    "-b",
+    "--baseline",
+    help="Path of the JSON results of another version to compare the results with.",
+)
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.2,
+    show_default=True,
+    help="Fraction by which a stage may be slower than the baseline before it is a regression.",
+)
+def benchmark_conversion(
+    output: str,
+    repeat: int,
+    case_names: List[str],
+    baseline: Optional[str],
+    tolerance: float,
+) -> None:
+    """Benchmark the stages of the conversion on synthetic measurement modules."""
+    cases = [case for case in get_default_cases() if not case_names or case.name in case_names]
+    logging.getLogger(DEBUG_LOGGER).addHandler(logging.NullHandler())
+    logging.getLogger(DEBUG_LOGGER).propagate = False
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ[CACHE_DIR_ENV_VAR] = str(Path(work_dir) / "cache")
+
+        # Compile the templates and import the dependencies before the timed conversions.
+        _benchmark_case(WARM_UP_CASE, Path(work_dir), repeat=1)
+        case_results = [_benchmark_case(case, Path(work_dir), repeat) for case in cases]
+
+    results = {
+        "converter_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "repeat": repeat,
+        "cases": case_results,
+    }
+    Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    click.echo(RESULTS_WRITTEN.format(path=Path(output).resolve()))
+
+    if baseline:
+        baseline_results = json.loads(Path(baseline).read_text(encoding="utf-8"))
+        regressions = _compare(results, baseline_results, tolerance)
+
+        if regressions:
+            click.echo(REGRESSIONS_FOUND.format(count=regressions, tolerance=tolerance))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    benchmark_conversion()
@@ -0,0 +1,133 @@
+"""Generation of synthetic measurement modules for the conversion benchmarks."""
+
+from typing import List, NamedTuple
+
+MEASUREMENT_FUNCTION = "measure"
+
+PARAMETER_TYPES = [
+    ("float", "1.0"),
+    ("int", "1"),
+    ("str", '"value"'),
+    ("bool", "True"),
+    ("List[float]", "[1.0]"),
+    ("List[int]", "[1]"),
+    ("List[str]", '["value"]'),
+    ("List[bool]", "[True]"),
+]
+DRIVER_SESSIONS = [
+    ("nidcpower", 'nidcpower.Session(resource_name="DCPower{index}")'),
+    ("nidmm", 'nidmm.Session(resource_name="DMM{index}")'),
+    ("niscope", 'niscope.Session(resource_name="Scope{index}")'),
+    ("nifgen", 'nifgen.Session(resource_name="FGen{index}")'),
+]
+HELPER_FUNCTION = '''
+
+def helper_{index}(values: List[float], scale: float = 1.0) -> List[float]:
+    """Scale the values."""
+    scaled_values = []
+    for value in values:
+        if value > 0:
+            scaled_values.append(value * scale)
+        else:
+            scaled_values.append(-value * scale)
+    return scaled_values
+'''
+HELPER_FUNCTION_LINE_COUNT = HELPER_FUNCTION.count("\n")
+
+
+class CorpusCase(NamedTuple):
+    """Shape of a synthetic measurement module."""
+
+    name: str
+    parameters: int
+    outputs: int
+    sessions: int
+    lines: int
+
+
+def get_default_cases() -> List[CorpusCase]:
+    """Get the benchmark cases, from small to large modules along each dimension.
+
+    Returns:
+        Cases of the benchmark suite.
+    """
+    cases = [CorpusCase("baseline", parameters=10, outputs=3, sessions=1, lines=0)]
+    cases += [
+        CorpusCase(f"parameters-{count}", parameters=count, outputs=3, sessions=1, lines=0)
+        for count in (100, 500, 2000)
+    ]
+    cases += [
+        CorpusCase(f"outputs-{count}", parameters=10, outputs=count, sessions=1, lines=0)
+        for count in (100, 300)
+    ]
+    cases += [
+        CorpusCase(f"sessions-{count}", parameters=10, outputs=3, sessions=count, lines=0)
+        for count in (10, 100)
+    ]
+    cases += [
+        CorpusCase(f"lines-{count}", parameters=10, outputs=3, sessions=1, lines=count)
+        for count in (1000, 10000, 50000)
+    ]
+    return cases
+
+
+def _generate_measurement_function(case: CorpusCase) -> List[str]:
+    parameters = []
+    for index in range(case.parameters):
+        data_type, default_value = PARAMETER_TYPES[index % len(PARAMETER_TYPES)]
+        parameters.append(f"    input_{index}: {data_type} = {default_value},")
+
+    output_types = [PARAMETER_TYPES[index % 4][0] for index in range(case.outputs)]
+    lines = [
+        f"def {MEASUREMENT_FUNCTION}(",
+        *parameters,
+        f") -> Tuple[{', '.join(output_types)}]:",
+        '    """Measure the synthetic outputs."""',
+    ]
+
+    for index in range(case.sessions):
+        driver, session = DRIVER_SESSIONS[index % len(DRIVER_SESSIONS)]
+        lines += [
+            f"    with {session.format(index=index)} as {driver}_session_{index}:",
+            f"        reading_{index} = input_0",
+        ]
+
+    for index in range(case.outputs):
+        _, value = PARAMETER_TYPES[index % 4]
+        lines.append(f"    output_{index} = {value}")
+
+    output_names = ", ".join(f"output_{index}" for index in range(case.outputs))
+    lines.append(f"    return {output_names}")
+    return lines
+
+
+def generate_measurement(case: CorpusCase) -> str:
+    """Generate the source code of a synthetic measurement module.
+
+    The module has a measurement function with the typed parameters, a tuple of outputs and
+    a driver `with` block per session of the case. Helper functions pad the module to the
+    number of lines of the case.
+
+    Args:
+        case: Shape of the measurement module.
+
+    Returns:
+        Source code of the measurement module.
+    """
+    drivers = sorted({driver for driver, _ in DRIVER_SESSIONS})
+    lines = [
+        '"""Synthetic measurement."""',
+        "",
+        "from typing import List, Tuple",
+        "",
+        *[f"import {driver}" for driver in drivers],
+        "",
+        "",
+        *_generate_measurement_function(case),
+    ]
+
+    helper_count = max(0, case.lines - len(lines)) // HELPER_FUNCTION_LINE_COUNT
+    source_code = "\n".join(lines) + "\n"
+    source_code += "".join(HELPER_FUNCTION.format(index=index) for index in range(helper_count))
+
+    return source_code
@@ -0,0 +1,120 @@
+"""Benchmark of the startup time of the NI Measurement Plug-In Converter CLI.
+
+Measures the import time of the CLI module and the latency of `-h`, and fails when either
+exceeds its budget or when the CLI module imports a dependency that is only needed to convert.
+"""
+
+import re
+import statistics
+import subprocess  # nosec: B404
+import sys
+import time
+from typing import List
+
+import click
+
+CLI_MODULE = "ni_measurement_plugin_converter"
+HEAVY_MODULES = [
+    "astor",
+    "black",
+    "mako",
+    "pydantic",
+    "ni_measurement_plugin_sdk_service",
+    "ni_measurement_plugin_ui_creator",
+]
+IMPORT_TIME_PATTERN = re.compile(rf"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*{CLI_MODULE}$")
+
+IMPORT_TIME_RESULT = "Import time of {module}: {time:.1f} ms (budget: {budget:.1f} ms)"
+HELP_LATENCY_RESULT = "Latency of -h: {time:.1f} ms (budget: {budget:.1f} ms)"
+HEAVY_MODULES_IMPORTED = "{module} imports {modules} at startup."
+BUDGET_EXCEEDED = "Startup time exceeds the budget."
+BENCHMARK_PASSED = "Startup time is within the budget."
+
+
+def _measure_import_time() -> float:
+    # `-X importtime` reports the cumulative import time of each module in microseconds.
+    process = subprocess.run(  # nosec: B603
+        [sys.executable, "-X", "importtime", "-c", f"import {CLI_MODULE}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line.strip())
+        if match:
+            return int(match.group(1)) / 1000
+
+    raise RuntimeError(f"Import time of {CLI_MODULE} is not reported.")
+
+
+def _measure_help_latency() -> float:
+    start = time.perf_counter()
+    subprocess.run(  # nosec: B603
+        [sys.executable, "-m", CLI_MODULE, "-h"],
+        capture_output=True,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def _get_imported_heavy_modules() -> List[str]:
+    process = subprocess.run(  # nosec: B603
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {CLI_MODULE}; print(' '.join(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imported_modules = set(process.stdout.split())
+    return [module for module in HEAVY_MODULES if module in imported_modules]
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.option(
+    "-n",
+    "--runs",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of runs. The median of the runs is compared with the budget.",
+)
+@click.option(
+    "--import-budget",
+    type=float,
+    default=150.0,
+    show_default=True,
+    help="Budget for the import time of the CLI module in milliseconds.",
+)
+@click.option(
+    "--help-budget",
+    type=float,
+    default=250.0,
+    show_default=True,
+    help="Budget for the latency of -h in milliseconds, including the interpreter startup.",
+)
+def benchmark_startup(runs: int, import_budget: float, help_budget: float) -> None:
+    """Benchmark the startup time of the CLI and fail if it exceeds the budget."""
+    # Warm up the bytecode cache so that the first run is not slower than the others.
+    _measure_help_latency()
+
+    import_time = statistics.median(_measure_import_time() for _ in range(runs))
+    help_latency = statistics.median(_measure_help_latency() for _ in range(runs))
+    heavy_modules = _get_imported_heavy_modules()
+
+    click.echo(IMPORT_TIME_RESULT.format(module=CLI_MODULE, time=import_time, budget=import_budget))
+    click.echo(HELP_LATENCY_RESULT.format(time=help_latency, budget=help_budget))
+
+    if heavy_modules:
+        click.echo(HEAVY_MODULES_IMPORTED.format(module=CLI_MODULE, modules=heavy_modules))
+
+    if heavy_modules or import_time > import_budget or help_latency > help_budget:
+        raise click.ClickException(BUDGET_EXCEEDED)
+
+    click.echo(BENCHMARK_PASSED)
+
+
+if __name__ == "__main__":
+    benchmark_startup()
@@ -2,34 +2,38 @@
 
 __version__ = "1.0.0"
 
-import ast
-import re
-import shutil
+import functools
+import logging
+import time
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import click
 from click import ClickException
-from mako.exceptions import CompileException, TemplateLookupException
 
 from ni_measurement_plugin_converter._constants import (
     ACCESS_DENIED,
-    ALPHANUMERIC_PATTERN,
     DEBUG_LOGGER,
-    ENCODING,
+    SCAN_INDEX_FILE_NAME,
 )
 from ni_measurement_plugin_converter._utils import (
-    create_file,
-    create_measui_file,
-    extract_inputs,
-    extract_outputs,
-    get_function_node,
+    AnalysisContext,
+    FormattingPolicy,
     initialize_logger,
     print_log_file_location,
-    process_sessions_and_update_metadata,
     remove_handlers,
+    validate_archive_path,
+    validate_function,
+    validate_measurement_file,
+    validate_output_directory,
+    validate_scan_directory,
 )
 
+if TYPE_CHECKING:
+    from ni_measurement_plugin_converter._models import BatchResult
+    from ni_measurement_plugin_converter._utils import Profiler
+
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
 STARTING_EXECUTION = "Starting NI Measurement Plug-In Converter..."
@@ -38,67 +42,64 @@ PROCESS_COMPLETED = "Process completed."
 ERROR_OCCURRED = (
     "Error occurred. Please verify that the provided measurement is in the expected format."
 )
-MEASUREMENT_PLUGIN_CREATED = "Measurement plug-in is created at {plugin_dir}"
-MEASUI_FILE_CREATED = "Measurement UI file is created."
-MEASUREMENT_FILE_CREATED = "Measurement file is created."
-FILE_MIGRATED = "Migrated file is created."
-BATCH_FILE_CREATED = "Batch file is created."
-HELPER_FILE_CREATED = "Helper file is created."
-SERVICE_CONFIG_CREATED = "Service config is created."
-GET_FUNCTION = "Getting function node tree..."
 VALIDATE_CLI_ARGS = "Inputs validated successfully."
-EXTRACT_INPUT_INFO = "Extracting inputs information from measurement function..."
-EXTRACT_OUTPUT_INFO = "Extracting outputs information from measurement function..."
 LOG_FILE = "Please find the log file at {log_file_path}"
-
-MEASUREMENT_TEMPLATE = "measurement.py.mako"
-MEASUREMENT_FILENAME = "measurement.py"
-HELPER_TEMPLATE = "_helpers.py.mako"
-HELPER_FILENAME = "_helpers.py"
-SERVICE_CONFIG_TEMPLATE = "measurement.serviceconfig.mako"
-SERVICE_CONFIG_FILE_EXTENSION = ".serviceconfig"
-BATCH_TEMPLATE = "start.bat.mako"
-BATCH_FILENAME = "start.bat"
-MIGRATED_MEASUREMENT_FILENAME = "_migrated.py"
-
-MEASUREMENT_VERSION = "1.0.0.0"
+STARTING_BATCH = "Converting {count} measurements..."
+BATCH_ENTRY_CONVERTED = "Converted '{display_name}'. Measurement plug-in is created at {plugin_dir}"
+BATCH_ENTRY_FAILED = "Failed to convert '{display_name}': {error}"
+BATCH_SUMMARY = "{succeeded} of {total} measurements converted successfully."
+STARTING_FUNCTIONS = "Converting {count} measurement functions: {functions}"
+FUNCTION_OPTION_REQUIRED = "Either '-f' / '--function' or '--all-functions' is required."
+FUNCTION_OPTIONS_EXCLUSIVE = "'-f' / '--function' cannot be used with '--all-functions'."
+NO_MEASUREMENT_FUNCTIONS = "No measurement functions found in the file {measurement_file_path}"
+OUTPUT_OPTION_REQUIRED = "Either '-o' / '--directory-out' or '--archive' is required, but not both."
+WATCH_ARCHIVE_EXCLUSIVE = "'--watch' cannot be used with '--archive'."
+ARCHIVE_CREATED = "Measurement plug-in archive is created at {archive_path}"
+BATCH_ENTRY_ARCHIVED = (
+    "Converted '{display_name}'. Measurement plug-in is archived in {archive_path} "
+    "under '{directory}'"
+)
+STARTING_SCAN = "Scanning {directory} for measurement functions..."
+SCAN_SUMMARY = (
+    "Scanned {files} Python files in {seconds:.1f} s. Parsed {parsed} new or changed files."
+)
+SCAN_PARSE_ERRORS = "{count} files cannot be parsed. Their errors are recorded in the index."
+SCANNED_FUNCTION = "  {path}:{line} {function} {drivers}"
+SCANNED_FUNCTION_NOT_CONVERTIBLE = (
+    "  {path}:{line} {function} {drivers} - not convertible: {reason}"
+)
+SCANNED_FUNCTIONS = "Found {count} measurement functions, {convertible} of which can be converted."
+SCAN_INDEX_WRITTEN = "Index is written to {index_path}"
+DAEMON_STARTED = (
+    "Converter daemon is listening on port {port} with {workers} worker processes. "
+    "Press Ctrl+C to stop."
+)
+DAEMON_ALREADY_RUNNING = "The converter daemon is already running."
+DAEMON_STOP_REQUESTED = "The converter daemon stops once its running conversions complete."
+DAEMON_STOPPED = "Converter daemon is stopped."
+INVALID_DAEMON_RESPONSE = "The converter daemon sent an invalid response."
+DAEMON_VERSION_MISMATCH = (
+    "The converter daemon runs version {daemon_version}, but the client is version {version}. "
+    "Please restart the daemon."
+)
+PROFILE_SUMMARY = "Profile of the conversion:"
+PROFILE_STAGE = "  {name:<20} {wall_time:>10.1f} ms wall {cpu_time:>10.1f} ms CPU {peak_memory}"
+PROFILE_PEAK_MEMORY = "{peak_memory:>8.1f} MB peak memory"
+PROFILE_TOTAL = "total"
+PROFILE_WRITTEN = "Profile is written to {profile_file_path}"
 
 MEASUREMENT_FILE_PATH_OPTION = "--measurement-file-path"
-
-INVALID_FILE_DIR = "Invalid measurement file path. Please provide valid measurement file path."
-FUNCTION_NOT_FOUND = "Measurement function {function} not found in the file {measurement_file_path}"
-
-
-def _validate_measurement_file(file_path: Path):
-    if not file_path.exists() or not file_path.is_file():
-        raise click.BadParameter(INVALID_FILE_DIR)
-
-
-def _validate_function(function_name: str, measurement_file_path: Path):
-    with measurement_file_path.open("r", encoding=ENCODING) as file:
-        code = file.read()
-    code_tree = ast.parse(code)
-
-    if not any(
-        isinstance(node, ast.FunctionDef) and node.name == function_name
-        for node in ast.walk(code_tree)
-    ):
-        raise click.BadParameter(
-            FUNCTION_NOT_FOUND.format(
-                function=function_name, measurement_file_path=measurement_file_path
-            )
-        )
-
-
-def _validate_output_directory(output_dir: Path):
-    try:
-        output_dir.mkdir(parents=True, exist_ok=True)
-    except PermissionError:
-        raise click.BadParameter(
-            "Permission denied: Unable to create or access the output directory."
-        )
-    except OSError as e:
-        raise click.BadParameter(f"An error occurred: {e}")
+FORMATTING_OPTION_HELP = (
+    "Formatting of the migrated measurement file using black: 'full' formats the whole file, "
+    "'function-only' formats only the measurement function and 'none' skips formatting."
+)
+ARCHIVE_OPTION_HELP = (
+    "Path of a .zip, .tar.gz or .tgz archive to write the measurement plug-in files and a "
+    "manifest.json to, instead of an output directory. The log file is created next to the archive."
+)
+BATCH_LOGGER = "batch_logger"
+SCAN_LOGGER = "scan_logger"
+DAEMON_LOGGER = "daemon_logger"
 
 
 @click.command(context_settings=CONTEXT_SETTINGS)
@@ -117,116 +118,155 @@ def _validate_output_directory(output_dir: Path):
 @click.option(
     "-f",
     "--function",
-    help="Name of the function in the measurement file that contains the logic for the measurement.",
-    required=True,
+    multiple=True,
+    help="Name of the function in the measurement file that contains the logic for the "
+    "measurement. Repeat the option to convert several functions.",
+)
+@click.option(
+    "--all-functions",
+    is_flag=True,
+    help="Convert all top-level functions in the measurement file that use instrument sessions.",
 )
 @click.option(
     "-o",
     "--directory-out",
-    help="Output directory for measurement plug-in files.",
-    required=True,
+    help="Output directory for measurement plug-in files. When several functions are converted, "
+    "the files of each function are created in a subdirectory named after the function.",
+)
+@click.option(
+    "--archive",
+    help=ARCHIVE_OPTION_HELP,
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes used to convert several functions.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Convert the measurement even if it is unchanged since a previous conversion.",
+)
+@click.option(
+    "--formatting",
+    type=click.Choice([policy.value for policy in FormattingPolicy]),
+    default=FormattingPolicy.FUNCTION_ONLY.value,
+    show_default=True,
+    help=FORMATTING_OPTION_HELP,
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the wall time, CPU time and peak memory of each stage of the conversion and "
+    "write the profile to profile.json next to the log file. Tracing memory slows down the "
+    "conversion.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="After the conversion, watch the measurement file and the local modules it imports and "
+    "convert the measurement again when they change. Files whose inputs are unchanged are not "
+    "created again. Press Ctrl+C to stop.",
 )
 def convert_to_plugin(
     display_name: str,
     measurement_file_path: str,
-    function: str,
-    directory_out: str,
+    function: Tuple[str, ...],
+    all_functions: bool,
+    directory_out: Optional[str],
+    archive: Optional[str],
+    workers: Optional[int],
+    no_cache: bool,
+    formatting: str,
+    profile: bool,
+    watch: bool,
 ) -> None:
     """Convert Python measurements to Python Measurement plug-ins."""
+    # Imported after the arguments are parsed, as importing mako is expensive.
+    from mako.exceptions import CompileException, TemplateLookupException
+
+    profiler = None
+    if profile:
+        from ni_measurement_plugin_converter._utils import ConversionStage, Profiler
+
+        profiler = Profiler(trace_memory=True)
+
     try:
         log_directory = None
         logger = initialize_logger(name="console_logger", log_directory=log_directory)
         logger.info(STARTING_EXECUTION)
 
-        directory_out_path = Path(directory_out)
+        functions = list(dict.fromkeys(function))
+        validation = (
+            profiler.profile_stage(ConversionStage.VALIDATION) if profiler else nullcontext()
+        )
 
-        _validate_measurement_file(Path(measurement_file_path))
-        _validate_function(function, Path(measurement_file_path))
-        _validate_output_directory(directory_out_path)
+        with validation:
+            if functions and all_functions:
+                raise click.UsageError(FUNCTION_OPTIONS_EXCLUSIVE)
+            if not functions and not all_functions:
+                raise click.UsageError(FUNCTION_OPTION_REQUIRED)
+            if bool(directory_out) == bool(archive):
+                raise click.UsageError(OUTPUT_OPTION_REQUIRED)
+            if watch and archive:
+                raise click.UsageError(WATCH_ARCHIVE_EXCLUSIVE)
+
+            validate_measurement_file(Path(measurement_file_path))
+            analysis_context = AnalysisContext.from_file(Path(measurement_file_path))
+            functions = _get_functions(analysis_context, functions, all_functions)
+
+            if archive:
+                validate_archive_path(Path(archive))
+            else:
+                validate_output_directory(Path(directory_out or ""))
 
         remove_handlers(logger)
 
-        log_directory = directory_out
+        log_directory = directory_out or str(Path(archive or "").parent)
         logger = initialize_logger(name=DEBUG_LOGGER, log_directory=log_directory)
         logger.debug(VERSION.format(version=__version__))
 
         logger.info(VALIDATE_CLI_ARGS)
 
-        migrated_file_path = directory_out_path / MIGRATED_MEASUREMENT_FILENAME
-        shutil.copy(Path(measurement_file_path), migrated_file_path)
-        logger.debug(FILE_MIGRATED)
-
-        logger.debug(GET_FUNCTION)
-        function_node = get_function_node(
-            file_dir=str(Path(measurement_file_path)), function=function
-        )
-
-        plugin_metadata: Dict[str, Any] = {}
-
-        sanitized_display_name = re.sub(ALPHANUMERIC_PATTERN, "_", display_name)
-        plugin_metadata["display_name"] = sanitized_display_name
-
-        logger.info(EXTRACT_INPUT_INFO)
-        inputs_info = extract_inputs(function_node, plugin_metadata)
-
-        logger.info(EXTRACT_OUTPUT_INFO)
-        outputs_info = extract_outputs(function_node, plugin_metadata)
-
-        pins_info, relays_info = process_sessions_and_update_metadata(
-            migrated_file_path, function, plugin_metadata, logger
-        )
-
-        plugin_metadata["version"] = MEASUREMENT_VERSION
-        plugin_metadata["serviceconfig_file"] = (
-            f"{sanitized_display_name}{SERVICE_CONFIG_FILE_EXTENSION}"
-        )
-        plugin_metadata["migrated_file"] = migrated_file_path.stem
-        plugin_metadata["function_name"] = function
-        plugin_metadata["directory_out"] = str(directory_out_path)
-
-        create_file(
-            MEASUREMENT_TEMPLATE,
-            directory_out_path / MEASUREMENT_FILENAME,
-            **plugin_metadata,
-        )
-        logger.debug(MEASUREMENT_FILE_CREATED)
-
-        create_measui_file(
-            pins=pins_info,
-            relays=relays_info,
-            inputs=inputs_info,
-            outputs=outputs_info,
-            file_path=directory_out_path,
-            measurement_name=sanitized_display_name,
-            service_class=f"{sanitized_display_name}_Python",
-        )
-        logger.debug(MEASUI_FILE_CREATED)
-
-        create_file(
-            SERVICE_CONFIG_TEMPLATE,
-            directory_out_path / f"{sanitized_display_name}{SERVICE_CONFIG_FILE_EXTENSION}",
-            display_name=sanitized_display_name,
-            service_class=f"{sanitized_display_name}_Python",
-            version=MEASUREMENT_VERSION,
-            directory_out=str(directory_out_path),
-        )
-        logger.debug(SERVICE_CONFIG_CREATED)
-
-        create_file(
-            BATCH_TEMPLATE,
-            directory_out_path / BATCH_FILENAME,
-            directory_out=str(directory_out_path),
+        if archive:
+            _convert_to_archive(
+                analysis_context,
+                functions,
+                display_name=display_name,
+                single_function=len(functions) == 1 and not all_functions,
+                archive_path=Path(archive),
+                logger=logger,
+                workers=workers,
+                formatting=FormattingPolicy(formatting),
+                profiler=profiler,
+            )
+            return
+
+        convert = functools.partial(
+            _convert_functions,
+            display_name=display_name,
+            single_function=len(functions) == 1 and not all_functions,
+            directory_out=Path(directory_out or ""),
+            logger=logger,
+            workers=workers,
+            use_cache=not no_cache,
+            formatting=FormattingPolicy(formatting),
+            profiler=profiler,
+            rendered_files={} if watch else None,
         )
-        logger.debug(BATCH_FILE_CREATED)
+        convert(analysis_context, functions)
 
-        create_file(
-            HELPER_TEMPLATE,
-            directory_out_path / HELPER_FILENAME,
-            directory_out=str(directory_out_path),
-        )
-        logger.debug(HELPER_FILE_CREATED)
+        if watch:
+            from ni_measurement_plugin_converter._utils import watch_measurement
 
-        logger.info(MEASUREMENT_PLUGIN_CREATED.format(plugin_dir=str(directory_out_path.resolve())))
+            watch_measurement(
+                analysis_context,
+                lambda context: convert(
+                    context, _get_functions(context, list(dict.fromkeys(function)), all_functions)
+                ),
+                logger,
+            )
 
     except PermissionError as error:
         logger.debug(error)
@@ -252,4 +292,589 @@ def convert_to_plugin(
         print_log_file_location()
 
     finally:
+        if profiler:
+            _report_profile(profiler, log_directory, logger)
+
         logger.info(PROCESS_COMPLETED)
+
+
+def _get_functions(
+    analysis_context: AnalysisContext, functions: List[str], all_functions: bool
+) -> List[str]:
+    if all_functions:
+        from ni_measurement_plugin_converter._utils import get_measurement_functions
+
+        functions = get_measurement_functions(analysis_context)
+        if not functions:
+            raise ValueError(
+                NO_MEASUREMENT_FUNCTIONS.format(measurement_file_path=analysis_context.file_path)
+            )
+
+    for function_name in functions:
+        validate_function(function_name, analysis_context)
+
+    return functions
+
+
+def _convert_functions(
+    analysis_context: AnalysisContext,
+    functions: List[str],
+    display_name: str,
+    single_function: bool,
+    directory_out: Path,
+    logger: logging.Logger,
+    workers: Optional[int],
+    use_cache: bool,
+    formatting: FormattingPolicy,
+    profiler: Optional["Profiler"],
+    rendered_files: Optional[Dict[Path, str]],
+) -> None:
+    if single_function:
+        from ni_measurement_plugin_converter._utils import convert_measurement
+
+        convert_measurement(
+            display_name=display_name,
+            function=functions[0],
+            directory_out=directory_out,
+            analysis_context=analysis_context,
+            logger=logger,
+            use_cache=use_cache,
+            formatting=formatting,
+            profiler=profiler,
+            rendered_files=rendered_files,
+        )
+        return
+
+    from ni_measurement_plugin_converter._utils import convert_functions
+
+    logger.info(STARTING_FUNCTIONS.format(count=len(functions), functions=functions))
+    results = convert_functions(
+        display_name=display_name,
+        functions=functions,
+        directory_out=directory_out,
+        analysis_context=analysis_context,
+        logger=logger,
+        workers=workers,
+        on_result=functools.partial(_log_batch_result, logger=logger),
+        use_cache=use_cache,
+        formatting=formatting,
+        profiler=profiler,
+        rendered_files=rendered_files,
+    )
+    succeeded = sum(result.succeeded for result in results)
+    logger.info(BATCH_SUMMARY.format(succeeded=succeeded, total=len(results)))
+
+    if succeeded < len(results):
+        print_log_file_location()
+
+
+def _convert_to_archive(
+    analysis_context: AnalysisContext,
+    functions: List[str],
+    display_name: str,
+    single_function: bool,
+    archive_path: Path,
+    logger: logging.Logger,
+    workers: Optional[int],
+    formatting: FormattingPolicy,
+    profiler: Optional["Profiler"],
+) -> None:
+    from ni_measurement_plugin_converter._utils import (
+        PluginArchive,
+        convert_functions,
+        generate_measurement_plugin,
+    )
+
+    results = []
+
+    with PluginArchive(archive_path) as plugin_archive:
+        if single_function:
+            conversion_result = generate_measurement_plugin(
+                display_name=display_name,
+                function=functions[0],
+                analysis_context=analysis_context,
+                logger=logger,
+                formatting=formatting,
+                profiler=profiler,
+            )
+            plugin_archive.add_plugin(
+                conversion_result, measurement_file_path=str(analysis_context.file_path)
+            )
+
+        else:
+            logger.info(STARTING_FUNCTIONS.format(count=len(functions), functions=functions))
+            results = convert_functions(
+                display_name=display_name,
+                functions=functions,
+                directory_out=Path(),
+                analysis_context=analysis_context,
+                logger=logger,
+                workers=workers,
+                on_result=functools.partial(
+                    _log_batch_result, logger=logger, archive_path=archive_path
+                ),
+                formatting=formatting,
+                profiler=profiler,
+                archive=plugin_archive,
+            )
+
+    logger.info(ARCHIVE_CREATED.format(archive_path=archive_path.resolve()))
+
+    if results:
+        succeeded = sum(result.succeeded for result in results)
+        logger.info(BATCH_SUMMARY.format(succeeded=succeeded, total=len(results)))
+
+        if succeeded < len(results):
+            print_log_file_location()
+
+
+def _report_profile(
+    profiler: "Profiler", log_directory: Optional[str], logger: logging.Logger
+) -> None:
+    from ni_measurement_plugin_converter._utils import write_profile
+
+    profile = profiler.get_profile()
+    profiler.stop()
+    logger.info(PROFILE_SUMMARY)
+
+    stages = [(stage.name, stage) for stage in profile.stages] + [(PROFILE_TOTAL, profile)]
+    for name, stage in stages:
+        peak_memory = ""
+        if stage.peak_memory is not None:
+            peak_memory = PROFILE_PEAK_MEMORY.format(peak_memory=stage.peak_memory / 1024**2)
+
+        logger.info(
+            PROFILE_STAGE.format(
+                name=name,
+                wall_time=stage.wall_time * 1000,
+                cpu_time=stage.cpu_time * 1000,
+                peak_memory=peak_memory,
+            )
+        )
+
+    if log_directory:
+        profile_file_path = write_profile(profile, Path(log_directory))
+        logger.info(PROFILE_WRITTEN.format(profile_file_path=profile_file_path.resolve()))
+
+
+def _log_batch_result(
+    result: "BatchResult", logger: logging.Logger, archive_path: Optional[Path] = None
+) -> None:
+    if result.succeeded and archive_path:
+        logger.info(
+            BATCH_ENTRY_ARCHIVED.format(
+                display_name=result.entry.display_name,
+                archive_path=archive_path.resolve(),
+                directory=Path(result.entry.directory_out).name,
+            )
+        )
+        return
+
+    if result.succeeded:
+        logger.info(
+            BATCH_ENTRY_CONVERTED.format(
+                display_name=result.entry.display_name,
+                plugin_dir=Path(result.entry.directory_out).resolve(),
+            )
+        )
+        return
+
+    logger.error(
+        BATCH_ENTRY_FAILED.format(display_name=result.entry.display_name, error=result.error)
+    )
+    if result.log_file_path:
+        logger.info(LOG_FILE.format(log_file_path=result.log_file_path))
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "-i",
+    "--manifest",
+    help="Path of the CSV, JSON or TOML manifest listing the display name, measurement file "
+    "path, function and output directory of each measurement to be converted.",
+    required=True,
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes. Defaults to the number of processors.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Convert the measurements even if they are unchanged since a previous conversion.",
+)
+@click.option(
+    "--formatting",
+    type=click.Choice([policy.value for policy in FormattingPolicy]),
+    default=FormattingPolicy.FUNCTION_ONLY.value,
+    show_default=True,
+    help=FORMATTING_OPTION_HELP,
+)
+@click.option(
+    "--archive",
+    help="Path of a .zip, .tar.gz or .tgz archive to write the measurement plug-ins and a "
+    "manifest.json to, instead of their output directories. Each measurement plug-in is "
+    "archived in the path of its output directory relative to the common parent of the output "
+    "directories.",
+)
+@click.pass_context
+def convert_batch(
+    ctx: click.Context,
+    manifest: str,
+    workers: Optional[int],
+    no_cache: bool,
+    formatting: str,
+    archive: Optional[str],
+) -> None:
+    """Convert a batch of Python measurements to Python Measurement plug-ins in parallel."""
+    logger = initialize_logger(name=BATCH_LOGGER, log_directory=None)
+    results = []
+
+    try:
+        logger.info(STARTING_EXECUTION)
+
+        from ni_measurement_plugin_converter._utils import (
+            PluginArchive,
+            load_manifest,
+            run_batch,
+        )
+
+        archive_path = Path(archive) if archive else None
+        if archive_path:
+            validate_archive_path(archive_path)
+
+        entries = load_manifest(Path(manifest))
+        logger.info(STARTING_BATCH.format(count=len(entries)))
+
+        with PluginArchive(archive_path) if archive_path else nullcontext() as plugin_archive:
+            results = run_batch(
+                entries,
+                workers,
+                on_result=functools.partial(
+                    _log_batch_result, logger=logger, archive_path=archive_path
+                ),
+                use_cache=not no_cache,
+                formatting=FormattingPolicy(formatting),
+                archive=plugin_archive,
+            )
+
+        if archive_path:
+            logger.info(ARCHIVE_CREATED.format(archive_path=archive_path.resolve()))
+
+        succeeded = sum(result.succeeded for result in results)
+        logger.info(BATCH_SUMMARY.format(succeeded=succeeded, total=len(results)))
+
+    except (FileNotFoundError, OSError, ValueError, ClickException) as error:
+        logger.error(error)
+
+    except Exception as error:
+        logger.debug(error, exc_info=True)
+        logger.error(ERROR_OCCURRED)
+
+    finally:
+        logger.info(PROCESS_COMPLETED)
+        remove_handlers(logger)
+
+    if not results or not all(result.succeeded for result in results):
+        ctx.exit(1)
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "-p",
+    "--path",
+    "directory",
+    help="Path of the directory to scan for measurement functions.",
+    required=True,
+)
+@click.option(
+    "-i",
+    "--index",
+    help=f"Path of the index of the scanned files. Defaults to {SCAN_INDEX_FILE_NAME} in the "
+    "scanned directory.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes that parse new and changed files. Defaults to the number "
+    "of processors.",
+)
+@click.option(
+    "-x",
+    "--exclude",
+    multiple=True,
+    help="Name pattern of directories to skip, e.g. 'build*'. Repeat the option to skip several "
+    "patterns. Hidden, __pycache__, node_modules and site-packages directories are always "
+    "skipped.",
+)
+@click.option(
+    "--rescan",
+    is_flag=True,
+    help="Parse all files even if they are unchanged since the previous scan.",
+)
+@click.pass_context
+def scan_measurements(
+    ctx: click.Context,
+    directory: str,
+    index: Optional[str],
+    workers: Optional[int],
+    exclude: Tuple[str, ...],
+    rescan: bool,
+) -> None:
+    """Find the measurement functions in a directory tree and index them for conversion."""
+    logger = initialize_logger(name=SCAN_LOGGER, log_directory=None)
+    succeeded = False
+
+    try:
+        logger.info(STARTING_EXECUTION)
+
+        from ni_measurement_plugin_converter._utils import (
+            load_scan_index,
+            scan_directory,
+            write_scan_index,
+        )
+
+        root = Path(directory)
+        validate_scan_directory(root)
+        index_path = Path(index) if index else root / SCAN_INDEX_FILE_NAME
+
+        logger.info(STARTING_SCAN.format(directory=root.resolve()))
+        start_time = time.perf_counter()
+
+        previous_index = None if rescan else load_scan_index(index_path)
+        scan_index, parsed_files = scan_directory(root, previous_index, workers, exclude)
+        write_scan_index(scan_index, index_path)
+
+        logger.info(
+            SCAN_SUMMARY.format(
+                files=len(scan_index.files),
+                seconds=time.perf_counter() - start_time,
+                parsed=parsed_files,
+            )
+        )
+        parse_errors = sum(scanned_file.error is not None for scanned_file in scan_index.files)
+        if parse_errors:
+            logger.warning(SCAN_PARSE_ERRORS.format(count=parse_errors))
+
+        functions = [
+            (scanned_file.path, function)
+            for scanned_file in scan_index.files
+            for function in scanned_file.functions
+        ]
+        for path, function in functions:
+            message = SCANNED_FUNCTION if function.convertible else SCANNED_FUNCTION_NOT_CONVERTIBLE
+            logger.info(
+                message.format(
+                    path=path,
+                    line=function.line,
+                    function=function.name,
+                    drivers=function.drivers,
+                    reason=function.reason,
+                )
+            )
+
+        logger.info(
+            SCANNED_FUNCTIONS.format(
+                count=len(functions),
+                convertible=sum(function.convertible for _, function in functions),
+            )
+        )
+        logger.info(SCAN_INDEX_WRITTEN.format(index_path=index_path.resolve()))
+        succeeded = True
+
+    except (OSError, ValueError, ClickException) as error:
+        logger.error(error)
+
+    except Exception as error:
+        logger.debug(error, exc_info=True)
+        logger.error(ERROR_OCCURRED)
+
+    finally:
+        logger.info(PROCESS_COMPLETED)
+        remove_handlers(logger)
+
+    if not succeeded:
+        ctx.exit(1)
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0, max=65535),
+    default=0,
+    show_default=True,
+    help="Loopback TCP port to listen on. 0 selects a free port.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes. Defaults to the number of processors.",
+)
+@click.option(
+    "--stop",
+    is_flag=True,
+    help="Stop the running converter daemon once its running conversions complete.",
+)
+@click.pass_context
+def serve_converter(ctx: click.Context, port: int, workers: Optional[int], stop: bool) -> None:
+    """Keep the converter running to convert the measurements sent by its client."""
+    logger = initialize_logger(name=DAEMON_LOGGER, log_directory=None)
+    succeeded = True
+
+    try:
+        from ni_measurement_plugin_converter._utils import is_daemon_running, stop_daemon
+
+        if stop:
+            stop_daemon()
+            logger.info(DAEMON_STOP_REQUESTED)
+            return
+
+        if is_daemon_running():
+            raise ClickException(DAEMON_ALREADY_RUNNING)
+
+        logger.info(STARTING_EXECUTION)
+
+        from ni_measurement_plugin_converter._utils import ConversionDaemon
+
+        daemon = ConversionDaemon(logger, port, workers)
+        logger.info(DAEMON_STARTED.format(port=daemon.port, workers=daemon.workers))
+
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+        logger.info(DAEMON_STOPPED)
+
+    except (ConnectionError, OSError, ClickException) as error:
+        logger.error(error)
+        succeeded = False
+
+    except Exception as error:
+        logger.debug(error, exc_info=True)
+        logger.error(ERROR_OCCURRED)
+        succeeded = False
+
+    finally:
+        remove_handlers(logger)
+
+    if not succeeded:
+        ctx.exit(1)
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "-d",
+    "--display-name",
+    help="Display name for the plug-in that will be converted.",
+    required=True,
+)
+@click.option(
+    "-m",
+    MEASUREMENT_FILE_PATH_OPTION,
+    help="Path of the Python measurement file to be converted.",
+    required=True,
+)
+@click.option(
+    "-f",
+    "--function",
+    help="Name of the function in the measurement file that contains the logic for the "
+    "measurement.",
+    required=True,
+)
+@click.option(
+    "-o",
+    "--directory-out",
+    help="Output directory for measurement plug-in files.",
+    required=True,
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Convert the measurement even if it is unchanged since a previous conversion.",
+)
+@click.option(
+    "--formatting",
+    type=click.Choice([policy.value for policy in FormattingPolicy]),
+    default=FormattingPolicy.FUNCTION_ONLY.value,
+    show_default=True,
+    help=FORMATTING_OPTION_HELP,
+)
+@click.pass_context
+def convert_with_daemon(
+    ctx: click.Context,
+    display_name: str,
+    measurement_file_path: str,
+    function: str,
+    directory_out: str,
+    no_cache: bool,
+    formatting: str,
+) -> None:
+    """Convert a Python measurement to a Python Measurement plug-in using the converter daemon."""
+    logger = initialize_logger(name=DAEMON_LOGGER, log_directory=None)
+    succeeded = False
+
+    try:
+        from ni_measurement_plugin_converter._utils import ping_daemon, request_conversion
+
+        # A daemon of another version may convert the measurement differently, so the
+        # measurement is only sent to a daemon of the same version.
+        response = ping_daemon()
+        if response.get("converter_version") != __version__:
+            raise ClickException(
+                DAEMON_VERSION_MISMATCH.format(
+                    daemon_version=response.get("converter_version"), version=__version__
+                )
+            )
+
+        if response.get("error"):
+            raise ClickException(response["error"])
+
+        response = request_conversion(
+            display_name=display_name,
+            measurement_file_path=Path(measurement_file_path),
+            function=function,
+            directory_out=Path(directory_out),
+            use_cache=not no_cache,
+            formatting=formatting,
+        )
+
+        if response.get("error"):
+            raise ClickException(response["error"])
+
+        try:
+            result = response["result"]
+
+            if result["succeeded"]:
+                logger.info(
+                    BATCH_ENTRY_CONVERTED.format(
+                        display_name=display_name, plugin_dir=result["entry"]["directory_out"]
+                    )
+                )
+                succeeded = True
+            else:
+                logger.error(
+                    BATCH_ENTRY_FAILED.format(display_name=display_name, error=result["error"])
+                )
+                if result.get("log_file_path"):
+                    logger.info(LOG_FILE.format(log_file_path=result["log_file_path"]))
+
+        except (KeyError, TypeError, AttributeError) as error:
+            raise ClickException(INVALID_DAEMON_RESPONSE) from error
+
+    except (ConnectionError, OSError, ClickException) as error:
+        logger.error(error)
+
+    except Exception as error:
+        logger.debug(error, exc_info=True)
+        logger.error(ERROR_OCCURRED)
+
+    finally:
+        remove_handlers(logger)
+
+    if not succeeded:
+        ctx.exit(1)
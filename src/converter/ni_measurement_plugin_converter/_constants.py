@@ -3,6 +3,9 @@
 DEBUG_LOGGER = "debug_logger"
 ENCODING = "utf-8"
 ALPHANUMERIC_PATTERN = r"[^a-zA-Z0-9]"
+ZIP_EXTENSION = ".zip"
+TAR_GZ_EXTENSIONS = [".tar.gz", ".tgz"]
+SCAN_INDEX_FILE_NAME = ".ni_measurement_plugin_index.json"
 RESERVATION = "reservation"
 NI_DRIVERS = [
     "nidcpower",
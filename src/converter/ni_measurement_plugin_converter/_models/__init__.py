@@ -1,9 +1,27 @@
 """"Models used across the package."""
 
+from ni_measurement_plugin_converter._models._archive import (
+    ArchivedFile,
+    ArchivedPlugin,
+    ArchiveManifest,
+)
+from ni_measurement_plugin_converter._models._batch import BatchEntry, BatchResult
+from ni_measurement_plugin_converter._models._conversion import ConversionResult
+from ni_measurement_plugin_converter._models._daemon import (
+    DaemonInfo,
+    DaemonRequest,
+    DaemonResponse,
+)
 from ni_measurement_plugin_converter._models._inputs_outputs import (
     InputInfo,
     OutputInfo,
     PinInfo,
     RelayInfo,
 )
+from ni_measurement_plugin_converter._models._profile import ConversionProfile, StageProfile
+from ni_measurement_plugin_converter._models._scan import (
+    ScanIndex,
+    ScannedFile,
+    ScannedFunction,
+)
 from ni_measurement_plugin_converter._models._sessions import SessionMapping
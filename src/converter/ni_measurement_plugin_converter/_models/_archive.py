@@ -0,0 +1,31 @@
+"""Models utilized in packaging of measurement plug-ins into archives."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ArchivedFile(BaseModel):
+    """File of a measurement plug-in in an archive."""
+
+    path: str
+    size: int
+    sha256: str
+
+
+class ArchivedPlugin(BaseModel):
+    """Measurement plug-in in an archive."""
+
+    display_name: str
+    function: str
+    measurement_file_path: Optional[str] = None
+    directory: str
+    files: List[ArchivedFile]
+    warnings: List[str] = []
+
+
+class ArchiveManifest(BaseModel):
+    """Manifest of the measurement plug-ins in an archive."""
+
+    converter_version: str
+    plugins: List[ArchivedPlugin] = []
@@ -0,0 +1,23 @@
+"""Models utilized in batch conversion."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BatchEntry(BaseModel):
+    """Measurement to be converted in a batch conversion."""
+
+    display_name: str
+    measurement_file_path: str
+    function: str
+    directory_out: str
+
+
+class BatchResult(BaseModel):
+    """Result of converting a batch entry."""
+
+    entry: BatchEntry
+    succeeded: bool
+    error: Optional[str] = None
+    log_file_path: Optional[str] = None
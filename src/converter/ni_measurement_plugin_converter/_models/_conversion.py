@@ -0,0 +1,27 @@
+"""Models utilized in in-memory conversion."""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from ni_measurement_plugin_converter._models._inputs_outputs import (
+    InputInfo,
+    OutputInfo,
+    PinInfo,
+    RelayInfo,
+)
+from ni_measurement_plugin_converter._models._profile import ConversionProfile
+
+
+class ConversionResult(BaseModel):
+    """Measurement plug-in generated in memory by a conversion."""
+
+    display_name: str
+    function: str
+    files: Dict[str, bytes]
+    inputs: List[InputInfo]
+    outputs: List[OutputInfo]
+    pins: List[PinInfo]
+    relays: List[RelayInfo]
+    warnings: List[str] = []
+    profile: Optional[ConversionProfile] = None
@@ -0,0 +1,34 @@
+"""Models utilized in the conversion daemon."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+from ni_measurement_plugin_converter._models._batch import BatchEntry, BatchResult
+
+
+class DaemonInfo(BaseModel):
+    """Connection information of a running conversion daemon."""
+
+    port: int
+    token: str
+    pid: int
+    converter_version: str
+
+
+class DaemonRequest(BaseModel):
+    """Request sent to the conversion daemon."""
+
+    token: str
+    command: str
+    entry: Optional[BatchEntry] = None
+    use_cache: bool = True
+    formatting: str = "function-only"
+
+
+class DaemonResponse(BaseModel):
+    """Response of the conversion daemon."""
+
+    converter_version: str
+    error: Optional[str] = None
+    result: Optional[BatchResult] = None
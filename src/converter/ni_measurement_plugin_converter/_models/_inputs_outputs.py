@@ -1,6 +1,6 @@
 """Models utilized in inputs and outputs extraction."""
 
-from typing import List, Union
+from typing import List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -12,6 +12,8 @@ class InputInfo(BaseModel):
     param_type: str
     nims_type: str
     default_value: Union[int, float, str, bool, List[int], List[float], List[str], List[bool]]
+    # Data type of the elements of the NumPy array that the measurement function expects.
+    array_dtype: Optional[str] = None
 
 
 class OutputInfo(BaseModel):
@@ -0,0 +1,23 @@
+"""Models utilized in profiling of conversions."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class StageProfile(BaseModel):
+    """Profile of a stage of a conversion."""
+
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: Optional[int] = None
+
+
+class ConversionProfile(BaseModel):
+    """Profile of the stages of a conversion."""
+
+    stages: List[StageProfile]
+    wall_time: float
+    cpu_time: float
+    peak_memory: Optional[int] = None
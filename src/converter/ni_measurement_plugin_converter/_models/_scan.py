@@ -0,0 +1,35 @@
+"""Models utilized in scanning directories for measurement functions."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ScannedFunction(BaseModel):
+    """Function that opens sessions of supported instrument drivers."""
+
+    name: str
+    line: int
+    drivers: List[str]
+    convertible: bool
+    reason: Optional[str] = None
+
+
+class ScannedFile(BaseModel):
+    """Python file in a scanned directory."""
+
+    path: str
+    sha256: str
+    size: int
+    mtime_ns: int
+    functions: List[ScannedFunction] = []
+    error: Optional[str] = None
+
+
+class ScanIndex(BaseModel):
+    """Index of the measurement functions in a directory."""
+
+    index_version: int
+    converter_version: str
+    root: str
+    files: List[ScannedFile] = []
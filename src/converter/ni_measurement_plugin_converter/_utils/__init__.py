@@ -1,27 +1,157 @@
-"""Measurement Plug-In Converter helper functions."""
-
-from ni_measurement_plugin_converter._utils._create_measui_file import create_measui_file
-from ni_measurement_plugin_converter._utils._extract_inputs import (
-    extract_inputs,
-)
-from ni_measurement_plugin_converter._utils._extract_outputs import extract_outputs
-from ni_measurement_plugin_converter._utils._get_function_tree import get_function_node
-from ni_measurement_plugin_converter._utils._logger import (
-    initialize_logger,
-    print_log_file_location,
-    remove_handlers,
-)
-from ni_measurement_plugin_converter._utils._manage_session import (
-    process_sessions_and_update_metadata,
-)
-from ni_measurement_plugin_converter._utils._manage_session_helper import (
-    check_for_visa,
-    get_pin_and_relay_names_signature,
-    get_plugin_session_initializations,
-    get_sessions_signature,
-)
-from ni_measurement_plugin_converter._utils._measurement_service import (
-    extract_type,
-    get_nims_datatype,
-)
-from ni_measurement_plugin_converter._utils._write_data import create_file
+"""Measurement Plug-In Converter helper functions.
+
+The helper functions are imported on first access, so that the command line interface does
+not import black, astor, mako, pydantic and the measurement plug-in SDK before the stage that
+needs them.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from ni_measurement_plugin_converter._utils._analysis_context import AnalysisContext
+    from ni_measurement_plugin_converter._utils._archive import PluginArchive
+    from ni_measurement_plugin_converter._utils._batch import (
+        convert_batch_entry,
+        convert_functions,
+        generate_batch_entry,
+        load_manifest,
+        run_batch,
+    )
+    from ni_measurement_plugin_converter._utils._convert import (
+        convert_measurement,
+        generate_measurement_plugin,
+    )
+    from ni_measurement_plugin_converter._utils._create_measui_file import (
+        create_measui_file,
+        render_measui_file,
+    )
+    from ni_measurement_plugin_converter._utils._daemon import ConversionDaemon
+    from ni_measurement_plugin_converter._utils._daemon_client import (
+        is_daemon_running,
+        ping_daemon,
+        request_conversion,
+        stop_daemon,
+    )
+    from ni_measurement_plugin_converter._utils._extract_inputs import (
+        extract_inputs,
+    )
+    from ni_measurement_plugin_converter._utils._extract_outputs import extract_outputs
+    from ni_measurement_plugin_converter._utils._format_code import (
+        FormattingPolicy,
+        format_code,
+        format_migrated_code,
+    )
+    from ni_measurement_plugin_converter._utils._function_analysis import (
+        FunctionAnalysis,
+        analyze_function,
+    )
+    from ni_measurement_plugin_converter._utils._logger import (
+        collect_warnings,
+        initialize_logger,
+        log_job_to_directory,
+        print_log_file_location,
+        remove_handlers,
+    )
+    from ni_measurement_plugin_converter._utils._manage_session import (
+        get_measurement_functions,
+        process_sessions_and_update_metadata,
+    )
+    from ni_measurement_plugin_converter._utils._manage_session_helper import (
+        check_for_visa,
+        get_pin_and_relay_names_signature,
+        get_plugin_session_initializations,
+        get_sessions_signature,
+    )
+    from ni_measurement_plugin_converter._utils._measurement_service import get_nims_datatype
+    from ni_measurement_plugin_converter._utils._profiler import (
+        ConversionStage,
+        Profiler,
+        write_profile,
+    )
+    from ni_measurement_plugin_converter._utils._scan import (
+        load_scan_index,
+        scan_directory,
+        write_scan_index,
+    )
+    from ni_measurement_plugin_converter._utils._type_resolution import TypeResolver
+    from ni_measurement_plugin_converter._utils._validate import (
+        validate_archive_path,
+        validate_function,
+        validate_measurement_file,
+        validate_output_directory,
+        validate_scan_directory,
+    )
+    from ni_measurement_plugin_converter._utils._watch import (
+        get_watched_files,
+        watch_measurement,
+    )
+    from ni_measurement_plugin_converter._utils._write_data import create_file, render_file
+
+_MODULES: Dict[str, List[str]] = {
+    "_analysis_context": ["AnalysisContext"],
+    "_archive": ["PluginArchive"],
+    "_batch": [
+        "convert_batch_entry",
+        "convert_functions",
+        "generate_batch_entry",
+        "load_manifest",
+        "run_batch",
+    ],
+    "_convert": ["convert_measurement", "generate_measurement_plugin"],
+    "_create_measui_file": ["create_measui_file", "render_measui_file"],
+    "_daemon": ["ConversionDaemon"],
+    "_daemon_client": ["is_daemon_running", "ping_daemon", "request_conversion", "stop_daemon"],
+    "_extract_inputs": ["extract_inputs"],
+    "_extract_outputs": ["extract_outputs"],
+    "_format_code": ["FormattingPolicy", "format_code", "format_migrated_code"],
+    "_function_analysis": ["FunctionAnalysis", "analyze_function"],
+    "_logger": [
+        "collect_warnings",
+        "initialize_logger",
+        "log_job_to_directory",
+        "print_log_file_location",
+        "remove_handlers",
+    ],
+    "_manage_session": ["get_measurement_functions", "process_sessions_and_update_metadata"],
+    "_manage_session_helper": [
+        "check_for_visa",
+        "get_pin_and_relay_names_signature",
+        "get_plugin_session_initializations",
+        "get_sessions_signature",
+    ],
+    "_measurement_service": ["get_nims_datatype"],
+    "_profiler": ["ConversionStage", "Profiler", "write_profile"],
+    "_scan": ["load_scan_index", "scan_directory", "write_scan_index"],
+    "_type_resolution": ["TypeResolver"],
+    "_validate": [
+        "validate_archive_path",
+        "validate_function",
+        "validate_measurement_file",
+        "validate_output_directory",
+        "validate_scan_directory",
+    ],
+    "_watch": ["get_watched_files", "watch_measurement"],
+    "_write_data": ["create_file", "render_file"],
+}
+_ATTRIBUTE_MODULES = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = sorted(_ATTRIBUTE_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _ATTRIBUTE_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    # Cache the attribute so that later accesses do not go through this function.
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return __all__
@@ -0,0 +1,166 @@
+"""Implementation of the parsed measurement source shared across conversion stages."""
+
+import ast
+import copy
+import io
+import tokenize
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from ni_measurement_plugin_converter._constants import ENCODING
+from ni_measurement_plugin_converter._utils._type_resolution import TypeResolver
+
+FUNCTION_NODE_NOT_FOUND = "Function node could not be found for function: {function}"
+LINE_SEPARATOR = "\n"
+
+
+def _index_functions(tree: ast.Module) -> Dict[str, ast.FunctionDef]:
+    function_nodes: Dict[str, ast.FunctionDef] = {}
+
+    for node in ast.walk(tree):
+        # Keep the first match to preserve the lookup order of `ast.walk`.
+        if isinstance(node, ast.FunctionDef) and node.name not in function_nodes:
+            function_nodes[node.name] = node
+
+    return function_nodes
+
+
+def _get_string_continuation_lines(source_code: str) -> Set[int]:
+    continuation_lines: Set[int] = set()
+
+    for token in tokenize.generate_tokens(io.StringIO(source_code).readline):
+        if token.type == tokenize.STRING:
+            continuation_lines.update(range(token.start[0] + 1, token.end[0] + 1))
+
+    return continuation_lines
+
+
+def _indent(source_code: str, indentation: str) -> List[str]:
+    continuation_lines = _get_string_continuation_lines(source_code)
+
+    # Lines within multi-line strings are kept as they are, so that the strings do not change.
+    return [
+        indentation + line if line.strip() and line_number not in continuation_lines else line
+        for line_number, line in enumerate(source_code.split(LINE_SEPARATOR), start=1)
+    ]
+
+
+class AnalysisContext:
+    """Measurement source that is read and parsed only once per conversion.
+
+    The context holds the source code, its abstract syntax tree (AST) and an index of
+    function names to function nodes so that every stage of the conversion can look up
+    the measurement function without reading or parsing the file again.
+    """
+
+    def __init__(self, source_code: str, file_path: Optional[Path] = None) -> None:
+        """Initialize the analysis context.
+
+        Args:
+            source_code: Source code of the measurement.
+            file_path: Path of the measurement file, if the source is read from a file.
+        """
+        self.source_code = source_code
+        self.file_path = file_path
+        self.tree = ast.parse(source_code)
+        self.function_nodes = _index_functions(self.tree)
+        self._type_resolver: Optional[TypeResolver] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the context to be pickled, such as for a worker process.
+
+        Returns:
+            The state of the context, without its type resolver, which is created again when
+            first used.
+        """
+        state = self.__dict__.copy()
+        state["_type_resolver"] = None
+        return state
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> "AnalysisContext":
+        """Create the analysis context by reading the measurement file.
+
+        Args:
+            file_path: Path of the measurement file.
+
+        Returns:
+            The analysis context of the measurement file.
+        """
+        with Path(file_path).open("r", encoding=ENCODING) as file:
+            source_code = file.read()
+
+        return cls(source_code=source_code, file_path=Path(file_path))
+
+    def has_function(self, function: str) -> bool:
+        """Check whether the measurement source defines the function.
+
+        Args:
+            function: The name of the function.
+
+        Returns:
+            True if the function is defined, else False.
+        """
+        return function in self.function_nodes
+
+    def get_function_node(self, function: str) -> ast.FunctionDef:
+        """Retrieve the function node for a given function name.
+
+        Args:
+            function: The name of the function to find.
+
+        Returns:
+            The AST node representing the function.
+
+        Raises:
+            ValueError: If the specified function is not found in the source.
+        """
+        try:
+            return self.function_nodes[function]
+        except KeyError:
+            raise ValueError(FUNCTION_NODE_NOT_FOUND.format(function=function))
+
+    @property
+    def type_resolver(self) -> TypeResolver:
+        """Resolver of the type annotations of the measurement source, created when first used."""
+        if self._type_resolver is None:
+            self._type_resolver = TypeResolver(self.tree)
+
+        return self._type_resolver
+
+    def copy_function_node(self, function: str) -> ast.FunctionDef:
+        """Copy a function node so that it can be modified without changing the shared tree.
+
+        Args:
+            function: The name of the function to be modified.
+
+        Returns:
+            The copied function node, which keeps the source positions of the original.
+        """
+        return copy.deepcopy(self.get_function_node(function))
+
+    def splice_function(self, function: str, function_source_code: str) -> str:
+        """Replace the source code of a function, keeping the rest of the source unchanged.
+
+        The lines from the first decorator to the end of the function are replaced, so that
+        the comments and formatting of the rest of the source are kept.
+
+        Args:
+            function: The name of the function to be replaced.
+            function_source_code: New source code of the function, including its decorators,
+                without indentation.
+
+        Returns:
+            The source code with the function replaced.
+        """
+        function_node = self.get_function_node(function)
+        decorator_lines = [decorator.lineno for decorator in function_node.decorator_list]
+        start_line = min([function_node.lineno] + decorator_lines)
+        end_line = function_node.end_lineno or function_node.lineno
+
+        lines = self.source_code.split(LINE_SEPARATOR)
+        # Nested functions and methods are indented like the original function.
+        indentation = lines[function_node.lineno - 1][: function_node.col_offset]
+        function_lines = _indent(function_source_code.rstrip(LINE_SEPARATOR), indentation)
+
+        return LINE_SEPARATOR.join(lines[: start_line - 1] + function_lines + lines[end_line:])
@@ -0,0 +1,203 @@
+"""Implementation of packaging of measurement plug-ins into archives."""
+
+import hashlib
+import io
+import os
+import tarfile
+import threading
+import time
+import uuid
+import zipfile
+from pathlib import Path, PurePosixPath
+from types import TracebackType
+from typing import List, Optional, Type
+
+from ni_measurement_plugin_ui_creator.utils.file_writer import TEMP_FILE_NAME
+
+from ni_measurement_plugin_converter import __version__
+from ni_measurement_plugin_converter._constants import (
+    ENCODING,
+    TAR_GZ_EXTENSIONS,
+    ZIP_EXTENSION,
+)
+from ni_measurement_plugin_converter._models import (
+    ArchivedFile,
+    ArchivedPlugin,
+    ArchiveManifest,
+    ConversionResult,
+)
+
+MANIFEST_FILE_NAME = "manifest.json"
+ARCHIVED_FILE_MODE = 0o644
+
+UNSUPPORTED_ARCHIVE = "Unsupported archive format of {archive_path}. Supported formats: {formats}"
+DUPLICATE_DIRECTORY = "The archive already contains a measurement plug-in in '{directory}'."
+ARCHIVE_NOT_OPEN = "The archive {archive_path} is not open."
+
+
+def is_tar_gz_archive(archive_path: Path) -> bool:
+    """Check whether the archive is a gzip-compressed tar archive.
+
+    Args:
+        archive_path: Path of the archive.
+
+    Returns:
+        True if the archive is a tar.gz archive, False if it is a zip archive.
+
+    Raises:
+        ValueError: If the archive is neither a zip nor a tar.gz archive.
+    """
+    name = archive_path.name.lower()
+
+    if name.endswith(ZIP_EXTENSION):
+        return False
+    if any(name.endswith(extension) for extension in TAR_GZ_EXTENSIONS):
+        return True
+
+    raise ValueError(
+        UNSUPPORTED_ARCHIVE.format(
+            archive_path=archive_path, formats=[ZIP_EXTENSION] + TAR_GZ_EXTENSIONS
+        )
+    )
+
+
+class PluginArchive:
+    """Archive into which the files of measurement plug-ins are streamed.
+
+    The files are written to a temporary file next to the archive, which replaces the archive
+    when it is closed, so that a failed conversion does not leave a partial archive. A manifest
+    of the measurement plug-ins and their files is written last. Measurement plug-ins may be
+    added from several threads; the files of each measurement plug-in are written together.
+    """
+
+    def __init__(self, archive_path: Path) -> None:
+        """Initialize the archive.
+
+        Args:
+            archive_path: Path of the zip or tar.gz archive.
+
+        Raises:
+            ValueError: If the archive is neither a zip nor a tar.gz archive.
+        """
+        self.archive_path = Path(archive_path)
+        self.manifest = ArchiveManifest(converter_version=__version__)
+        self._is_tar_gz = is_tar_gz_archive(self.archive_path)
+        self._temp_file_path = self.archive_path.with_name(
+            TEMP_FILE_NAME.format(file_name=self.archive_path.name, suffix=uuid.uuid4().hex)
+        )
+        self._lock = threading.Lock()
+        self._zip_file: Optional[zipfile.ZipFile] = None
+        self._tar_file: Optional[tarfile.TarFile] = None
+
+    def __enter__(self) -> "PluginArchive":
+        """Open the archive for writing.
+
+        Returns:
+            The opened archive.
+        """
+        if self._is_tar_gz:
+            self._tar_file = tarfile.open(self._temp_file_path, "x:gz")
+        else:
+            self._zip_file = zipfile.ZipFile(
+                self._temp_file_path, "x", compression=zipfile.ZIP_DEFLATED
+            )
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Write the manifest and replace the archive, or discard the archive on an error.
+
+        Args:
+            exc_type: Type of the raised exception, if any.
+            exc_value: Raised exception, if any.
+            traceback: Traceback of the raised exception, if any.
+        """
+        try:
+            if exc_type is None:
+                self._write_file(
+                    MANIFEST_FILE_NAME, self.manifest.model_dump_json(indent=2).encode(ENCODING)
+                )
+
+            if self._tar_file:
+                self._tar_file.close()
+            if self._zip_file:
+                self._zip_file.close()
+
+            if exc_type is None:
+                os.replace(self._temp_file_path, self.archive_path)
+
+        finally:
+            self._tar_file = None
+            self._zip_file = None
+
+            if self._temp_file_path.exists():
+                self._temp_file_path.unlink()
+
+    def _write_file(self, path: str, content: bytes) -> None:
+        if self._tar_file:
+            tar_info = tarfile.TarInfo(path)
+            tar_info.size = len(content)
+            tar_info.mtime = int(time.time())
+            tar_info.mode = ARCHIVED_FILE_MODE
+            self._tar_file.addfile(tar_info, io.BytesIO(content))
+
+        elif self._zip_file:
+            self._zip_file.writestr(path, content)
+
+        else:
+            raise ValueError(ARCHIVE_NOT_OPEN.format(archive_path=self.archive_path))
+
+    def add_plugin(
+        self,
+        result: ConversionResult,
+        directory: str = "",
+        measurement_file_path: Optional[str] = None,
+    ) -> ArchivedPlugin:
+        """Write the files of a measurement plug-in to the archive.
+
+        Args:
+            result: Measurement plug-in generated in memory.
+            directory: Directory of the measurement plug-in within the archive. Defaults to
+                the root of the archive.
+            measurement_file_path: Path of the converted measurement file.
+
+        Returns:
+            The measurement plug-in as listed in the manifest.
+
+        Raises:
+            ValueError: If the archive already contains a measurement plug-in in the directory.
+        """
+        directory = Path(directory).as_posix() if directory else ""
+        archived_files: List[ArchivedFile] = []
+
+        with self._lock:
+            if any(plugin.directory == directory for plugin in self.manifest.plugins):
+                raise ValueError(DUPLICATE_DIRECTORY.format(directory=directory))
+
+            for file_name, content in result.files.items():
+                path = str(PurePosixPath(directory, file_name)) if directory else file_name
+                self._write_file(path, content)
+                archived_files.append(
+                    ArchivedFile(
+                        path=path,
+                        size=len(content),
+                        sha256=hashlib.sha256(content).hexdigest(),
+                    )
+                )
+
+            plugin = ArchivedPlugin(
+                display_name=result.display_name,
+                function=result.function,
+                measurement_file_path=measurement_file_path,
+                directory=directory,
+                files=archived_files,
+                warnings=result.warnings,
+            )
+            self.manifest.plugins.append(plugin)
+
+        return plugin
@@ -0,0 +1,582 @@
+"""Implementation of batch conversion of measurements."""
+
+import csv
+import functools
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from logging import Logger, LogRecord, getLogger, handlers
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from pydantic import ValidationError
+
+from ni_measurement_plugin_converter._constants import DEBUG_LOGGER, ENCODING
+from ni_measurement_plugin_converter._models import (
+    BatchEntry,
+    BatchResult,
+    ConversionProfile,
+    ConversionResult,
+)
+from ni_measurement_plugin_converter._utils._analysis_context import AnalysisContext
+from ni_measurement_plugin_converter._utils._archive import PluginArchive
+from ni_measurement_plugin_converter._utils._convert import (
+    convert_measurement,
+    generate_measurement_plugin,
+)
+from ni_measurement_plugin_converter._utils._format_code import FormattingPolicy
+from ni_measurement_plugin_converter._utils._logger import (
+    initialize_logger,
+    log_job_to_directory,
+    remove_handlers,
+)
+from ni_measurement_plugin_converter._utils._profiler import Profiler
+from ni_measurement_plugin_converter._utils._validate import (
+    validate_function,
+    validate_measurement_file,
+    validate_output_directory,
+)
+
+CSV_EXTENSION = ".csv"
+JSON_EXTENSION = ".json"
+TOML_EXTENSION = ".toml"
+MANIFEST_ENTRIES_KEY = "measurements"
+
+INVALID_MANIFEST = "Invalid manifest {manifest}: {error}"
+UNSUPPORTED_MANIFEST = "Unsupported manifest format '{extension}'. Supported formats: {formats}"
+TOML_NOT_SUPPORTED = "TOML manifests require Python 3.11 or later."
+EMPTY_MANIFEST = "No measurements found in the manifest {manifest}."
+ERROR_OCCURRED = (
+    "Error occurred. Please verify that the provided measurement is in the expected format."
+)
+WORKER_FAILED = "The conversion process terminated unexpectedly: {error}"
+WORKER_NOT_INITIALIZED = "The conversion process has no measurement to convert."
+FUNCTION_DISPLAY_NAME = "{display_name} {function}"
+
+
+def _read_csv_manifest(manifest_path: Path) -> List[Dict[str, Any]]:
+    with manifest_path.open("r", encoding=ENCODING, newline="") as file:
+        return [dict(row) for row in csv.DictReader(file)]
+
+
+def _read_json_manifest(manifest_path: Path) -> List[Dict[str, Any]]:
+    with manifest_path.open("r", encoding=ENCODING) as file:
+        content = json.load(file)
+
+    if isinstance(content, dict):
+        return content.get(MANIFEST_ENTRIES_KEY, [])
+
+    return content
+
+
+def _read_toml_manifest(manifest_path: Path) -> List[Dict[str, Any]]:
+    try:
+        import tomllib
+    except ImportError:
+        raise ValueError(TOML_NOT_SUPPORTED)
+
+    with manifest_path.open("rb") as file:
+        content = tomllib.load(file)
+
+    return content.get(MANIFEST_ENTRIES_KEY, [])
+
+
+_MANIFEST_READERS: Dict[str, Callable[[Path], List[Dict[str, Any]]]] = {
+    CSV_EXTENSION: _read_csv_manifest,
+    JSON_EXTENSION: _read_json_manifest,
+    TOML_EXTENSION: _read_toml_manifest,
+}
+
+
+def _resolve_path(path: str, manifest_dir: Path) -> str:
+    return str(manifest_dir / Path(path).expanduser())
+
+
+def load_manifest(manifest_path: Path) -> List[BatchEntry]:
+    """Load the measurements to be converted from a manifest file.
+
+    The manifest is a CSV file with a header row, a JSON list or a TOML array of tables named
+    `measurements`. Each entry has `display_name`, `measurement_file_path`, `function` and
+    `directory_out`. Relative paths are resolved against the directory of the manifest.
+
+    Args:
+        manifest_path: Path of the CSV, JSON or TOML manifest.
+
+    Returns:
+        Measurements to be converted.
+
+    Raises:
+        ValueError: If the manifest format is unsupported or the manifest is invalid.
+    """
+    extension = manifest_path.suffix.lower()
+
+    try:
+        reader = _MANIFEST_READERS[extension]
+    except KeyError:
+        raise ValueError(
+            UNSUPPORTED_MANIFEST.format(extension=extension, formats=list(_MANIFEST_READERS))
+        )
+
+    manifest_dir = manifest_path.resolve().parent
+
+    try:
+        entries = [BatchEntry(**entry) for entry in reader(manifest_path)]
+    except (TypeError, ValidationError, json.JSONDecodeError, csv.Error) as error:
+        raise ValueError(INVALID_MANIFEST.format(manifest=manifest_path, error=error))
+
+    if not entries:
+        raise ValueError(EMPTY_MANIFEST.format(manifest=manifest_path))
+
+    for entry in entries:
+        entry.measurement_file_path = _resolve_path(entry.measurement_file_path, manifest_dir)
+        entry.directory_out = _resolve_path(entry.directory_out, manifest_dir)
+
+    return entries
+
+
+def convert_batch_entry(
+    entry: BatchEntry,
+    use_cache: bool = True,
+    formatting: FormattingPolicy = FormattingPolicy.FUNCTION_ONLY,
+) -> BatchResult:
+    """Convert a measurement of a batch, logging to the entry's own log file.
+
+    Errors are recorded in the result instead of being raised so that the remaining
+    entries of the batch are converted.
+
+    Args:
+        entry: Measurement to be converted.
+        use_cache: Whether to use the conversion cache.
+        formatting: Formatting policy of the migrated files.
+
+    Returns:
+        Result of the conversion.
+    """
+    # The log file of each entry is chosen per job, so a worker process that converts many
+    # entries configures the logger only once.
+    logger = initialize_logger(name=DEBUG_LOGGER, log_directory=None, log_to_console=False)
+
+    try:
+        directory_out = Path(entry.directory_out)
+        validate_output_directory(directory_out)
+
+        with log_job_to_directory(str(directory_out)) as log_file_path:
+            try:
+                measurement_file_path = Path(entry.measurement_file_path)
+                validate_measurement_file(measurement_file_path)
+                analysis_context = AnalysisContext.from_file(measurement_file_path)
+                validate_function(entry.function, analysis_context)
+
+                convert_measurement(
+                    display_name=entry.display_name,
+                    function=entry.function,
+                    directory_out=directory_out,
+                    analysis_context=analysis_context,
+                    logger=logger,
+                    use_cache=use_cache,
+                    formatting=formatting,
+                )
+                return BatchResult(entry=entry, succeeded=True, log_file_path=log_file_path)
+
+            except Exception as error:
+                message = str(error) or ERROR_OCCURRED
+                logger.debug(error, exc_info=True)
+                logger.error(message)
+
+                return BatchResult(
+                    entry=entry, succeeded=False, error=message, log_file_path=log_file_path
+                )
+
+    except Exception as error:
+        # The output directory or its log file cannot be used, so the error is not logged.
+        return BatchResult(entry=entry, succeeded=False, error=str(error) or ERROR_OCCURRED)
+
+
+def generate_batch_entry(
+    entry: BatchEntry,
+    formatting: FormattingPolicy = FormattingPolicy.FUNCTION_ONLY,
+) -> Tuple[BatchResult, Optional[ConversionResult]]:
+    """Generate the files of a measurement of a batch in memory.
+
+    Errors are recorded in the result instead of being raised so that the remaining
+    entries of the batch are converted.
+
+    Args:
+        entry: Measurement to be converted.
+        formatting: Formatting policy of the migrated files.
+
+    Returns:
+        Result of the conversion and, if it succeeded, the generated measurement plug-in.
+    """
+    logger = getLogger(DEBUG_LOGGER)
+    remove_handlers(logger)
+
+    try:
+        measurement_file_path = Path(entry.measurement_file_path)
+        validate_measurement_file(measurement_file_path)
+        analysis_context = AnalysisContext.from_file(measurement_file_path)
+        validate_function(entry.function, analysis_context)
+
+        conversion_result = generate_measurement_plugin(
+            display_name=entry.display_name,
+            function=entry.function,
+            analysis_context=analysis_context,
+            logger=logger,
+            formatting=formatting,
+        )
+        return BatchResult(entry=entry, succeeded=True), conversion_result
+
+    except Exception as error:
+        return BatchResult(entry=entry, succeeded=False, error=str(error) or ERROR_OCCURRED), None
+
+
+def _archive_result(
+    archive: PluginArchive,
+    result: BatchResult,
+    conversion_result: Optional[ConversionResult],
+    directory: str,
+) -> BatchResult:
+    if not conversion_result:
+        return result
+
+    try:
+        archive.add_plugin(
+            conversion_result,
+            directory=directory,
+            measurement_file_path=result.entry.measurement_file_path,
+        )
+    except (OSError, ValueError) as error:
+        return BatchResult(entry=result.entry, succeeded=False, error=str(error))
+
+    return result
+
+
+def _get_archive_directories(entries: List[BatchEntry]) -> List[str]:
+    # The directories are relative to the common root of the output directories, so entries
+    # whose output directories have the same name, such as `a/plugin` and `b/plugin`, do not
+    # collide.
+    directories = [PurePath(entry.directory_out) for entry in entries]
+
+    try:
+        root = PurePath(os.path.commonpath([directory.parent for directory in directories]))
+    except ValueError:
+        # The output directories are on different drives.
+        return [
+            PurePath(
+                directory.drive.rstrip(":"), directory.relative_to(directory.anchor)
+            ).as_posix()
+            for directory in directories
+        ]
+
+    return [directory.relative_to(root).as_posix() for directory in directories]
+
+
+def run_batch(
+    entries: List[BatchEntry],
+    workers: Optional[int],
+    on_result: Optional[Callable[[BatchResult], None]] = None,
+    use_cache: bool = True,
+    formatting: FormattingPolicy = FormattingPolicy.FUNCTION_ONLY,
+    archive: Optional[PluginArchive] = None,
+) -> List[BatchResult]:
+    """Convert the measurements in parallel using a pool of worker processes.
+
+    When an archive is given, the worker processes generate the files in memory and the files
+    are written to the archive, each measurement plug-in in the path of the output directory of
+    its entry relative to the common parent of the output directories.
+
+    Args:
+        entries: Measurements to be converted.
+        workers: Number of worker processes. Defaults to the number of processors.
+        on_result: Callback invoked with each result as soon as the entry completes.
+        use_cache: Whether to use the conversion cache.
+        formatting: Formatting policy of the migrated files.
+        archive: Archive to which the measurement plug-ins are written instead of their output
+            directories.
+
+    Returns:
+        Results of the conversions in the order of the entries.
+    """
+    results: List[Optional[BatchResult]] = [None] * len(entries)
+    archive_directories = _get_archive_directories(entries) if archive else []
+    convert_entry: Callable[[BatchEntry], Any]
+
+    if archive:
+        convert_entry = functools.partial(generate_batch_entry, formatting=formatting)
+    else:
+        convert_entry = functools.partial(
+            convert_batch_entry, use_cache=use_cache, formatting=formatting
+        )
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: Dict[Future, int] = {
+            executor.submit(convert_entry, entry): index for index, entry in enumerate(entries)
+        }
+
+        for future in as_completed(futures):
+            index = futures[future]
+
+            try:
+                result = future.result()
+                if archive:
+                    result, conversion_result = result
+                    result = _archive_result(
+                        archive, result, conversion_result, archive_directories[index]
+                    )
+
+            except Exception as error:
+                result = BatchResult(
+                    entry=entries[index],
+                    succeeded=False,
+                    error=WORKER_FAILED.format(error=error),
+                )
+
+            results[index] = result
+            if on_result:
+                on_result(result)
+
+    return [result for result in results if result is not None]
+
+
+class _FunctionResult(NamedTuple):
+    result: BatchResult
+    conversion_result: Optional[ConversionResult]
+    profile: Optional[ConversionProfile]
+    rendered_files: Optional[Dict[Path, str]]
+
+
+# Measurement source of the worker processes that convert the functions of a measurement. It is
+# sent to each worker process once, when the process starts, instead of with each function.
+_worker_analysis_context: Optional[AnalysisContext] = None
+
+
+def _initialize_function_worker(
+    analysis_context: AnalysisContext,
+    logger_name: str,
+    log_queue: "multiprocessing.queues.Queue[LogRecord]",
+) -> None:
+    global _worker_analysis_context
+    _worker_analysis_context = analysis_context
+
+    # The records are written by the parent process, to the console and the log file of the
+    # conversion.
+    logger = getLogger(logger_name)
+    remove_handlers(logger)
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handlers.QueueHandler(log_queue))
+
+
+def _convert_function(
+    entry: BatchEntry,
+    logger_name: str,
+    use_cache: bool,
+    formatting: FormattingPolicy,
+    trace_memory: Optional[bool],
+    rendered_files: Optional[Dict[Path, str]],
+    in_memory: bool,
+) -> _FunctionResult:
+    if _worker_analysis_context is None:
+        raise RuntimeError(WORKER_NOT_INITIALIZED)
+
+    logger = getLogger(logger_name)
+    profiler = Profiler(trace_memory=trace_memory) if trace_memory is not None else None
+    conversion_result = None
+
+    try:
+        if in_memory:
+            conversion_result = generate_measurement_plugin(
+                display_name=entry.display_name,
+                function=entry.function,
+                analysis_context=_worker_analysis_context,
+                logger=logger,
+                formatting=formatting,
+                profiler=profiler,
+            )
+        else:
+            directory_out = Path(entry.directory_out)
+            validate_output_directory(directory_out)
+
+            convert_measurement(
+                display_name=entry.display_name,
+                function=entry.function,
+                directory_out=directory_out,
+                analysis_context=_worker_analysis_context,
+                logger=logger,
+                use_cache=use_cache,
+                formatting=formatting,
+                profiler=profiler,
+                rendered_files=rendered_files,
+            )
+        result = BatchResult(entry=entry, succeeded=True)
+
+    except Exception as error:
+        logger.debug(error, exc_info=True)
+        result = BatchResult(entry=entry, succeeded=False, error=str(error) or ERROR_OCCURRED)
+
+    finally:
+        profile = profiler.get_profile() if profiler else None
+        if profiler:
+            profiler.stop()
+
+    return _FunctionResult(result, conversion_result, profile, rendered_files)
+
+
+def _get_rendered_files(
+    rendered_files: Optional[Dict[Path, str]], directory_out: Path
+) -> Optional[Dict[Path, str]]:
+    if rendered_files is None:
+        return None
+
+    return {
+        file_path: fingerprint
+        for file_path, fingerprint in rendered_files.items()
+        if file_path.parent == directory_out
+    }
+
+
+def _update_rendered_files(
+    rendered_files: Optional[Dict[Path, str]],
+    directory_out: Path,
+    function_rendered_files: Optional[Dict[Path, str]],
+) -> None:
+    if rendered_files is None or function_rendered_files is None:
+        return
+
+    # The worker process returns the fingerprints of all the files of the function.
+    for file_path in list(rendered_files):
+        if file_path.parent == directory_out:
+            del rendered_files[file_path]
+
+    rendered_files.update(function_rendered_files)
+
+
+class _LogForwarder(logging.Handler):
+    """Handler that logs the records of the worker processes to a logger of this process."""
+
+    def __init__(self, logger: Logger) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.logger = logger
+
+    def emit(self, record: LogRecord) -> None:
+        self.logger.handle(record)
+
+
+def convert_functions(
+    display_name: str,
+    functions: List[str],
+    directory_out: Path,
+    analysis_context: AnalysisContext,
+    logger: Logger,
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[BatchResult], None]] = None,
+    use_cache: bool = True,
+    formatting: FormattingPolicy = FormattingPolicy.FUNCTION_ONLY,
+    profiler: Optional[Profiler] = None,
+    rendered_files: Optional[Dict[Path, str]] = None,
+    archive: Optional[PluginArchive] = None,
+) -> List[BatchResult]:
+    """Convert several functions of a measurement in parallel using a pool of worker processes.
+
+    The parsed measurement is sent to each worker process once, so that the measurement file is
+    read and parsed only once. Each function is converted to a measurement plug-in in its own
+    subdirectory of the output directory, named after the function, and the display name of the
+    measurement plug-in is suffixed with the name of the function. The worker processes log to
+    the logger of this process.
+
+    Args:
+        display_name: Display name for the measurement plug-ins.
+        functions: Names of the measurement functions.
+        directory_out: Output directory for measurement plug-in directories, or the directory
+            within the archive if an archive is given.
+        analysis_context: Parsed measurement source.
+        logger: Logger instance.
+        workers: Number of worker processes. Defaults to the number of functions, up to the
+            number of processors.
+        on_result: Callback invoked with each result as soon as the function is converted.
+        use_cache: Whether to use the conversion cache.
+        formatting: Formatting policy of the migrated files.
+        profiler: Profiler that records the stages of all the conversions.
+        rendered_files: Fingerprints of the inputs of the previously created files by file path,
+            which are updated with the created files.
+        archive: Archive to which the measurement plug-ins are written instead of the output
+            directory.
+
+    Returns:
+        Results of the conversions in the order of the functions.
+    """
+    entries = [
+        BatchEntry(
+            display_name=FUNCTION_DISPLAY_NAME.format(display_name=display_name, function=function),
+            measurement_file_path=str(analysis_context.file_path),
+            function=function,
+            directory_out=str(directory_out / function),
+        )
+        for function in functions
+    ]
+    results: List[Optional[BatchResult]] = [None] * len(entries)
+    trace_memory = profiler.traces_memory if profiler else None
+    max_workers = workers or min(len(entries), os.cpu_count() or 1)
+
+    log_queue: "multiprocessing.queues.Queue[LogRecord]" = multiprocessing.Queue()
+    log_listener = handlers.QueueListener(log_queue, _LogForwarder(logger))
+    log_listener.start()
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_function_worker,
+            initargs=(analysis_context, logger.name, log_queue),
+        ) as executor:
+            futures: Dict[Future, int] = {
+                executor.submit(
+                    _convert_function,
+                    entry,
+                    logger.name,
+                    use_cache,
+                    formatting,
+                    trace_memory,
+                    _get_rendered_files(rendered_files, Path(entry.directory_out)),
+                    archive is not None,
+                ): index
+                for index, entry in enumerate(entries)
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                entry = entries[index]
+
+                try:
+                    function_result = future.result()
+                    result = function_result.result
+
+                    if profiler and function_result.profile:
+                        profiler.add_profile(function_result.profile)
+
+                    if archive:
+                        result = _archive_result(
+                            archive, result, function_result.conversion_result, entry.directory_out
+                        )
+                    else:
+                        _update_rendered_files(
+                            rendered_files,
+                            Path(entry.directory_out),
+                            function_result.rendered_files,
+                        )
+
+                except Exception as error:
+                    result = BatchResult(
+                        entry=entry, succeeded=False, error=WORKER_FAILED.format(error=error)
+                    )
+
+                results[index] = result
+                if on_result:
+                    on_result(result)
+
+    finally:
+        # The worker processes have exited, so all their records are queued.
+        log_listener.stop()
+        log_queue.close()
+
+    return [result for result in results if result is not None]
@@ -0,0 +1,237 @@
+"""Implementation of the content-addressed conversion cache."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from logging import getLogger
+from pathlib import Path
+from typing import List, Optional
+
+from ni_measurement_plugin_converter._constants import DEBUG_LOGGER, ENCODING
+
+CACHE_DIR_ENV_VAR = "NI_MEASUREMENT_PLUGIN_CONVERTER_CACHE_DIR"
+CACHE_DIR_NAME = "ni_measurement_plugin_converter"
+CONVERSIONS_DIR_NAME = "conversions"
+FORMATTED_CODE_DIR_NAME = "formatted_code"
+CACHE_SIZE_LIMIT_IN_BYTES = 256 * 1024 * 1024  # 256MB
+FORMATTED_CODE_CACHE_SIZE_LIMIT_IN_BYTES = 64 * 1024 * 1024  # 64MB
+FORMATTED_CODE_FILE_EXTENSION = ".py"
+
+CACHE_HIT = "Measurement is unchanged. Restored measurement plug-in files from the cache."
+CACHE_STORED = "Measurement plug-in files are stored in the cache."
+CACHE_UNAVAILABLE = "Conversion cache is unavailable: {error}"
+
+
+def get_cache_directory() -> Path:
+    """Get the root directory of the converter's caches.
+
+    The directory can be overridden with the `NI_MEASUREMENT_PLUGIN_CONVERTER_CACHE_DIR`
+    environment variable.
+
+    Returns:
+        Cache directory.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return Path(cache_dir)
+
+    local_app_data = os.environ.get("LOCALAPPDATA")
+    base_dir = Path(local_app_data) if local_app_data else Path.home() / ".cache"
+    return base_dir / CACHE_DIR_NAME
+
+
+def compute_hash(*parts: str) -> str:
+    """Compute a stable hash of the given parts.
+
+    Args:
+        parts: Values that identify the cached content.
+
+    Returns:
+        Hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        # Separate the parts so that ("ab", "c") and ("a", "bc") hash differently.
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def get_conversion_cache_key(
+    source_code: str, function: str, display_name: str, formatting: str
+) -> str:
+    """Get the cache key of a conversion.
+
+    The key covers the version of the converter, so that upgrading the converter never
+    restores files generated by an older version.
+
+    Args:
+        source_code: Source code of the measurement.
+        function: Name of the measurement function.
+        display_name: Display name for the measurement plug-in.
+        formatting: Formatting policy of the migrated file.
+
+    Returns:
+        Cache key of the conversion.
+    """
+    # Imported here because the package imports this module during its initialization.
+    from ni_measurement_plugin_converter import __version__
+
+    return compute_hash(source_code, function, display_name, formatting, __version__)
+
+
+def _get_conversions_directory() -> Path:
+    return get_cache_directory() / CONVERSIONS_DIR_NAME
+
+
+def restore_cached_conversion(cache_key: str, directory_out: Path) -> Optional[List[Path]]:
+    """Restore the cached measurement plug-in files to the output directory.
+
+    The files are written atomically and files whose content is unchanged are not written.
+
+    Args:
+        cache_key: Cache key of the conversion.
+        directory_out: Output directory for measurement plug-in files.
+
+    Returns:
+        Restored file paths on a cache hit, else None.
+    """
+    # Imported here because the package imports this module at startup.
+    from ni_measurement_plugin_ui_creator.utils.file_writer import write_file_atomically
+
+    entry_dir = _get_conversions_directory() / cache_key
+
+    try:
+        cached_files = [path for path in entry_dir.iterdir() if path.is_file()]
+        restored_files = []
+
+        for cached_file in cached_files:
+            restored_file = directory_out / cached_file.name
+            write_file_atomically(restored_file, cached_file.read_bytes())
+            restored_files.append(restored_file)
+
+        # Mark the entry as recently used for the LRU eviction.
+        os.utime(entry_dir)
+
+    except FileNotFoundError:
+        return None
+
+    except OSError as error:
+        getLogger(DEBUG_LOGGER).debug(CACHE_UNAVAILABLE.format(error=error))
+        return None
+
+    getLogger(DEBUG_LOGGER).info(CACHE_HIT)
+    return restored_files
+
+
+def store_conversion(cache_key: str, files: List[Path]) -> None:
+    """Store the generated measurement plug-in files in the cache.
+
+    Errors are logged and ignored because caching must not fail the conversion.
+
+    Args:
+        cache_key: Cache key of the conversion.
+        files: Generated measurement plug-in files.
+    """
+    logger = getLogger(DEBUG_LOGGER)
+    conversions_dir = _get_conversions_directory()
+    entry_dir = conversions_dir / cache_key
+
+    try:
+        conversions_dir.mkdir(parents=True, exist_ok=True)
+
+        # Populate a temporary directory and rename it, so that concurrent conversions
+        # never observe a partially stored entry.
+        staging_dir = Path(tempfile.mkdtemp(prefix=f"{cache_key}.", dir=conversions_dir))
+        for file in files:
+            shutil.copyfile(file, staging_dir / file.name)
+
+        try:
+            staging_dir.rename(entry_dir)
+        except OSError:
+            # Another conversion stored the same entry first.
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        logger.debug(CACHE_STORED)
+        _evict_least_recently_used(conversions_dir, CACHE_SIZE_LIMIT_IN_BYTES)
+
+    except OSError as error:
+        logger.debug(CACHE_UNAVAILABLE.format(error=error))
+
+
+def get_cached_formatted_code(cache_key: str) -> Optional[str]:
+    """Get the formatted code from the cache.
+
+    Args:
+        cache_key: Cache key of the code before formatting.
+
+    Returns:
+        Formatted code on a cache hit, else None.
+    """
+    entry_file = (
+        get_cache_directory()
+        / FORMATTED_CODE_DIR_NAME
+        / f"{cache_key}{FORMATTED_CODE_FILE_EXTENSION}"
+    )
+
+    try:
+        formatted_code = entry_file.read_text(encoding=ENCODING)
+        os.utime(entry_file)
+    except OSError:
+        return None
+
+    return formatted_code
+
+
+def store_formatted_code(cache_key: str, formatted_code: str) -> None:
+    """Store the formatted code in the cache.
+
+    Errors are logged and ignored because caching must not fail the conversion.
+
+    Args:
+        cache_key: Cache key of the code before formatting.
+        formatted_code: Formatted code.
+    """
+    formatted_code_dir = get_cache_directory() / FORMATTED_CODE_DIR_NAME
+
+    try:
+        formatted_code_dir.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor, staging_file = tempfile.mkstemp(
+            prefix=f"{cache_key}.", dir=formatted_code_dir
+        )
+        with os.fdopen(file_descriptor, "w", encoding=ENCODING) as file:
+            file.write(formatted_code)
+
+        entry_file = formatted_code_dir / f"{cache_key}{FORMATTED_CODE_FILE_EXTENSION}"
+        os.replace(staging_file, entry_file)
+        _evict_least_recently_used(formatted_code_dir, FORMATTED_CODE_CACHE_SIZE_LIMIT_IN_BYTES)
+
+    except OSError as error:
+        getLogger(DEBUG_LOGGER).debug(CACHE_UNAVAILABLE.format(error=error))
+
+
+def _get_entry_size(entry: Path) -> int:
+    if entry.is_file():
+        return entry.stat().st_size
+
+    return sum(path.stat().st_size for path in entry.iterdir() if path.is_file())
+
+
+def _evict_least_recently_used(cache_dir: Path, size_limit: int) -> None:
+    entries = sorted(cache_dir.iterdir(), key=lambda entry: entry.stat().st_mtime)
+    entry_sizes = {entry: _get_entry_size(entry) for entry in entries}
+    total_size = sum(entry_sizes.values())
+
+    for entry in entries:
+        if total_size <= size_limit:
+            break
+
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+
+        total_size -= entry_sizes[entry]
@@ -0,0 +1,343 @@
+"""Implementation of measurement plug-in conversion."""
+
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ni_measurement_plugin_ui_creator.constants import MeasUIFile
+from ni_measurement_plugin_ui_creator.utils.file_writer import write_file_atomically
+
+from ni_measurement_plugin_converter._constants import (
+    ALPHANUMERIC_PATTERN,
+    DEBUG_LOGGER,
+    ENCODING,
+)
+from ni_measurement_plugin_converter._models import (
+    ConversionResult,
+    InputInfo,
+    OutputInfo,
+    PinInfo,
+    RelayInfo,
+)
+from ni_measurement_plugin_converter._utils._analysis_context import AnalysisContext
+from ni_measurement_plugin_converter._utils._cache import (
+    compute_hash,
+    get_conversion_cache_key,
+    restore_cached_conversion,
+    store_conversion,
+)
+from ni_measurement_plugin_converter._utils._create_measui_file import render_measui_file
+from ni_measurement_plugin_converter._utils._extract_inputs import extract_inputs
+from ni_measurement_plugin_converter._utils._extract_outputs import extract_outputs
+from ni_measurement_plugin_converter._utils._format_code import FormattingPolicy
+from ni_measurement_plugin_converter._utils._function_analysis import analyze_function
+from ni_measurement_plugin_converter._utils._logger import collect_warnings
+from ni_measurement_plugin_converter._utils._manage_session import (
+    process_sessions_and_update_metadata,
+)
+from ni_measurement_plugin_converter._utils._profiler import ConversionStage, Profiler
+from ni_measurement_plugin_converter._utils._write_data import render_file
+
+MEASUREMENT_PLUGIN_CREATED = "Measurement plug-in is created at {plugin_dir}"
+MEASUI_FILE_CREATED = "Measurement UI file is created."
+MEASUREMENT_FILE_CREATED = "Measurement file is created."
+FILE_MIGRATED = "Migrated file is created."
+BATCH_FILE_CREATED = "Batch file is created."
+HELPER_FILE_CREATED = "Helper file is created."
+SERVICE_CONFIG_CREATED = "Service config is created."
+GET_FUNCTION = "Getting function node tree..."
+EXTRACT_INPUT_INFO = "Extracting inputs information from measurement function..."
+EXTRACT_OUTPUT_INFO = "Extracting outputs information from measurement function..."
+FILE_UNCHANGED = "{file_name} is not created again, as its inputs are unchanged."
+
+MEASUREMENT_TEMPLATE = "measurement.py.mako"
+MEASUREMENT_FILENAME = "measurement.py"
+HELPER_TEMPLATE = "_helpers.py.mako"
+HELPER_FILENAME = "_helpers.py"
+SERVICE_CONFIG_TEMPLATE = "measurement.serviceconfig.mako"
+SERVICE_CONFIG_FILE_EXTENSION = ".serviceconfig"
+BATCH_TEMPLATE = "start.bat.mako"
+BATCH_FILENAME = "start.bat"
+MIGRATED_MEASUREMENT_FILENAME = "_migrated.py"
+
+MEASUREMENT_VERSION = "1.0.0.0"
+
+
+class _FileTask(NamedTuple):
+    file_name: str
+    message: str
+    stage: ConversionStage
+    render: Callable[..., bytes]
+    kwargs: Dict[str, Any]
+
+
+class _PreparedConversion(NamedTuple):
+    inputs: List[InputInfo]
+    outputs: List[OutputInfo]
+    pins: List[PinInfo]
+    relays: List[RelayInfo]
+    migrated_file_content: bytes
+    file_tasks: List[_FileTask]
+
+
+def _prepare_conversion(
+    display_name: str,
+    function: str,
+    analysis_context: AnalysisContext,
+    logger: Logger,
+    formatting: FormattingPolicy,
+    profiler: Profiler,
+) -> _PreparedConversion:
+    logger.debug(GET_FUNCTION)
+    function_node = analysis_context.get_function_node(function)
+
+    plugin_metadata: Dict[str, Any] = {}
+
+    sanitized_display_name = re.sub(ALPHANUMERIC_PATTERN, "_", display_name)
+    plugin_metadata["display_name"] = sanitized_display_name
+
+    with profiler.profile_stage(ConversionStage.AST_EXTRACTION):
+        function_analysis = analyze_function(function_node)
+
+        logger.info(EXTRACT_INPUT_INFO)
+        type_resolver = analysis_context.type_resolver
+        inputs_info = extract_inputs(function_analysis, type_resolver, plugin_metadata)
+
+        logger.info(EXTRACT_OUTPUT_INFO)
+        outputs_info = extract_outputs(function_analysis, type_resolver, plugin_metadata)
+
+    pins_info, relays_info, migrated_code = process_sessions_and_update_metadata(
+        analysis_context,
+        function,
+        plugin_metadata,
+        logger,
+        formatting,
+        profiler,
+        function_analysis,
+    )
+    logger.debug(FILE_MIGRATED)
+
+    service_config_file_name = f"{sanitized_display_name}{SERVICE_CONFIG_FILE_EXTENSION}"
+    plugin_metadata["version"] = MEASUREMENT_VERSION
+    plugin_metadata["serviceconfig_file"] = service_config_file_name
+    plugin_metadata["migrated_file"] = Path(MIGRATED_MEASUREMENT_FILENAME).stem
+    plugin_metadata["function_name"] = function
+
+    file_tasks = [
+        _FileTask(
+            MEASUREMENT_FILENAME,
+            MEASUREMENT_FILE_CREATED,
+            ConversionStage.TEMPLATE_RENDERING,
+            render_file,
+            dict(template_name=MEASUREMENT_TEMPLATE, **plugin_metadata),
+        ),
+        _FileTask(
+            f"{sanitized_display_name}{MeasUIFile.MEASUREMENT_UI_FILE_EXTENSION}",
+            MEASUI_FILE_CREATED,
+            ConversionStage.MEASUI_CREATION,
+            render_measui_file,
+            dict(
+                pins=pins_info,
+                relays=relays_info,
+                inputs=inputs_info,
+                outputs=outputs_info,
+                measurement_name=sanitized_display_name,
+                service_class=f"{sanitized_display_name}_Python",
+            ),
+        ),
+        _FileTask(
+            service_config_file_name,
+            SERVICE_CONFIG_CREATED,
+            ConversionStage.TEMPLATE_RENDERING,
+            render_file,
+            dict(
+                template_name=SERVICE_CONFIG_TEMPLATE,
+                display_name=sanitized_display_name,
+                service_class=f"{sanitized_display_name}_Python",
+                version=MEASUREMENT_VERSION,
+            ),
+        ),
+        _FileTask(
+            BATCH_FILENAME,
+            BATCH_FILE_CREATED,
+            ConversionStage.TEMPLATE_RENDERING,
+            render_file,
+            dict(template_name=BATCH_TEMPLATE),
+        ),
+        _FileTask(
+            HELPER_FILENAME,
+            HELPER_FILE_CREATED,
+            ConversionStage.TEMPLATE_RENDERING,
+            render_file,
+            dict(template_name=HELPER_TEMPLATE),
+        ),
+    ]
+
+    return _PreparedConversion(
+        inputs=inputs_info,
+        outputs=outputs_info,
+        pins=pins_info,
+        relays=relays_info,
+        # Newlines are translated as when the migrated file is written in text mode.
+        migrated_file_content=migrated_code.replace("\n", os.linesep).encode(ENCODING),
+        file_tasks=file_tasks,
+    )
+
+
+def _create_file(task: _FileTask, file_path: Path) -> None:
+    write_file_atomically(file_path, task.render(**task.kwargs))
+
+
+def generate_measurement_plugin(
+    display_name: str,
+    function: str,
+    analysis_context: AnalysisContext,
+    logger: Logger,
+    formatting: FormattingPolicy = FormattingPolicy.FUNCTION_ONLY,
+    profiler: Optional[Profiler] = None,
+) -> ConversionResult:
+    """Generate the files of a measurement plug-in in memory.
+
+    Args:
+        display_name: Display name for the measurement plug-in.
+        function: Name of the measurement function.
+        analysis_context: Parsed measurement source.
+        logger: Logger instance.
+        formatting: Formatting policy of the migrated file.
+        profiler: Profiler that records the stages of the conversion.
+
+    Returns:
+        The generated files by file name, the information extracted from the measurement and
+        the warnings logged by the conversion.
+    """
+    profiler = profiler or Profiler()
+
+    # The inputs and outputs that are skipped are logged as warnings.
+    with collect_warnings(getLogger(DEBUG_LOGGER)) as warnings:
+        conversion = _prepare_conversion(
+            display_name, function, analysis_context, logger, formatting, profiler
+        )
+
+    # The files are independent of each other, so they are rendered concurrently.
+    with ThreadPoolExecutor() as executor:
+        futures = {
+            task.file_name: executor.submit(
+                profiler.profile_function(task.stage, task.render), **task.kwargs
+            )
+            for task in conversion.file_tasks
+        }
+        files = {MIGRATED_MEASUREMENT_FILENAME: conversion.migrated_file_content}
+        files.update({file_name: future.result() for file_name, future in futures.items()})
+
+    return ConversionResult(
+        display_name=display_name,
+        function=function,
+        files=files,
+        inputs=conversion.inputs,
+        outputs=conversion.outputs,
+        pins=conversion.pins,
+        relays=conversion.relays,
+        warnings=warnings,
+    )
+
+
+def convert_measurement(
+    display_name: str,
+    function: str,
+    directory_out: Path,
+    analysis_context: AnalysisContext,
+    logger: Logger,
+    use_cache: bool = True,
+    formatting: FormattingPolicy = FormattingPolicy.FUNCTION_ONLY,
+    profiler: Optional[Profiler] = None,
+    rendered_files: Optional[Dict[Path, str]] = None,
+) -> List[Path]:
+    """Convert a validated measurement function to a measurement plug-in.
+
+    When the cache is used and the measurement, function and display name are unchanged
+    since a previous conversion, the measurement plug-in files are restored from the cache
+    instead of being generated again.
+
+    When the fingerprints of the rendered files are given, the files whose inputs are unchanged
+    since a previous conversion are not created again. For example, the measurement UI file is
+    not created again when the body of the measurement function changes but its inputs, outputs
+    and sessions do not.
+
+    Args:
+        display_name: Display name for the measurement plug-in.
+        function: Name of the measurement function.
+        directory_out: Output directory for measurement plug-in files.
+        analysis_context: Parsed measurement source.
+        logger: Logger instance.
+        use_cache: Whether to use the conversion cache.
+        formatting: Formatting policy of the migrated file.
+        profiler: Profiler that records the stages of the conversion.
+        rendered_files: Fingerprints of the inputs of the previously created files by file path,
+            which are updated with the created files.
+
+    Returns:
+        Paths of the measurement plug-in files.
+    """
+    profiler = profiler or Profiler()
+    cache_key = None
+
+    if use_cache:
+        cache_key = get_conversion_cache_key(
+            analysis_context.source_code, function, display_name, formatting.value
+        )
+        with profiler.profile_stage(ConversionStage.CACHE_RESTORE):
+            restored_files = restore_cached_conversion(cache_key, directory_out)
+
+        if restored_files is not None:
+            # The restored files may have been rendered from other inputs.
+            if rendered_files is not None:
+                for restored_file in restored_files:
+                    rendered_files.pop(restored_file, None)
+            logger.info(MEASUREMENT_PLUGIN_CREATED.format(plugin_dir=str(directory_out.resolve())))
+            return restored_files
+
+    conversion = _prepare_conversion(
+        display_name, function, analysis_context, logger, formatting, profiler
+    )
+
+    migrated_file_path = directory_out / MIGRATED_MEASUREMENT_FILENAME
+    with profiler.profile_stage(ConversionStage.MIGRATION_COPY):
+        write_file_atomically(migrated_file_path, conversion.migrated_file_content)
+
+    # The files are independent of each other, so they are rendered and written concurrently.
+    with ThreadPoolExecutor() as executor:
+        futures: Dict[Future, Tuple[_FileTask, Path, str]] = {}
+
+        for task in conversion.file_tasks:
+            file_path = directory_out / task.file_name
+            fingerprint = compute_hash(repr(sorted(task.kwargs.items())))
+            if (
+                rendered_files is not None
+                and rendered_files.get(file_path) == fingerprint
+                and file_path.exists()
+            ):
+                logger.debug(FILE_UNCHANGED.format(file_name=task.file_name))
+                continue
+
+            create_file = profiler.profile_function(task.stage, _create_file)
+            futures[executor.submit(create_file, task, file_path)] = (task, file_path, fingerprint)
+
+        for future, (task, file_path, fingerprint) in futures.items():
+            # Raise the error of a file that could not be created.
+            future.result()
+            logger.debug(task.message)
+
+            if rendered_files is not None:
+                rendered_files[file_path] = fingerprint
+
+    generated_files = [migrated_file_path] + [
+        directory_out / task.file_name for task in conversion.file_tasks
+    ]
+    if cache_key:
+        store_conversion(cache_key, generated_files)
+
+    logger.info(MEASUREMENT_PLUGIN_CREATED.format(plugin_dir=str(directory_out.resolve())))
+    return generated_files
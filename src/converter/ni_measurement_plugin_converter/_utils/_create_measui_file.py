@@ -11,7 +11,7 @@ from ni_measurement_plugin_ui_creator.constants import (
     SpecializedDataType,
 )
 from ni_measurement_plugin_ui_creator.models import DataElement
-from ni_measurement_plugin_ui_creator.utils.create_measui import write_measui
+from ni_measurement_plugin_ui_creator.utils.create_measui import render_measui, write_measui
 from ni_measurement_plugin_ui_creator.utils.helpers import (
     create_control_elements,
     create_indicator_elements,
@@ -227,6 +227,49 @@ def _get_output_data_elements(outputs: List[OutputInfo]) -> List[DataElement]:
     return output_data_elements
 
 
+def _get_input_output_elements(
+    pins: List[PinInfo],
+    relays: List[RelayInfo],
+    inputs: List[InputInfo],
+    outputs: List[OutputInfo],
+) -> str:
+    input_data_elements = _get_input_data_elements(pins, relays, inputs)
+    output_data_elements = _get_output_data_elements(outputs)
+
+    input_ui_elements = create_control_elements(input_data_elements)
+    output_ui_elements = create_indicator_elements(output_data_elements)
+
+    return input_ui_elements + output_ui_elements
+
+
+def render_measui_file(
+    pins: List[PinInfo],
+    relays: List[RelayInfo],
+    inputs: List[InputInfo],
+    outputs: List[OutputInfo],
+    measurement_name: str,
+    service_class: str,
+) -> bytes:
+    """Render the content of the `.measui` file for the converted measurement.
+
+    Args:
+        pins: List of pins.
+        relays: List of relays.
+        inputs: List of inputs from measurement.
+        outputs: List of outputs from measurement.
+        measurement_name: Measurement name.
+        service_class: Service class name.
+
+    Returns:
+        Content of the `.measui` file.
+    """
+    return render_measui(
+        display_name=measurement_name,
+        service_class=service_class,
+        input_output_elements=_get_input_output_elements(pins, relays, inputs, outputs),
+    )
+
+
 def create_measui_file(
     pins: List[PinInfo],
     relays: List[RelayInfo],
@@ -247,15 +290,9 @@ def create_measui_file(
         measurement_name: Measurement name.
         service_class: Service class name.
     """
-    input_data_elements = _get_input_data_elements(pins, relays, inputs)
-    output_data_elements = _get_output_data_elements(outputs)
-
-    input_ui_elements = create_control_elements(input_data_elements)
-    output_ui_elements = create_indicator_elements(output_data_elements)
-
     measui_path = file_path / measurement_name
     write_measui(
         filepath=measui_path,
         service_class=service_class,
-        input_output_elements=input_ui_elements + output_ui_elements,
+        input_output_elements=_get_input_output_elements(pins, relays, inputs, outputs),
     )
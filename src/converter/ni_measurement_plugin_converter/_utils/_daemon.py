@@ -0,0 +1,270 @@
+"""Implementation of the conversion daemon."""
+
+import hmac
+import importlib
+import os
+import secrets
+import signal
+import socketserver
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from logging import Logger
+from typing import Optional
+
+from pydantic import ValidationError
+
+from ni_measurement_plugin_converter import __version__
+from ni_measurement_plugin_converter._constants import ENCODING
+from ni_measurement_plugin_converter._models import (
+    BatchEntry,
+    BatchResult,
+    DaemonInfo,
+    DaemonRequest,
+    DaemonResponse,
+)
+from ni_measurement_plugin_converter._utils._batch import convert_batch_entry
+from ni_measurement_plugin_converter._utils._daemon_client import (
+    CONVERT_COMMAND,
+    DAEMON_HOST,
+    PING_COMMAND,
+    STOP_COMMAND,
+    get_daemon_file_path,
+)
+from ni_measurement_plugin_converter._utils._format_code import FormattingPolicy
+
+DAEMON_FILE_MODE = 0o600
+MAX_REQUEST_SIZE_IN_BYTES = 1024 * 1024
+# Modules imported by the worker processes when they start, so that the first conversion of
+# each worker does not pay their import time.
+WARM_UP_MODULES = [
+    "astor",
+    "black",
+    "mako.template",
+    "ni_measurement_plugin_converter._utils._batch",
+]
+
+INVALID_REQUEST = "Invalid request: {error}"
+INVALID_REQUEST_LINE = "A request must be a line of at most {max_size} bytes."
+INVALID_TOKEN = "Invalid token."
+ENTRY_REQUIRED = "The measurement to be converted is required."
+UNKNOWN_COMMAND = "Unknown command '{command}'. Supported commands: {commands}"
+WORKER_FAILED = "The conversion process terminated unexpectedly: {error}"
+JOB_CONVERTED = "Converted '{display_name}' in {time:.0f} ms."
+JOB_FAILED = "Failed to convert '{display_name}' in {time:.0f} ms: {error}"
+
+
+def _warm_up_worker() -> None:
+    # The daemon stops the workers, so that Ctrl+C does not interrupt running conversions.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for module in WARM_UP_MODULES:
+        importlib.import_module(module)
+
+
+def _write_daemon_info(daemon_info: DaemonInfo) -> None:
+    daemon_file_path = get_daemon_file_path()
+    daemon_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if daemon_file_path.exists():
+        daemon_file_path.unlink()
+
+    # The token authorizes conversions, so only the user can read the file.
+    file_descriptor = os.open(
+        daemon_file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, DAEMON_FILE_MODE
+    )
+    with os.fdopen(file_descriptor, "wb") as file:
+        file.write(daemon_info.model_dump_json().encode(ENCODING))
+
+
+def _remove_daemon_info(token: str) -> None:
+    daemon_file_path = get_daemon_file_path()
+
+    try:
+        daemon_info = DaemonInfo.model_validate_json(daemon_file_path.read_bytes())
+        # Another daemon may have been started since.
+        if daemon_info.token == token:
+            daemon_file_path.unlink()
+    except (OSError, ValidationError):
+        pass
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        while True:
+            request = self.rfile.readline(MAX_REQUEST_SIZE_IN_BYTES)
+            if not request:
+                return
+
+            # A request that does not end with a newline is too large or incomplete. The rest of a
+            # too large request would be read as other requests, so the connection is closed.
+            if not request.endswith(b"\n"):
+                error = INVALID_REQUEST_LINE.format(max_size=MAX_REQUEST_SIZE_IN_BYTES)
+                self._write_response(
+                    DaemonResponse(
+                        converter_version=__version__, error=INVALID_REQUEST.format(error=error)
+                    )
+                )
+                return
+
+            self._write_response(self.server.conversion_daemon.handle_request(request))
+
+    def _write_response(self, response: DaemonResponse) -> None:
+        self.wfile.write(response.model_dump_json().encode(ENCODING) + b"\n")
+
+
+class _DaemonServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self, conversion_daemon: "ConversionDaemon", port: int) -> None:
+        self.conversion_daemon = conversion_daemon
+        super().__init__((DAEMON_HOST, port), _RequestHandler)
+
+
+class ConversionDaemon:
+    """Converter that stays resident and converts the measurements that clients send.
+
+    The daemon listens on a loopback TCP port for requests, one JSON object per line, and
+    answers each with a JSON object on a line. Each connection is served by its own thread and
+    the conversions run in a pool of worker processes that have imported the dependencies of
+    the conversion once, so a conversion only costs the analysis and rendering work. The port
+    and a token that authorizes the requests are written to a file that only the user can read.
+    """
+
+    def __init__(self, logger: Logger, port: int = 0, workers: Optional[int] = None) -> None:
+        """Initialize the daemon and bind its port.
+
+        Args:
+            logger: Logger instance.
+            port: Loopback TCP port to listen on. Defaults to a free port.
+            workers: Number of worker processes. Defaults to the number of processors.
+
+        Raises:
+            OSError: If the port cannot be bound.
+        """
+        self.logger = logger
+        self.workers = workers or os.cpu_count() or 1
+        self._token = secrets.token_hex(32)
+        self._lock = threading.Lock()
+        self._executor = self._create_executor()
+        self._server = _DaemonServer(self, port)
+
+    @property
+    def port(self) -> int:
+        """Loopback TCP port the daemon listens on."""
+        return self._server.server_address[1]
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up_worker)
+
+    def serve_forever(self) -> None:
+        """Start the worker processes and serve requests until the daemon is stopped."""
+        try:
+            for future in [self._executor.submit(os.getpid) for _ in range(self.workers)]:
+                future.result()
+
+            _write_daemon_info(
+                DaemonInfo(
+                    port=self.port,
+                    token=self._token,
+                    pid=os.getpid(),
+                    converter_version=__version__,
+                )
+            )
+            self._server.serve_forever()
+
+        finally:
+            _remove_daemon_info(self._token)
+            self._server.server_close()
+            self._executor.shutdown()
+
+    def stop(self) -> None:
+        """Stop serving requests. Running conversions are completed."""
+        # `shutdown` waits for `serve_forever` to return, so it must not block a request thread.
+        threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def handle_request(self, request: bytes) -> DaemonResponse:
+        """Handle a request of a client.
+
+        Args:
+            request: Request serialized as JSON.
+
+        Returns:
+            The response to the request.
+        """
+        try:
+            daemon_request = DaemonRequest.model_validate_json(request)
+            formatting = FormattingPolicy(daemon_request.formatting)
+        except (ValidationError, ValueError) as error:
+            return self._respond(error=INVALID_REQUEST.format(error=error))
+
+        if not hmac.compare_digest(daemon_request.token, self._token):
+            return self._respond(error=INVALID_TOKEN)
+
+        if daemon_request.command == PING_COMMAND:
+            return self._respond()
+
+        if daemon_request.command == STOP_COMMAND:
+            self.stop()
+            return self._respond()
+
+        if daemon_request.command != CONVERT_COMMAND:
+            return self._respond(
+                error=UNKNOWN_COMMAND.format(
+                    command=daemon_request.command,
+                    commands=[CONVERT_COMMAND, PING_COMMAND, STOP_COMMAND],
+                )
+            )
+
+        if daemon_request.entry is None:
+            return self._respond(error=ENTRY_REQUIRED)
+
+        result = self._convert(daemon_request.entry, daemon_request.use_cache, formatting)
+        return self._respond(result=result)
+
+    def _respond(
+        self, error: Optional[str] = None, result: Optional[BatchResult] = None
+    ) -> DaemonResponse:
+        return DaemonResponse(converter_version=__version__, error=error, result=result)
+
+    def _submit(
+        self, entry: BatchEntry, use_cache: bool, formatting: FormattingPolicy
+    ) -> "Future[BatchResult]":
+        with self._lock:
+            try:
+                return self._executor.submit(convert_batch_entry, entry, use_cache, formatting)
+            except BrokenProcessPool:
+                # A worker process that terminated during an earlier conversion broke the pool.
+                self._executor.shutdown(wait=False)
+                self._executor = self._create_executor()
+
+            return self._executor.submit(convert_batch_entry, entry, use_cache, formatting)
+
+    def _convert(
+        self, entry: BatchEntry, use_cache: bool, formatting: FormattingPolicy
+    ) -> BatchResult:
+        start_time = time.perf_counter()
+
+        try:
+            result = self._submit(entry, use_cache, formatting).result()
+        except BrokenProcessPool as error:
+            result = BatchResult(
+                entry=entry, succeeded=False, error=WORKER_FAILED.format(error=error)
+            )
+
+        elapsed_time = (time.perf_counter() - start_time) * 1000
+        if result.succeeded:
+            self.logger.info(
+                JOB_CONVERTED.format(display_name=entry.display_name, time=elapsed_time)
+            )
+        else:
+            self.logger.error(
+                JOB_FAILED.format(
+                    display_name=entry.display_name, time=elapsed_time, error=result.error
+                )
+            )
+
+        return result
@@ -0,0 +1,176 @@
+"""Implementation of the client of the conversion daemon.
+
+The client only depends on the standard library, so that sending a conversion to the daemon
+does not pay the start-up time of the dependencies of the conversion.
+"""
+
+import json
+import socket
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ni_measurement_plugin_converter._constants import ENCODING
+from ni_measurement_plugin_converter._utils._cache import get_cache_directory
+
+DAEMON_HOST = "127.0.0.1"
+DAEMON_FILE_NAME = "daemon.json"
+CONNECT_TIMEOUT_IN_SECONDS = 5.0
+PING_TIMEOUT_IN_SECONDS = 5.0
+CONVERT_COMMAND = "convert"
+PING_COMMAND = "ping"
+STOP_COMMAND = "stop"
+
+DAEMON_NOT_RUNNING = (
+    "The converter daemon is not running. Start it using ni-measurement-plugin-converter-serve."
+)
+DAEMON_CLOSED_CONNECTION = "The converter daemon closed the connection."
+INVALID_DAEMON_RESPONSE = "The converter daemon sent an invalid response."
+
+
+def get_daemon_file_path() -> Path:
+    """Get the path of the file that holds the connection information of the daemon.
+
+    The file is readable only by the user who started the daemon.
+
+    Returns:
+        Path of the daemon file in the cache directory.
+    """
+    return get_cache_directory() / DAEMON_FILE_NAME
+
+
+def _read_daemon_info() -> Optional[Dict[str, Any]]:
+    try:
+        with get_daemon_file_path().open("r", encoding=ENCODING) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def send_daemon_request(
+    command: str, timeout: Optional[float] = None, **arguments: Any
+) -> Dict[str, Any]:
+    """Send a request to the running conversion daemon and wait for its response.
+
+    Args:
+        command: Command of the request.
+        timeout: Time to wait for the response, in seconds. Defaults to waiting until the
+            daemon responds.
+        arguments: Arguments of the command.
+
+    Returns:
+        The response of the daemon.
+
+    Raises:
+        ConnectionError: If the daemon is not running, closes the connection or sends an
+            invalid response.
+    """
+    daemon_info = _read_daemon_info()
+    if not daemon_info:
+        raise ConnectionError(DAEMON_NOT_RUNNING)
+
+    request = dict(token=daemon_info.get("token"), command=command, **arguments)
+
+    try:
+        with socket.create_connection(
+            (DAEMON_HOST, daemon_info.get("port")), timeout=CONNECT_TIMEOUT_IN_SECONDS
+        ) as connection:
+            connection.settimeout(timeout)
+            connection.sendall(json.dumps(request).encode(ENCODING) + b"\n")
+
+            with connection.makefile("rb") as file:
+                response = file.readline()
+
+    except OSError as error:
+        raise ConnectionError(DAEMON_NOT_RUNNING) from error
+
+    if not response:
+        raise ConnectionError(DAEMON_CLOSED_CONNECTION)
+
+    try:
+        response_content = json.loads(response)
+    except ValueError as error:
+        raise ConnectionError(INVALID_DAEMON_RESPONSE) from error
+
+    if not isinstance(response_content, dict):
+        raise ConnectionError(INVALID_DAEMON_RESPONSE)
+
+    return response_content
+
+
+def ping_daemon() -> Dict[str, Any]:
+    """Ping the running conversion daemon.
+
+    Returns:
+        The response of the daemon, with the version of the converter it runs.
+
+    Raises:
+        ConnectionError: If the daemon is not running, closes the connection or sends an
+            invalid response.
+    """
+    return send_daemon_request(PING_COMMAND, timeout=PING_TIMEOUT_IN_SECONDS)
+
+
+def is_daemon_running() -> bool:
+    """Check whether the conversion daemon is running and responds.
+
+    Returns:
+        True if the daemon responds, else False.
+    """
+    try:
+        ping_daemon()
+    except (ConnectionError, ValueError):
+        return False
+
+    return True
+
+
+def request_conversion(
+    display_name: str,
+    measurement_file_path: Path,
+    function: str,
+    directory_out: Path,
+    use_cache: bool = True,
+    formatting: str = "function-only",
+) -> Dict[str, Any]:
+    """Convert a measurement using the running conversion daemon.
+
+    Relative paths are resolved against the current directory, as the daemon may run in
+    another directory.
+
+    Args:
+        display_name: Display name for the measurement plug-in.
+        measurement_file_path: Path of the measurement file.
+        function: Name of the measurement function.
+        directory_out: Output directory for the measurement plug-in files.
+        use_cache: Whether to use the conversion cache.
+        formatting: Formatting policy of the migrated file.
+
+    Returns:
+        The response of the daemon, with the result of the conversion or an error.
+
+    Raises:
+        ConnectionError: If the daemon is not running, closes the connection or sends an
+            invalid response.
+    """
+    entry = dict(
+        display_name=display_name,
+        measurement_file_path=str(measurement_file_path.resolve()),
+        function=function,
+        directory_out=str(directory_out.resolve()),
+    )
+
+    return send_daemon_request(
+        CONVERT_COMMAND, entry=entry, use_cache=use_cache, formatting=formatting
+    )
+
+
+def stop_daemon() -> None:
+    """Stop the running conversion daemon once its running conversions complete.
+
+    Raises:
+        ConnectionError: If the daemon is not running or refuses the request.
+    """
+    response = send_daemon_request(STOP_COMMAND, timeout=PING_TIMEOUT_IN_SECONDS)
+
+    if response.get("error"):
+        raise ConnectionError(response["error"])
@@ -2,14 +2,13 @@
 
 import ast
 from logging import getLogger
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from ni_measurement_plugin_converter._constants import DEBUG_LOGGER
 from ni_measurement_plugin_converter._models import InputInfo
-from ni_measurement_plugin_converter._utils._measurement_service import (
-    extract_type,
-    get_nims_datatype,
-)
+from ni_measurement_plugin_converter._utils._function_analysis import FunctionAnalysis
+from ni_measurement_plugin_converter._utils._measurement_service import get_nims_datatype
+from ni_measurement_plugin_converter._utils._type_resolution import TypeResolver
 
 PYTHON_DATATYPE = "python datatype"
 _DEFAULT = "default"
@@ -25,52 +24,51 @@ TYPE_DEFAULT_VALUES = {
     "List[bool]": [True],
 }
 UNSUPPORTED_INPUTS = "The inputs {params} are skipped because their data types are unsupported."
+NONE_DEFAULT_INPUTS = (
+    "The inputs {params} default to None, which measurement plug-ins cannot represent. "
+    "They default to the default values of their data types instead."
+)
+ARRAY_DTYPE = "array dtype"
+ARRAY_CONVERSION = "numpy.asarray({param_name}, dtype={dtype})"
 
 
-def _get_input_params_without_defaults(args: List[ast.arg]) -> Dict[str, Dict[str, str]]:
-    input_params: Dict[str, Dict[str, str]] = {}
-    for arg in args:
-        param_name = arg.arg
-
-        # Extract parameter type from annotation
-        if arg.annotation:
-            param_type = extract_type(arg.annotation)
-
-        try:
-            default_value = TYPE_DEFAULT_VALUES[param_type]
-        except KeyError:
-            default_value = None
-
-        input_params[param_name] = {PYTHON_DATATYPE: param_type, _DEFAULT: str(default_value)}
+def _get_input_params(
+    parameters: List[Tuple[ast.arg, Optional[ast.expr]]], type_resolver: TypeResolver
+) -> Dict[str, Dict[str, Any]]:
+    input_params: Dict[str, Dict[str, Any]] = {}
+    none_default_params = []
 
-    return input_params
+    for arg, default_node in parameters:
+        param_type = type_resolver.resolve(arg.annotation)
+        default_value = None
 
+        if default_node is not None:
+            default_value = ast.literal_eval(default_node)
 
-def _get_input_params_with_defaults(
-    args: List[ast.arg],
-    defaults: List[ast.expr],
-) -> Dict[str, Dict[str, str]]:
-    input_params = {}
+        # Sequences such as `Tuple[bool, ...]` may default to tuples, which are arrays too.
+        if isinstance(default_value, tuple):
+            default_value = list(default_value)
 
-    # Assign default values for the remaining parameters
-    for arg, default_node in zip(args, defaults):
-        param_name = arg.arg
-        param_type = None
+        # Parameters without defaults, or whose default is None, get the default of their type.
+        if default_value is None:
+            if default_node is not None and param_type:
+                none_default_params.append(arg.arg)
 
-        # Extract parameter type from annotation
-        if arg.annotation:
-            param_type = extract_type(arg.annotation)
+            default_value = TYPE_DEFAULT_VALUES.get(param_type or "")
 
-        # Extract default value
-        default_value = ast.literal_eval(default_node)
+        input_params[arg.arg] = {
+            PYTHON_DATATYPE: param_type,
+            _DEFAULT: default_value,
+            ARRAY_DTYPE: type_resolver.resolve_array_dtype(arg.annotation),
+        }
 
-        # Store parameter name, type, and default value
-        input_params[param_name] = {PYTHON_DATATYPE: param_type, _DEFAULT: default_value}
+    if none_default_params:
+        getLogger(DEBUG_LOGGER).warning(NONE_DEFAULT_INPUTS.format(params=none_default_params))
 
     return input_params
 
 
-def _update_inputs_info(inputs_info: Dict[str, Dict[str, str]]) -> List[InputInfo]:
+def _update_inputs_info(inputs_info: Dict[str, Dict[str, Any]]) -> List[InputInfo]:
     logger = getLogger(DEBUG_LOGGER)
     updated_inputs_info = []
     unsupported_inputs = []
@@ -88,17 +86,28 @@ def _update_inputs_info(inputs_info: Dict[str, Dict[str, str]]) -> List[InputInf
                 param_type=param_info[PYTHON_DATATYPE],
                 nims_type=input_type,
                 default_value=param_info[_DEFAULT],
+                array_dtype=param_info[ARRAY_DTYPE],
             )
         )
 
     if unsupported_inputs:
-        logger.info(UNSUPPORTED_INPUTS.format(params=unsupported_inputs))
+        logger.warning(UNSUPPORTED_INPUTS.format(params=unsupported_inputs))
 
     return updated_inputs_info
 
 
 def _generate_input_params(inputs_info: List[InputInfo]) -> str:
-    parameter_names = [f"{info.param_name}={info.param_name}" for info in inputs_info]
+    parameter_names = []
+
+    for info in inputs_info:
+        # The measurement service passes arrays as lists.
+        if info.array_dtype:
+            value = ARRAY_CONVERSION.format(param_name=info.param_name, dtype=info.array_dtype)
+        else:
+            value = info.param_name
+
+        parameter_names.append(f"{info.param_name}={value}")
+
     return ", ".join(parameter_names)
 
 
@@ -108,28 +117,21 @@ def _generate_input_signature(inputs_info: List[InputInfo]) -> str:
 
 
 def extract_inputs(
-    function_node: ast.FunctionDef, plugin_metadata: Dict[str, Any]
+    function_analysis: FunctionAnalysis,
+    type_resolver: TypeResolver,
+    plugin_metadata: Dict[str, Any],
 ) -> List[InputInfo]:
     """Extract metadata about input parameters from a function definition.
 
     Args:
-        function_node: Node representing the function definition.
+        function_analysis: Analysis of the measurement function.
+        type_resolver: Resolver of the type annotations of the measurement source.
         plugin_metadata: Dictionary to store extracted metadata.
 
     Returns:
         List of input parameter information.
     """
-    inputs_info: Dict[str, Dict[str, str]] = {}
-    param_defaults = function_node.args.defaults or []
-
-    params_without_defaults = function_node.args.args[
-        : len(function_node.args.args) - len(param_defaults)
-    ]
-    params_with_defaults = function_node.args.args[len(params_without_defaults) :]
-
-    inputs_info.update(_get_input_params_without_defaults(params_without_defaults))
-    inputs_info.update(_get_input_params_with_defaults(params_with_defaults, param_defaults))
-
+    inputs_info = _get_input_params(function_analysis.parameters, type_resolver)
     updated_inputs_info = _update_inputs_info(inputs_info=inputs_info)
 
     plugin_metadata["inputs_info"] = updated_inputs_info
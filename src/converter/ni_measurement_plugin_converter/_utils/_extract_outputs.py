@@ -1,47 +1,73 @@
 """Implementation of extraction of outputs from measurement function."""
 
 import ast
-import re
 from logging import getLogger
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Set
 
 from ni_measurement_plugin_converter._constants import DEBUG_LOGGER
 from ni_measurement_plugin_converter._models import OutputInfo
-from ni_measurement_plugin_converter._utils._measurement_service import (
-    extract_type,
-    get_nims_datatype,
-)
+from ni_measurement_plugin_converter._utils._function_analysis import FunctionAnalysis
+from ni_measurement_plugin_converter._utils._measurement_service import get_nims_datatype
+from ni_measurement_plugin_converter._utils._type_resolution import TypeResolver
 
 UNSUPPORTED_OUTPUTS = (
     "The outputs {variables} are skipped because their data types are unsupported."
 )
+INCONSISTENT_RETURNS = (
+    "The return statements return {counts} values, but the function has {count} outputs."
+)
+OUTPUT_NAME = "output_{position}"
 
 
-def _extract_type_and_variable_names(function_body: List[Any]) -> Tuple[bool, List[str]]:
-    iterable_output = False
-    output_variables = []
+def _get_returned_value(return_node: ast.Return) -> Optional[ast.expr]:
+    value = return_node.value
+
+    # `return` and `return None` exit early without outputs.
+    if isinstance(value, ast.Constant) and value.value is None:
+        return None
+
+    return value
+
+
+def _get_returned_elements(value: ast.expr) -> Optional[List[ast.expr]]:
+    if not isinstance(value, (ast.Tuple, ast.List)):
+        return None
+
+    # The number of values of `return *values, value` is not known.
+    if any(isinstance(element, ast.Starred) for element in value.elts):
+        return None
+
+    return list(value.elts)
+
 
-    for node in function_body:
-        if isinstance(node, ast.Return):
-            if isinstance(node.value, (ast.Tuple, ast.List)):
-                iterable_output = True
-                name_nodes = [elt for elt in node.value.elts if isinstance(elt, ast.Name)]
-                output_variables.extend(_get_output_variables(name_nodes))
+def _reconcile_output_names(returned_values: List[List[ast.expr]], count: int) -> List[str]:
+    names: List[Optional[str]] = [None] * count
 
-            elif isinstance(node.value, ast.Name):
-                output_variables.append(node.value.id)
+    # Each output is named after the first variable returned at its position by any branch.
+    for values in returned_values:
+        for position, value in enumerate(values[:count]):
+            if names[position] is None and isinstance(value, ast.Name):
+                names[position] = value.id
 
-    return iterable_output, output_variables
+    output_names: List[str] = []
+    used_names: Set[str] = set()
 
+    for position, name in enumerate(names, start=1):
+        output_name = name or OUTPUT_NAME.format(position=position)
 
-def _get_output_variables(elements: List[ast.Name]) -> List[str]:
-    output_variables = [element.id for element in elements]
-    return output_variables
+        # A variable returned at several positions names only the first output.
+        if output_name in used_names:
+            output_name = OUTPUT_NAME.format(position=position)
+
+        used_names.add(output_name)
+        output_names.append(output_name)
+
+    return output_names
 
 
 def _get_output_info(
     output_variable_names: List[str],
-    output_return_types: List[str],
+    output_return_types: List[Optional[str]],
 ) -> List[OutputInfo]:
     logger = getLogger(DEBUG_LOGGER)
     output_configurations = []
@@ -50,7 +76,7 @@ def _get_output_info(
     for variable_name, return_type in zip(output_variable_names, output_return_types):
         output_type = get_nims_datatype(python_native_data_type=return_type)
 
-        if not output_type:
+        if not return_type or not output_type:
             unsupported_outputs.append(variable_name)
             continue
 
@@ -63,50 +89,63 @@ def _get_output_info(
         )
 
     if unsupported_outputs:
-        logger.info(UNSUPPORTED_OUTPUTS.format(variables=unsupported_outputs))
+        logger.warning(UNSUPPORTED_OUTPUTS.format(variables=unsupported_outputs))
 
     return output_configurations
 
 
-def _parse_output_types(output_types: str) -> List[str]:
-    parsed_output_types = []
-
-    match = re.match(r"Tuple\[(.*)\]", output_types)
-    if match:
-        inner_types = match.group(1)
-        parsed_output_types.extend([item.strip() for item in inner_types.split(",")])
-
-    else:
-        parsed_output_types.append(output_types.strip())
-
-    return parsed_output_types
-
-
 def extract_outputs(
-    function_node: ast.FunctionDef, plugin_metadata: Dict[str, Any]
+    function_analysis: FunctionAnalysis,
+    type_resolver: TypeResolver,
+    plugin_metadata: Dict[str, Any],
 ) -> List[OutputInfo]:
     """Extract output information from a function definition node.
 
     Args:
-        function_node: The AST node representing the function definition.
+        function_analysis: Analysis of the measurement function.
+        type_resolver: Resolver of the type annotations of the measurement source.
         plugin_metadata: Dictionary to store extracted metadata.
 
     Returns:
         List of output information.
     """
-    iterable_output, output_variables = _extract_type_and_variable_names(function_node.body)
-    output_types = extract_type(
-        function_node.returns if function_node.returns else ast.Name(id="Any")
-    )
+    return_annotation = function_analysis.return_annotation
+    returned_nodes = [
+        value for value in map(_get_returned_value, function_analysis.returns) if value is not None
+    ]
+    returned_elements = [
+        elements for elements in map(_get_returned_elements, returned_nodes) if elements is not None
+    ]
+    element_types = type_resolver.resolve_elements(return_annotation)
+    output_type = type_resolver.resolve(return_annotation)
+
+    output_types: List[Optional[str]] = []
+    returned_values: List[List[ast.expr]] = []
+    iterable_output = False
+
+    # The outputs are the elements of a tuple annotation, else the elements of the returned
+    # tuples, unless the annotation is a single type such as an array returned as a list.
+    if returned_nodes and (element_types is not None or (returned_elements and not output_type)):
+        iterable_output = True
+        if element_types is not None:
+            output_types = element_types
+        else:
+            output_types = [None] * len(returned_elements[0])
+        returned_values = returned_elements
+
+        counts = sorted({len(elements) for elements in returned_elements})
+        if any(count != len(output_types) for count in counts):
+            getLogger(DEBUG_LOGGER).warning(
+                INCONSISTENT_RETURNS.format(counts=counts, count=len(output_types))
+            )
 
-    if iterable_output:
-        # Separate each output types from combined output types.
-        parsed_output_types = _parse_output_types(output_types)
+    elif returned_nodes:
+        output_types = [output_type]
+        returned_values = [[node] for node in returned_nodes]
 
-    else:
-        parsed_output_types = [output_types]
+    output_variables = _reconcile_output_names(returned_values, len(output_types))
 
-    output_configurations = _get_output_info(output_variables, parsed_output_types)
+    output_configurations = _get_output_info(output_variables, output_types)
     plugin_metadata["outputs_info"] = output_configurations
     plugin_metadata["iterable_outputs"] = iterable_output
 
@@ -0,0 +1,91 @@
+"""Implementation of formatting of the migrated file."""
+
+from enum import Enum
+from logging import getLogger
+
+from ni_measurement_plugin_converter._constants import DEBUG_LOGGER
+from ni_measurement_plugin_converter._utils._analysis_context import AnalysisContext
+from ni_measurement_plugin_converter._utils._cache import (
+    compute_hash,
+    get_cached_formatted_code,
+    store_formatted_code,
+)
+
+BLACK_PACKAGE = "black"
+FUNCTION_NOT_FORMATTED = (
+    "Function {function} could not be formatted separately. Formatting the whole file..."
+)
+
+
+class FormattingPolicy(Enum):
+    """Formatting policies of the migrated file."""
+
+    FULL = "full"
+    FUNCTION_ONLY = "function-only"
+    NONE = "none"
+
+
+def format_code(source_code: str) -> str:
+    """Format the source code using black.
+
+    The formatted code is cached by the hash of the source code and the version of black,
+    so that black is imported and run only for code that has not been formatted before.
+
+    Args:
+        source_code: Source code to be formatted.
+
+    Returns:
+        Formatted source code.
+    """
+    # Imported here because importing it is expensive and only needed to format code.
+    from importlib import metadata
+
+    cache_key = compute_hash(source_code, metadata.version(BLACK_PACKAGE))
+
+    formatted_code = get_cached_formatted_code(cache_key)
+    if formatted_code is not None:
+        return formatted_code
+
+    # black is imported only when code has to be formatted, as importing it is expensive.
+    import black
+
+    formatted_code = black.format_str(source_code, mode=black.FileMode())
+    store_formatted_code(cache_key, formatted_code)
+
+    return formatted_code
+
+
+def format_migrated_code(
+    analysis_context: AnalysisContext,
+    function: str,
+    function_source_code: str,
+    formatting: FormattingPolicy,
+) -> str:
+    """Create the migrated code by splicing the rewritten function into the measurement source.
+
+    Only the lines of the measurement function are replaced, so the rest of the measurement
+    source, including its comments, is kept as it is unless the whole file is formatted.
+
+    Args:
+        analysis_context: Parsed measurement source.
+        function: Name of the measurement function.
+        function_source_code: Source code of the rewritten measurement function.
+        formatting: Formatting policy.
+
+    Returns:
+        Migrated code formatted according to the policy.
+    """
+    if formatting == FormattingPolicy.FUNCTION_ONLY:
+        # black indents the docstrings of a nested function as if it was not nested.
+        if analysis_context.get_function_node(function).col_offset == 0:
+            function_source_code = format_code(function_source_code)
+        else:
+            getLogger(DEBUG_LOGGER).debug(FUNCTION_NOT_FORMATTED.format(function=function))
+            formatting = FormattingPolicy.FULL
+
+    migrated_code = analysis_context.splice_function(function, function_source_code)
+
+    if formatting == FormattingPolicy.FULL:
+        migrated_code = format_code(migrated_code)
+
+    return migrated_code
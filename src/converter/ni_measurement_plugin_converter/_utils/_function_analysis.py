@@ -0,0 +1,151 @@
+"""Implementation of analysis of measurement functions."""
+
+import ast
+import re
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from ni_measurement_plugin_converter._constants import ALPHANUMERIC_PATTERN
+from ni_measurement_plugin_converter._utils._manage_session_helper import (
+    instrument_is_visa_type,
+    ni_drivers_supported_instrument,
+)
+
+VISA_DRIVER = "VISA"
+
+_NestedScope = Union[ast.AsyncFunctionDef, ast.ClassDef, ast.FunctionDef, ast.Lambda]
+
+
+class FunctionAnalysis(NamedTuple):
+    """Information about a measurement function collected in a single pass over its AST.
+
+    Attributes:
+        parameters: Positional parameters of the function with their default values.
+        returns: Return statements of the function, at any depth, in source order.
+        return_annotation: Return annotation of the function.
+        sessions: Drivers, or resource names of VISA instruments, and the variables of the
+            sessions opened in `with` statements at any depth.
+        drivers: Drivers of all the sessions, including those not bound to a variable. VISA
+            instruments are listed as `VISA`.
+    """
+
+    parameters: List[Tuple[ast.arg, Optional[ast.expr]]]
+    returns: List[ast.Return]
+    return_annotation: Optional[ast.expr]
+    sessions: Dict[str, List[str]]
+    drivers: List[str]
+
+
+def _get_resource_name(call: ast.Call) -> str:
+    resource_name = None
+
+    for keyword in call.keywords:
+        if keyword.arg == "resource_name":
+            resource_name = ast.literal_eval(keyword.value)
+            break
+
+    if resource_name is None and call.args and len(call.args) > 0:
+        resource_name = ast.literal_eval(call.args[0])
+
+    resource_name = re.sub(ALPHANUMERIC_PATTERN, "_", str(resource_name))
+
+    return resource_name
+
+
+def is_session_item(item: ast.withitem) -> bool:
+    """Check if an item of a `with` statement opens a session of a supported instrument.
+
+    Args:
+        item: Item of a `with` statement.
+
+    Returns:
+        True if the item opens a session of an NI driver or a VISA instrument, else False.
+    """
+    call = item.context_expr
+
+    return isinstance(call, ast.Call) and (
+        ni_drivers_supported_instrument(call) or instrument_is_visa_type(call)
+    )
+
+
+class _FunctionVisitor(ast.NodeVisitor):
+    def __init__(self, function_node: ast.FunctionDef) -> None:
+        self._function_node = function_node
+        self._session_variables: Set[str] = set()
+        self.returns: List[ast.Return] = []
+        self.sessions: Dict[str, List[str]] = {}
+        self.drivers: List[str] = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        if node is self._function_node:
+            self.generic_visit(node)
+
+    def _skip_nested_scope(self, node: _NestedScope) -> None:
+        # Returns and sessions of nested functions and classes do not belong to the function.
+        pass
+
+    visit_AsyncFunctionDef = _skip_nested_scope
+    visit_ClassDef = _skip_nested_scope
+    visit_Lambda = _skip_nested_scope
+
+    def visit_Return(self, node: ast.Return) -> None:
+        self.returns.append(node)
+
+    def visit_With(self, node: ast.With) -> None:
+        for item in node.items:
+            if is_session_item(item):
+                self._add_session(item)
+
+        self.generic_visit(node)
+
+    def _add_session(self, item: ast.withitem) -> None:
+        call = item.context_expr
+        if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Attribute):
+            return
+
+        ni_driver = None
+        if ni_drivers_supported_instrument(call) and isinstance(call.func.value, ast.Name):
+            ni_driver = call.func.value.id
+
+        driver = ni_driver or VISA_DRIVER
+        if driver not in self.drivers:
+            self.drivers.append(driver)
+
+        if not isinstance(item.optional_vars, ast.Name):
+            return
+
+        # A variable that is bound in several `with` statements becomes a single parameter.
+        session_variable = item.optional_vars.id
+        if session_variable not in self._session_variables:
+            session_key = ni_driver or _get_resource_name(call)
+            self._session_variables.add(session_variable)
+            self.sessions.setdefault(session_key, []).append(session_variable)
+
+
+def analyze_function(function_node: ast.FunctionDef) -> FunctionAnalysis:
+    """Collect the parameters, returns and sessions of a measurement function.
+
+    The function is traversed once. Nested functions, lambdas and classes are not traversed.
+
+    Args:
+        function_node: The code tree of the measurement function.
+
+    Returns:
+        The information collected from the function.
+
+    Raises:
+        ValueError: If the resource name of a VISA instrument is not a literal.
+    """
+    visitor = _FunctionVisitor(function_node)
+    visitor.visit(function_node)
+
+    args = function_node.args.args
+    defaults: List[Optional[ast.expr]] = [None] * (len(args) - len(function_node.args.defaults))
+    defaults += function_node.args.defaults
+
+    return FunctionAnalysis(
+        parameters=list(zip(args, defaults)),
+        returns=visitor.returns,
+        return_annotation=function_node.returns,
+        sessions=visitor.sessions,
+        drivers=visitor.drivers,
+    )
@@ -1,10 +1,22 @@
-"""Implementation of logger."""
+"""Implementation of logger.
 
+The loggers of the converter do not write their records themselves. They put them on a queue,
+and a single listener thread writes them to the console and to the log files, so that
+conversions do not wait for the disk. The log file of a record is chosen when it is logged:
+the log file of the current job if there is one, else the log file of its logger.
+"""
+
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging import Logger, StreamHandler, handlers
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import Logger, LogRecord, handlers
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from ni_measurement_plugin_converter._constants import DEBUG_LOGGER
 
@@ -15,17 +27,19 @@ LOG_FILE_MSG_FORMAT = "%(asctime)s [%(name)s] [%(levelname)s] %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_FILE = "Please find the log file at {log_file_path}"
 
+# Attributes of the records that the listener reads to route them.
+_LOG_FILE_PATH_ATTRIBUTE = "log_file_path"
+_LOG_TO_CONSOLE_ATTRIBUTE = "log_to_console"
+# Attribute of the records that are not logged, but that the listener sets once it has written
+# the records queued before them.
+_FLUSHED_ATTRIBUTE = "flushed"
 
-def _add_file_handler(logger: Logger, log_directory: str) -> None:
-    handler = _create_file_handler(log_directory=log_directory, file_name=LOG_FILE_NAME)
-    logger.addHandler(handler)
-
+_job_log_file_path: ContextVar[Optional[str]] = ContextVar("job_log_file_path", default=None)
 
-def _create_file_handler(log_directory: str, file_name: str) -> handlers.RotatingFileHandler:
-    log_file = Path(log_directory) / file_name
 
+def _create_file_handler(log_file_path: str) -> handlers.RotatingFileHandler:
     handler = handlers.RotatingFileHandler(
-        str(log_file),
+        log_file_path,
         maxBytes=LOG_FILE_SIZE_LIMIT_IN_BYTES,
         backupCount=LOG_FILE_COUNT_LIMIT,
     )
@@ -37,42 +51,212 @@ def _create_file_handler(log_directory: str, file_name: str) -> handlers.Rotatin
     return handler
 
 
-def _add_stream_handler(logger: Logger) -> None:
-    stream_handler = _create_stream_handler()
-    logger.addHandler(stream_handler)
-
-
-def _create_stream_handler() -> StreamHandler:
+def _create_stream_handler() -> logging.StreamHandler:
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(logging.INFO)
     return handler
 
 
+class _LogRouter(logging.Handler):
+    """Handler of the listener thread that writes each record to its destinations."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.DEBUG)
+        self._stream_handler = _create_stream_handler()
+        # Open log files by path, with the number of loggers and jobs that use them.
+        self._file_handlers: Dict[str, Tuple[handlers.RotatingFileHandler, int]] = {}
+        self._file_handlers_lock = threading.Lock()
+
+    def acquire_log_file(self, log_file_path: str) -> None:
+        # The file is opened by the caller, so that errors such as denied access are raised
+        # where the logger is configured.
+        with self._file_handlers_lock:
+            file_handler, references = self._file_handlers.get(log_file_path, (None, 0))
+            if file_handler is None:
+                file_handler = _create_file_handler(log_file_path)
+
+            self._file_handlers[log_file_path] = (file_handler, references + 1)
+
+    def _release_log_file(self, log_file_path: str) -> None:
+        with self._file_handlers_lock:
+            file_handler, references = self._file_handlers.pop(log_file_path, (None, 0))
+            if file_handler is None:
+                return
+
+            if references > 1:
+                self._file_handlers[log_file_path] = (file_handler, references - 1)
+                return
+
+        file_handler.close()
+
+    def emit(self, record: LogRecord) -> None:
+        flushed: Optional[threading.Event] = getattr(record, _FLUSHED_ATTRIBUTE, None)
+        log_file_path: Optional[str] = getattr(record, _LOG_FILE_PATH_ATTRIBUTE, None)
+
+        if flushed is not None:
+            if log_file_path:
+                self._release_log_file(log_file_path)
+
+            self._stream_handler.flush()
+            flushed.set()
+            return
+
+        if getattr(record, _LOG_TO_CONSOLE_ATTRIBUTE, False):
+            if record.levelno >= self._stream_handler.level:
+                self._stream_handler.handle(record)
+
+        if log_file_path:
+            with self._file_handlers_lock:
+                file_handler, _ = self._file_handlers.get(log_file_path, (None, 0))
+
+            if file_handler is not None:
+                file_handler.handle(record)
+
+    def close(self) -> None:
+        with self._file_handlers_lock:
+            file_handlers = [file_handler for file_handler, _ in self._file_handlers.values()]
+            self._file_handlers.clear()
+
+        for file_handler in file_handlers:
+            file_handler.close()
+
+        super().close()
+
+
+class _LogPipeline:
+    """Queue of the records of the process and the listener thread that writes them."""
+
+    def __init__(self) -> None:
+        self.queue: "queue.Queue[LogRecord]" = queue.Queue()
+        self.router = _LogRouter()
+        self.listener = handlers.QueueListener(self.queue, self.router)
+        self.listener.start()
+
+    def flush(self, log_file_path: Optional[str] = None) -> None:
+        """Wait until the records queued so far are written, then release the log file."""
+        flushed = threading.Event()
+        record = logging.makeLogRecord(
+            {_FLUSHED_ATTRIBUTE: flushed, _LOG_FILE_PATH_ATTRIBUTE: log_file_path}
+        )
+        self.queue.put_nowait(record)
+        flushed.wait()
+
+    def stop(self) -> None:
+        """Write the queued records and stop the listener thread."""
+        self.listener.stop()
+        self.router.close()
+
+
+_pipeline: Optional[_LogPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def _get_pipeline() -> _LogPipeline:
+    global _pipeline
+
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = _LogPipeline()
+
+        return _pipeline
+
+
+def _stop_pipeline() -> None:
+    global _pipeline
+
+    with _pipeline_lock:
+        pipeline, _pipeline = _pipeline, None
+
+    if pipeline is not None:
+        pipeline.stop()
+
+
+def _reset_pipeline_after_fork() -> None:
+    global _pipeline, _pipeline_lock
+
+    # The listener thread of the parent process does not exist in the child process.
+    _pipeline = None
+    _pipeline_lock = threading.Lock()
+
+
+atexit.register(_stop_pipeline)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pipeline_after_fork)
+
+
+class _PipelineHandler(handlers.QueueHandler):
+    """Handler of a logger that puts its records on the queue of the pipeline."""
+
+    def __init__(self, log_file_path: Optional[str], log_to_console: bool) -> None:
+        super().__init__(_get_pipeline().queue)
+        self.log_file_path = log_file_path
+        self.log_to_console = log_to_console
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        record = super().prepare(record)
+        setattr(record, _LOG_FILE_PATH_ATTRIBUTE, _job_log_file_path.get() or self.log_file_path)
+        setattr(record, _LOG_TO_CONSOLE_ATTRIBUTE, self.log_to_console)
+        return record
+
+    def enqueue(self, record: LogRecord) -> None:
+        # The pipeline is created again in a child process forked after the handler.
+        _get_pipeline().queue.put_nowait(record)
+
+    def close(self) -> None:
+        # Closed again by `logging.shutdown` once the pipeline is stopped.
+        if _pipeline is not None:
+            _pipeline.flush(self.log_file_path)
+
+        self.log_file_path = None
+        super().close()
+
+
+def _get_pipeline_handler(logger: Logger) -> Optional[_PipelineHandler]:
+    for handler in logger.handlers:
+        if isinstance(handler, _PipelineHandler):
+            return handler
+
+    return None
+
+
 def remove_handlers(logger: Logger) -> None:
-    """Remove all handlers from the specified logger.
+    """Remove and close all handlers of the specified logger.
+
+    The records that the logger has queued are written before this function returns.
 
     Args:
         logger: The logger instance from which handlers will be removed.
     """
-    for handler in logger.handlers:
+    for handler in list(logger.handlers):
         logger.removeHandler(handler)
+        handler.close()
 
 
 def print_log_file_location() -> None:
     """Print the location of the log file if it is available."""
     logger = logging.getLogger(DEBUG_LOGGER)
+    handler = _get_pipeline_handler(logger)
+    log_file_path = _job_log_file_path.get()
 
-    for handler in logger.handlers:
-        if isinstance(handler, handlers.RotatingFileHandler):
-            logger.info(LOG_FILE.format(log_file_path=handler.baseFilename))
+    if not log_file_path and handler:
+        log_file_path = handler.log_file_path
 
+    if log_file_path:
+        logger.info(LOG_FILE.format(log_file_path=log_file_path))
 
-def initialize_logger(name: str, log_directory: Optional[str]) -> Logger:
+
+def initialize_logger(
+    name: str, log_directory: Optional[str], log_to_console: bool = True
+) -> Logger:
     """Initialize and configure a logger instance.
 
+    Initializing a logger again replaces its configuration instead of adding handlers, so the
+    logger can be initialized for each conversion of a long-running process.
+
     Args:
         name: The name of the logger.
         log_directory: The directory where log files should be stored.
+        log_to_console: Whether the logger also logs to the console.
 
     Returns:
         The configured logger instance.
@@ -80,8 +264,79 @@ def initialize_logger(name: str, log_directory: Optional[str]) -> Logger:
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
 
-    if log_directory:
-        _add_file_handler(logger, log_directory)
+    log_file_path = str(Path(log_directory) / LOG_FILE_NAME) if log_directory else None
+    handler = _get_pipeline_handler(logger)
+
+    if handler and (handler.log_file_path, handler.log_to_console) == (
+        log_file_path,
+        log_to_console,
+    ):
+        return logger
+
+    if log_file_path:
+        _get_pipeline().router.acquire_log_file(log_file_path)
+
+    if handler:
+        logger.removeHandler(handler)
+        handler.close()
+
+    logger.addHandler(_PipelineHandler(log_file_path, log_to_console))
 
-    _add_stream_handler(logger)
     return logger
+
+
+@contextmanager
+def log_job_to_directory(log_directory: str) -> Iterator[str]:
+    """Write the records that the current job logs to the log file of a directory.
+
+    The records of the current thread, or of the current task, go to the log file of the
+    directory instead of the log file of their logger, so the jobs of a long-running process
+    each have their own log file without configuring the loggers again.
+
+    Args:
+        log_directory: The directory where the log file of the job should be stored.
+
+    Yields:
+        The path of the log file, whose records are written when the context exits.
+    """
+    log_file_path = str(Path(log_directory) / LOG_FILE_NAME)
+    pipeline = _get_pipeline()
+    pipeline.router.acquire_log_file(log_file_path)
+    token = _job_log_file_path.set(log_file_path)
+
+    try:
+        yield log_file_path
+    finally:
+        _job_log_file_path.reset(token)
+        pipeline.flush(log_file_path)
+
+
+class _WarningCollector(logging.Handler):
+    def __init__(self, thread_id: int) -> None:
+        super().__init__(level=logging.WARNING)
+        self.thread_id = thread_id
+        self.warnings: List[str] = []
+
+    def emit(self, record: LogRecord) -> None:
+        # Conversions of other threads may log to the same logger.
+        if record.thread == self.thread_id:
+            self.warnings.append(record.getMessage())
+
+
+@contextmanager
+def collect_warnings(logger: Logger) -> Iterator[List[str]]:
+    """Collect the warnings that the current thread logs to the logger.
+
+    Args:
+        logger: The logger instance to which the warnings are logged.
+
+    Yields:
+        The messages of the warnings, which are collected until the context exits.
+    """
+    collector = _WarningCollector(threading.get_ident())
+    logger.addHandler(collector)
+
+    try:
+        yield collector.warnings
+    finally:
+        logger.removeHandler(collector)
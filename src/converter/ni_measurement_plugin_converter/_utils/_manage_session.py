@@ -4,30 +4,34 @@ import ast
 import itertools
 from enum import Enum
 from logging import Logger, getLogger
-from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import astor
-import black
 
 from ni_measurement_plugin_converter._constants import (
     ADD_SESSION,
     DEBUG_LOGGER,
-    ENCODING,
     NI_DRIVERS,
     RESERVATION,
 )
 from ni_measurement_plugin_converter._models import PinInfo, RelayInfo, SessionMapping
-from ni_measurement_plugin_converter._utils import get_function_node
+from ni_measurement_plugin_converter._utils._analysis_context import AnalysisContext
+from ni_measurement_plugin_converter._utils._format_code import (
+    FormattingPolicy,
+    format_migrated_code,
+)
+from ni_measurement_plugin_converter._utils._function_analysis import (
+    FunctionAnalysis,
+    analyze_function,
+    is_session_item,
+)
 from ni_measurement_plugin_converter._utils._manage_session_helper import (
     check_for_visa,
     get_pin_and_relay_names_signature,
     get_plugin_session_initializations,
-    get_sessions_details,
     get_sessions_signature,
-    instrument_is_visa_type,
-    ni_drivers_supported_instrument,
 )
+from ni_measurement_plugin_converter._utils._profiler import ConversionStage, Profiler
 
 SESSION_CONSTRUCTOR = "session_constructor"
 INSTRUMENT_TYPE = "instrument_type"
@@ -59,72 +63,82 @@ def _add_params(function_node: ast.FunctionDef, params: List[str]) -> ast.Functi
     return function_node
 
 
-def _get_with_removed_function(function_node: ast.FunctionDef) -> List[Any]:
-    body = []
+class _SessionRemover(ast.NodeTransformer):
+    """Remove the sessions from the `with` statements of a function at any depth.
 
-    for child_node in function_node.body:
-        if (
-            isinstance(child_node, ast.With)
-            and hasattr(child_node, "items")
-            and child_node.items
-            and _check_driver_session(child_node)
-        ):
-            body.extend(child_node.body)
-        else:
-            body.append(child_node)
+    The sessions become parameters of the measurement function. A `with` statement that only
+    opens sessions is replaced by its body.
+    """
 
-    return body
+    def __init__(self, function_node: ast.FunctionDef) -> None:
+        self._function_node = function_node
 
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
+        if node is self._function_node:
+            self.generic_visit(node)
 
-def _check_driver_session(child_node: ast.With) -> bool:
-    for item in child_node.items:
-        if isinstance(item.context_expr, ast.Call):
-            if ni_drivers_supported_instrument(item.context_expr) or instrument_is_visa_type(
-                item.context_expr
-            ):
-                return True
+        return node
 
-    return False
+    def _skip_nested_scope(
+        self, node: Union[ast.AsyncFunctionDef, ast.ClassDef]
+    ) -> Union[ast.AsyncFunctionDef, ast.ClassDef]:
+        # Sessions of nested functions and classes are not parameters of the function.
+        return node
 
+    visit_AsyncFunctionDef = _skip_nested_scope
+    visit_ClassDef = _skip_nested_scope
 
-def _manage_session(migrated_file_dir: str, function: str) -> Dict[str, List[str]]:
-    logger = getLogger(DEBUG_LOGGER)
+    def visit_With(self, node: ast.With) -> Union[ast.With, List[ast.stmt]]:
+        self.generic_visit(node)
 
-    measurement_function_node = get_function_node(file_dir=migrated_file_dir, function=function)
+        items = [item for item in node.items if not is_session_item(item)]
+        if not items:
+            return node.body
 
-    logger.info(EXTRACT_DRIVER_SESSIONS)
+        node.items = items
+        return node
 
-    sessions_details = get_sessions_details(function_node=measurement_function_node)
-    if not sessions_details:
-        raise ValueError(INVALID_DRIVERS.format(supported_drivers=NI_DRIVERS + ["VISA"]))
 
-    logger.info(ADD_SESSION)
+def _manage_session(
+    analysis_context: AnalysisContext,
+    function: str,
+    sessions_details: Dict[str, List[str]],
+    formatting: FormattingPolicy,
+    profiler: Profiler,
+) -> str:
+    logger = getLogger(DEBUG_LOGGER)
 
-    params_added_function = _add_params(
-        function_node=measurement_function_node,
-        params=list(itertools.chain.from_iterable(list(sessions_details.values()))),
-    )
+    # Only the measurement function is rewritten, so only its node is copied.
+    with profiler.profile_stage(ConversionStage.MIGRATION_COPY):
+        measurement_function_node = analysis_context.copy_function_node(function)
+
+    with profiler.profile_stage(ConversionStage.SESSION_REWRITING):
+        logger.info(EXTRACT_DRIVER_SESSIONS)
 
-    with open(migrated_file_dir, "r", encoding=ENCODING) as file:
-        source_code = file.read()
+        if not sessions_details:
+            raise ValueError(INVALID_DRIVERS.format(supported_drivers=NI_DRIVERS + ["VISA"]))
 
-    source_code_tree = ast.parse(source_code)
+        logger.info(ADD_SESSION)
 
-    for node in ast.walk(source_code_tree):
-        if isinstance(node, ast.FunctionDef) and node.name == function:
-            node.args = params_added_function.args
-            node.body = _get_with_removed_function(function_node=params_added_function)
-            break
+        params_added_function = _add_params(
+            function_node=measurement_function_node,
+            params=list(itertools.chain.from_iterable(list(sessions_details.values()))),
+        )
+        _SessionRemover(params_added_function).visit(params_added_function)
 
-    source_code = astor.to_source(source_code_tree)
-    formatted_code = black.format_str(source_code, mode=black.FileMode())
+        function_source_code = astor.to_source(params_added_function)
 
-    with open(migrated_file_dir, "w", encoding=ENCODING) as file:
-        file.write(formatted_code)
+    with profiler.profile_stage(ConversionStage.BLACK_FORMATTING):
+        formatted_code = format_migrated_code(
+            analysis_context=analysis_context,
+            function=function,
+            function_source_code=function_source_code,
+            formatting=formatting,
+        )
 
     logger.debug(MIGRATED_FILE_MODIFIED)
 
-    return sessions_details
+    return formatted_code
 
 
 def _get_pins_and_relays_info(
@@ -189,38 +203,76 @@ def _get_pin_and_relay_names(pins_and_relays: List[Union[PinInfo, RelayInfo]]) -
     return ", ".join(pin_and_relay_names)
 
 
+def get_measurement_functions(analysis_context: AnalysisContext) -> List[str]:
+    """Get the measurement functions defined at the top level of the measurement source.
+
+    A measurement function is a function that uses a session of a supported instrument driver.
+
+    Args:
+        analysis_context: Parsed measurement source.
+
+    Returns:
+        Names of the measurement functions in the order of their definitions.
+    """
+    return [
+        node.name
+        for node in analysis_context.tree.body
+        if isinstance(node, ast.FunctionDef) and analyze_function(node).sessions
+    ]
+
+
 def process_sessions_and_update_metadata(
-    migrated_file_path: Path, function: str, plugin_metadata: Dict[str, Any], logger: Logger
-) -> Tuple[List[PinInfo], List[RelayInfo]]:
+    analysis_context: AnalysisContext,
+    function: str,
+    plugin_metadata: Dict[str, Any],
+    logger: Logger,
+    formatting: FormattingPolicy = FormattingPolicy.FUNCTION_ONLY,
+    profiler: Optional[Profiler] = None,
+    function_analysis: Optional[FunctionAnalysis] = None,
+) -> Tuple[List[PinInfo], List[RelayInfo], str]:
     """Process session details and update plugin metadata.
 
-    This function retrieves session information from the migrated file and updates the
-    provided plugin metadata with session initializations, mappings, pins, and relays.
+    This function retrieves session information from the parsed measurement, rewrites the
+    measurement as the migrated code and updates the provided plugin metadata with session
+    initializations, mappings, pins, and relays.
 
     Args:
-        migrated_file_path: Path to the migrated Python file.
+        analysis_context: Parsed measurement source.
         function: Name of the measurement function.
         plugin_metadata: Metadata dictionary to be updated with session data.
         logger: Logger instance.
+        formatting: Formatting policy of the migrated file.
+        profiler: Profiler that records the stages of the conversion.
+        function_analysis: Analysis of the measurement function. Defaults to analyzing the
+            function again.
 
     Returns:
-        Information about pins and relays.
+        Information about pins and relays, and the source code of the migrated file.
     """
-    sessions_details = _manage_session(str(migrated_file_path), function)
+    profiler = profiler or Profiler()
+    if function_analysis is None:
+        function_analysis = analyze_function(analysis_context.get_function_node(function))
 
-    logger.info(DEFINE_PINS_RELAYS)
-    pins_info, relays_info = _get_pins_and_relays_info(sessions_details, plugin_metadata)
+    sessions_details = function_analysis.sessions
+    migrated_code = _manage_session(
+        analysis_context, function, sessions_details, formatting, profiler
+    )
 
-    logger.info(ADD_SESSION_MAPPING)
-    sessions_connections = _get_session_mapping(sessions_details)
+    with profiler.profile_stage(ConversionStage.SESSION_REWRITING):
+        logger.info(DEFINE_PINS_RELAYS)
+        pins_info, relays_info = _get_pins_and_relays_info(sessions_details, plugin_metadata)
 
-    plugin_metadata["session_mappings"] = sessions_connections
-    plugin_metadata["sessions"] = get_sessions_signature(sessions_connections)
+        logger.info(ADD_SESSION_MAPPING)
+        sessions_connections = _get_session_mapping(sessions_details)
 
-    logger.info(ADD_SESSION_INITIALIZATION)
+        plugin_metadata["session_mappings"] = sessions_connections
+        plugin_metadata["sessions"] = get_sessions_signature(sessions_connections)
 
-    plugin_metadata["session_initializations"] = get_plugin_session_initializations(
-        sessions_details
-    )
-    plugin_metadata["is_visa"] = check_for_visa(sessions_details)
-    return pins_info, relays_info
+        logger.info(ADD_SESSION_INITIALIZATION)
+
+        plugin_metadata["session_initializations"] = get_plugin_session_initializations(
+            sessions_details
+        )
+        plugin_metadata["is_visa"] = check_for_visa(sessions_details)
+
+    return pins_info, relays_info, migrated_code
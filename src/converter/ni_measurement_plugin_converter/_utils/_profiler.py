@@ -0,0 +1,207 @@
+"""Implementation of profiling of the conversion stages."""
+
+import functools
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from ni_measurement_plugin_converter._constants import ENCODING
+from ni_measurement_plugin_converter._models import ConversionProfile, StageProfile
+
+PROFILE_FILE_NAME = "profile.json"
+
+_T = TypeVar("_T")
+
+
+class ConversionStage(Enum):
+    """Profiled stages of a conversion."""
+
+    VALIDATION = "validation"
+    CACHE_RESTORE = "cache_restore"
+    MIGRATION_COPY = "migration_copy"
+    AST_EXTRACTION = "ast_extraction"
+    SESSION_REWRITING = "session_rewriting"
+    BLACK_FORMATTING = "black_formatting"
+    TEMPLATE_RENDERING = "template_rendering"
+    MEASUI_CREATION = "measui_creation"
+
+
+class _ActiveStage:
+    def __init__(self, profile: StageProfile, peak_memory: int) -> None:
+        self.profile = profile
+        self.peak_memory = peak_memory
+
+
+class Profiler:
+    """Profiler of the wall time, CPU time and peak memory of the stages of a conversion.
+
+    Stages may be profiled from several threads. The times of a stage that runs more than once
+    are accumulated, so the times of stages that run concurrently add up to more than the
+    elapsed time. CPU time is the CPU time of the whole process while the stage runs.
+
+    Peak memory is the peak memory traced by `tracemalloc` while the stage runs. It is only
+    profiled when the profiler traces memory, which slows down the conversion. On Python 3.8,
+    the peak memory of a stage also covers the memory traced before the stage.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        """Initialize the profiler.
+
+        Args:
+            trace_memory: Whether to trace the peak memory of the stages.
+        """
+        self.stages: Dict[str, StageProfile] = {}
+        self._lock = threading.Lock()
+        self._active_stages: List[_ActiveStage] = []
+        self._trace_memory = trace_memory
+        self._started_tracing = trace_memory and not tracemalloc.is_tracing()
+        self._start_wall_time = time.perf_counter()
+        self._start_cpu_time = time.process_time()
+
+        if self._started_tracing:
+            tracemalloc.start()
+
+    @property
+    def traces_memory(self) -> bool:
+        """Whether the profiler traces the peak memory of the stages."""
+        return self._trace_memory and tracemalloc.is_tracing()
+
+    def _update_peak_memory(self) -> int:
+        # The peak since the last reset is reached while all the active stages are running,
+        # as the peak is reset whenever a stage starts.
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+
+        for active_stage in self._active_stages:
+            active_stage.peak_memory = max(active_stage.peak_memory, peak_memory)
+
+        return current_memory
+
+    @contextmanager
+    def profile_stage(self, stage: ConversionStage) -> Iterator[None]:
+        """Profile the stage that runs within the context.
+
+        Args:
+            stage: Stage of the conversion.
+
+        Yields:
+            None.
+        """
+        with self._lock:
+            profile = self.stages.setdefault(stage.value, StageProfile(name=stage.value))
+            active_stage = None
+
+            if self.traces_memory:
+                current_memory = self._update_peak_memory()
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+
+                active_stage = _ActiveStage(profile, current_memory)
+                self._active_stages.append(active_stage)
+
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall_time
+            cpu_time = time.process_time() - start_cpu_time
+
+            with self._lock:
+                profile.wall_time += wall_time
+                profile.cpu_time += cpu_time
+
+                if active_stage and self.traces_memory:
+                    self._update_peak_memory()
+                    self._active_stages.remove(active_stage)
+                    profile.peak_memory = max(profile.peak_memory or 0, active_stage.peak_memory)
+
+    def profile_function(
+        self, stage: ConversionStage, function: Callable[..., _T]
+    ) -> Callable[..., _T]:
+        """Wrap the function so that its calls are profiled as the stage.
+
+        Args:
+            stage: Stage of the conversion.
+            function: Function that runs the stage.
+
+        Returns:
+            Wrapped function.
+        """
+
+        @functools.wraps(function)
+        def profiled_function(*args: Any, **kwargs: Any) -> _T:
+            with self.profile_stage(stage):
+                return function(*args, **kwargs)
+
+        return profiled_function
+
+    def add_profile(self, profile: ConversionProfile) -> None:
+        """Add the stages of a conversion profiled by another profiler, such as in a worker process.
+
+        Args:
+            profile: Profile of the conversion.
+        """
+        with self._lock:
+            for stage in profile.stages:
+                stage_profile = self.stages.setdefault(stage.name, StageProfile(name=stage.name))
+                stage_profile.wall_time += stage.wall_time
+                stage_profile.cpu_time += stage.cpu_time
+
+                if stage.peak_memory is not None:
+                    stage_profile.peak_memory = max(
+                        stage_profile.peak_memory or 0, stage.peak_memory
+                    )
+
+    def get_profile(self) -> ConversionProfile:
+        """Get the profile of the stages that have run.
+
+        Returns:
+            Profile of the stages in the order in which they started.
+        """
+        with self._lock:
+            stages = [stage.model_copy() for stage in self.stages.values()]
+
+        peak_memory: Optional[int] = None
+        if self.traces_memory:
+            peak_memory = max(
+                (stage.peak_memory or 0 for stage in stages),
+                default=tracemalloc.get_traced_memory()[1],
+            )
+
+        return ConversionProfile(
+            stages=stages,
+            wall_time=time.perf_counter() - self._start_wall_time,
+            cpu_time=time.process_time() - self._start_cpu_time,
+            peak_memory=peak_memory,
+        )
+
+    def stop(self) -> None:
+        """Stop tracing memory, if the profiler started tracing it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        self._trace_memory = False
+
+
+def write_profile(profile: ConversionProfile, directory: Path) -> Path:
+    """Write the profile of a conversion as JSON.
+
+    Times are in seconds and memory is in bytes.
+
+    Args:
+        profile: Profile of the conversion.
+        directory: Directory of the profile file.
+
+    Returns:
+        Path of the profile file.
+    """
+    profile_file_path = directory / PROFILE_FILE_NAME
+    profile_file_path.write_text(profile.model_dump_json(indent=2), encoding=ENCODING)
+
+    return profile_file_path
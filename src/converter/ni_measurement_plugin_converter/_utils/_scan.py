@@ -0,0 +1,272 @@
+"""Implementation of scanning directories for measurement functions."""
+
+import ast
+import fnmatch
+import hashlib
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ni_measurement_plugin_ui_creator.utils.file_writer import write_file_atomically
+from pydantic import ValidationError
+
+from ni_measurement_plugin_converter import __version__
+from ni_measurement_plugin_converter._constants import ENCODING
+from ni_measurement_plugin_converter._models import ScanIndex, ScannedFile, ScannedFunction
+from ni_measurement_plugin_converter._utils._function_analysis import analyze_function
+
+# Increment the version when the detection of measurement functions changes, so that the files
+# of existing indexes are scanned again.
+INDEX_VERSION = 1
+PYTHON_FILE_EXTENSION = ".py"
+SKIPPED_DIRECTORY_NAMES = {"__pycache__", "node_modules", "site-packages"}
+# Starting worker processes costs more than parsing a few files in the current process.
+PARALLEL_PARSE_THRESHOLD = 64
+PARSE_CHUNK_SIZE = 32
+
+SESSIONS_NOT_BOUND = "The sessions must be bound to variables using 'as'."
+SESSIONS_NOT_ANALYZED = "The sessions cannot be analyzed: {error}"
+
+_FileStat = Tuple[int, int]
+
+
+def _is_skipped_directory(name: str, excludes: Sequence[str]) -> bool:
+    return (
+        name.startswith(".")
+        or name in SKIPPED_DIRECTORY_NAMES
+        or any(fnmatch.fnmatch(name, pattern) for pattern in excludes)
+    )
+
+
+def _list_directory(
+    directory: Path, excludes: Sequence[str]
+) -> Tuple[List[Path], List[Tuple[Path, _FileStat]]]:
+    subdirectories: List[Path] = []
+    python_files: List[Tuple[Path, _FileStat]] = []
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not _is_skipped_directory(entry.name, excludes):
+                        subdirectories.append(Path(entry.path))
+
+                elif entry.name.endswith(PYTHON_FILE_EXTENSION) and entry.is_file():
+                    stat = entry.stat()
+                    python_files.append((Path(entry.path), (stat.st_mtime_ns, stat.st_size)))
+
+    except OSError:
+        # Directories that cannot be read, e.g. because access is denied, are skipped.
+        pass
+
+    return subdirectories, python_files
+
+
+def find_python_files(root: Path, excludes: Sequence[str] = ()) -> Dict[Path, _FileStat]:
+    """Find the Python files in a directory tree.
+
+    The directories are listed in parallel. Hidden directories, `__pycache__`, `node_modules`
+    and `site-packages` directories are skipped.
+
+    Args:
+        root: Directory to search.
+        excludes: Name patterns of further directories to skip.
+
+    Returns:
+        The modification time in nanoseconds and the size of each Python file, by path.
+    """
+    python_files: Dict[Path, _FileStat] = {}
+
+    with ThreadPoolExecutor() as executor:
+        pending = {executor.submit(_list_directory, root, excludes)}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                subdirectories, files = future.result()
+                python_files.update(files)
+                pending.update(
+                    executor.submit(_list_directory, subdirectory, excludes)
+                    for subdirectory in subdirectories
+                )
+
+    return python_files
+
+
+def _scan_function(function_node: ast.FunctionDef) -> Optional[ScannedFunction]:
+    try:
+        function_analysis = analyze_function(function_node)
+    except (ValueError, SyntaxError) as error:
+        # The session drivers are not known, so the function is listed as not convertible.
+        return ScannedFunction(
+            name=function_node.name,
+            line=function_node.lineno,
+            drivers=[],
+            convertible=False,
+            reason=SESSIONS_NOT_ANALYZED.format(error=error),
+        )
+
+    if not function_analysis.drivers:
+        return None
+
+    # The converter finds the sessions the same way, so the function can be converted if the
+    # sessions are bound to variables.
+    convertible = bool(function_analysis.sessions)
+
+    return ScannedFunction(
+        name=function_node.name,
+        line=function_node.lineno,
+        drivers=sorted(function_analysis.drivers),
+        convertible=convertible,
+        reason=None if convertible else SESSIONS_NOT_BOUND,
+    )
+
+
+def scan_file(
+    file_path: Path, relative_path: str, stat: _FileStat, previous_sha256: Optional[str] = None
+) -> Optional[ScannedFile]:
+    """Find the measurement functions of a Python file.
+
+    Only the functions defined at the top level of the file are considered, as the converter
+    converts those.
+
+    Args:
+        file_path: Path of the Python file.
+        relative_path: Path of the file relative to the scanned directory.
+        stat: Modification time in nanoseconds and size of the file.
+        previous_sha256: SHA-256 digest of the file when it was scanned last.
+
+    Returns:
+        The scanned file, or None if its content is unchanged since it was scanned last.
+    """
+    try:
+        content = file_path.read_bytes()
+    except OSError as error:
+        return ScannedFile(
+            path=relative_path, sha256="", size=stat[1], mtime_ns=stat[0], error=str(error)
+        )
+
+    sha256 = hashlib.sha256(content).hexdigest()
+    if sha256 == previous_sha256:
+        return None
+
+    scanned_file = ScannedFile(path=relative_path, sha256=sha256, size=stat[1], mtime_ns=stat[0])
+
+    try:
+        # Parsing the bytes honors the encoding declaration of the file.
+        tree = ast.parse(content, filename=str(file_path))
+    except (SyntaxError, ValueError) as error:
+        scanned_file.error = str(error)
+        return scanned_file
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            scanned_function = _scan_function(node)
+            if scanned_function:
+                scanned_file.functions.append(scanned_function)
+
+    return scanned_file
+
+
+def _scan_files(
+    tasks: List[Tuple[Path, str, _FileStat, Optional[str]]], workers: Optional[int]
+) -> List[Optional[ScannedFile]]:
+    if len(tasks) < PARALLEL_PARSE_THRESHOLD or workers == 1:
+        return [scan_file(*task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(scan_file, *zip(*tasks), chunksize=PARSE_CHUNK_SIZE))
+
+
+def load_scan_index(index_path: Path) -> Optional[ScanIndex]:
+    """Load the index of a previous scan.
+
+    Args:
+        index_path: Path of the index.
+
+    Returns:
+        The index, or None if it does not exist, is invalid or was written by another version
+        of the converter or of the index.
+    """
+    try:
+        index = ScanIndex.model_validate_json(index_path.read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+    if index.index_version != INDEX_VERSION or index.converter_version != __version__:
+        return None
+
+    return index
+
+
+def write_scan_index(index: ScanIndex, index_path: Path) -> None:
+    """Write the index of a scan.
+
+    Args:
+        index: Index of the scan.
+        index_path: Path of the index.
+    """
+    write_file_atomically(index_path, index.model_dump_json(indent=2).encode(ENCODING))
+
+
+def scan_directory(
+    root: Path,
+    previous_index: Optional[ScanIndex] = None,
+    workers: Optional[int] = None,
+    excludes: Sequence[str] = (),
+) -> Tuple[ScanIndex, int]:
+    """Find the measurement functions in the Python files of a directory tree.
+
+    Files whose modification time and size are unchanged since the previous scan are not read.
+    Files whose content is unchanged are not parsed again. The other files are parsed in
+    parallel.
+
+    Args:
+        root: Directory to scan.
+        previous_index: Index of the previous scan of the directory.
+        workers: Number of worker processes that parse the files. Defaults to the number of
+            processors.
+        excludes: Name patterns of directories to skip.
+
+    Returns:
+        The index of the scan and the number of parsed files.
+    """
+    root = root.resolve()
+    previous_files: Dict[str, ScannedFile] = {}
+    if previous_index and previous_index.root == str(root):
+        previous_files = {scanned_file.path: scanned_file for scanned_file in previous_index.files}
+
+    scanned_files: Dict[str, ScannedFile] = {}
+    tasks: List[Tuple[Path, str, _FileStat, Optional[str]]] = []
+
+    for file_path, stat in find_python_files(root, excludes).items():
+        relative_path = file_path.relative_to(root).as_posix()
+        previous_file = previous_files.get(relative_path)
+
+        if previous_file and (previous_file.mtime_ns, previous_file.size) == stat:
+            scanned_files[relative_path] = previous_file
+        else:
+            previous_sha256 = previous_file.sha256 if previous_file else None
+            tasks.append((file_path, relative_path, stat, previous_sha256))
+
+    parsed_files = 0
+    for (_, relative_path, stat, _), scanned_file in zip(tasks, _scan_files(tasks, workers)):
+        if scanned_file is None:
+            scanned_file = previous_files[relative_path].model_copy(
+                update={"mtime_ns": stat[0], "size": stat[1]}
+            )
+        else:
+            parsed_files += 1
+
+        scanned_files[relative_path] = scanned_file
+
+    index = ScanIndex(
+        index_version=INDEX_VERSION,
+        converter_version=__version__,
+        root=str(root),
+        files=[scanned_files[path] for path in sorted(scanned_files)],
+    )
+
+    return index, parsed_files
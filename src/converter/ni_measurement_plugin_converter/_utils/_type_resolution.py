@@ -0,0 +1,380 @@
+"""Implementation of resolution of type annotations to supported data types."""
+
+import ast
+import builtins
+import sys
+import threading
+import typing
+from typing import Dict, Iterator, List, Optional, Set
+
+BUILTINS_MODULE = "builtins"
+TYPING_MODULE = "typing"
+TYPING_EXTENSIONS_MODULE = "typing_extensions"
+
+# Qualified names of the scalar types and their supported data types.
+SCALAR_TYPES = {
+    "builtins.int": "int",
+    "builtins.float": "float",
+    "builtins.str": "str",
+    "builtins.bool": "bool",
+    "numpy.int_": "int",
+    "numpy.intc": "int",
+    "numpy.int8": "int",
+    "numpy.int16": "int",
+    "numpy.int32": "int",
+    "numpy.int64": "int",
+    "numpy.float_": "float",
+    "numpy.double": "float",
+    "numpy.float16": "float",
+    "numpy.float32": "float",
+    "numpy.float64": "float",
+    "numpy.bool_": "bool",
+    "numpy.str_": "str",
+}
+# Qualified names of the generic types whose single argument is the type of their elements.
+SEQUENCE_TYPES = {
+    "builtins.list",
+    "typing.List",
+    "typing.Sequence",
+    "typing.MutableSequence",
+    "collections.abc.Sequence",
+    "collections.abc.MutableSequence",
+}
+TUPLE_TYPES = {"builtins.tuple", "typing.Tuple"}
+OPTIONAL_TYPE = "typing.Optional"
+UNION_TYPE = "typing.Union"
+ANNOTATED_TYPE = "typing.Annotated"
+NONE_TYPES = {"builtins.None", "types.NoneType"}
+NDARRAY_TYPE = "numpy.ndarray"
+NDARRAY_ALIAS_TYPE = "numpy.typing.NDArray"
+DTYPE_TYPE = "numpy.dtype"
+# Element type of arrays whose data type is not annotated.
+DEFAULT_ARRAY_ELEMENT_TYPE = "float"
+TYPE_ALIAS_TYPE = "typing.TypeAlias"
+ARRAY_TYPE = "List[{element_type}]"
+
+
+def _get_subscript_arguments(node: ast.Subscript) -> List[ast.expr]:
+    slice_value = node.slice
+
+    # Python 3.8 wraps the arguments of a subscript in an index node.
+    if sys.version_info < (3, 9) and isinstance(slice_value, ast.Index):
+        slice_value = slice_value.value  # type: ignore[attr-defined]
+
+    if isinstance(slice_value, ast.Tuple):
+        return list(slice_value.elts)
+
+    return [slice_value]
+
+
+def _iterate_module_statements(tree: ast.Module) -> Iterator[ast.stmt]:
+    # Imports and aliases may be conditional, such as those within `if TYPE_CHECKING:`, but
+    # those within functions and classes do not belong to the module.
+    scopes: List[List[ast.stmt]] = [tree.body]
+
+    while scopes:
+        for statement in scopes.pop():
+            yield statement
+
+            if isinstance(statement, ast.If):
+                scopes.extend([statement.body, statement.orelse])
+            elif isinstance(statement, ast.Try):
+                scopes.extend([statement.body, statement.orelse, statement.finalbody])
+                scopes.extend(handler.body for handler in statement.handlers)
+
+
+class TypeResolver:
+    """Resolver of the type annotations of a module to the supported data types.
+
+    The imports, aliases and definitions of the module are indexed in a single pass over its
+    statements, so annotations are resolved by the qualified names of the types they refer to
+    instead of by their spelling. For instance `list[int]`, `typing.List[int]`,
+    `Sequence[int]`, `Optional[List[int]]` and `numpy.typing.NDArray[numpy.int32]` all resolve
+    to `List[int]`. The resolved annotations are memoized by their structure.
+    """
+
+    def __init__(self, tree: ast.Module) -> None:
+        """Index the imports, aliases and definitions of a module.
+
+        Args:
+            tree: The code tree of the module.
+        """
+        self._imported_names: Dict[str, str] = {}
+        self._star_imported_modules: List[str] = []
+        self._aliases: Dict[str, ast.expr] = {}
+        self._defined_names: Set[str] = set()
+        self._resolved_types: Dict[str, Optional[str]] = {}
+        # The conversions of several functions of a module may share the resolver.
+        self._lock = threading.RLock()
+
+        for statement in _iterate_module_statements(tree):
+            self._index_statement(statement)
+
+    def _index_statement(self, statement: ast.stmt) -> None:
+        if isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.asname:
+                    self._imported_names[alias.asname] = alias.name
+                else:
+                    # `import numpy.typing` binds `numpy`.
+                    top_level_module = alias.name.split(".")[0]
+                    self._imported_names[top_level_module] = top_level_module
+
+        elif isinstance(statement, ast.ImportFrom) and statement.module and not statement.level:
+            for alias in statement.names:
+                if alias.name == "*":
+                    self._star_imported_modules.append(statement.module)
+                else:
+                    qualified_name = f"{statement.module}.{alias.name}"
+                    self._imported_names[alias.asname or alias.name] = qualified_name
+
+        elif isinstance(statement, ast.Assign):
+            if len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+                self._aliases[statement.targets[0].id] = statement.value
+
+        elif isinstance(statement, ast.AnnAssign):
+            if isinstance(statement.target, ast.Name) and statement.value is not None:
+                if self._get_qualified_name(statement.annotation) == TYPE_ALIAS_TYPE:
+                    self._aliases[statement.target.id] = statement.value
+
+        elif isinstance(statement, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            self._defined_names.add(statement.name)
+
+        # `type Alias = ...` statements of Python 3.12 and later versions.
+        elif type(statement).__name__ == "TypeAlias":
+            self._aliases[statement.name.id] = statement.value  # type: ignore[attr-defined]
+
+    def _get_qualified_name(self, node: ast.expr) -> Optional[str]:
+        if isinstance(node, ast.Constant) and node.value is None:
+            return f"{BUILTINS_MODULE}.None"
+
+        if isinstance(node, ast.Attribute):
+            base_name = self._get_qualified_name(node.value)
+            return f"{base_name}.{node.attr}" if base_name else None
+
+        if not isinstance(node, ast.Name):
+            return None
+
+        name = node.id
+        qualified_name = self._imported_names.get(name)
+
+        if qualified_name is None:
+            if name in self._defined_names or name in self._aliases:
+                return None
+
+            modules = self._star_imported_modules + [BUILTINS_MODULE, TYPING_MODULE]
+            module = next(
+                (module for module in modules if _module_defines(module, name)),
+                None,
+            )
+            if module is None:
+                return None
+
+            qualified_name = f"{module}.{name}"
+
+        if qualified_name.startswith(f"{TYPING_EXTENSIONS_MODULE}."):
+            qualified_name = TYPING_MODULE + qualified_name[len(TYPING_EXTENSIONS_MODULE) :]
+
+        return qualified_name
+
+    def resolve(self, annotation: Optional[ast.expr]) -> Optional[str]:
+        """Resolve a type annotation to a supported data type.
+
+        Args:
+            annotation: The type annotation.
+
+        Returns:
+            The supported data type, such as `float` or `List[float]`, or None if the
+            annotation is missing or its type is not supported.
+        """
+        if annotation is None:
+            return None
+
+        key = ast.dump(annotation)
+
+        with self._lock:
+            if key not in self._resolved_types:
+                # An alias whose elements refer to itself, such as `Alias = List["Alias"]`, is
+                # not supported.
+                self._resolved_types[key] = None
+                self._resolved_types[key] = self._resolve(annotation)
+
+            return self._resolved_types[key]
+
+    def resolve_elements(self, annotation: Optional[ast.expr]) -> Optional[List[Optional[str]]]:
+        """Resolve the types of the elements of a tuple type annotation.
+
+        Args:
+            annotation: The type annotation, such as the return annotation of a function.
+
+        Returns:
+            The supported data type of each element, or None for the elements whose type is not
+            supported. None if the annotation is not a tuple of a fixed number of elements.
+        """
+        annotation = self._unwrap(annotation)
+        if not isinstance(annotation, ast.Subscript):
+            return None
+
+        arguments = _get_subscript_arguments(annotation)
+        if self._get_qualified_name(annotation.value) not in TUPLE_TYPES or _is_variadic(arguments):
+            return None
+
+        return [self.resolve(argument) for argument in arguments]
+
+    def resolve_array_dtype(self, annotation: Optional[ast.expr]) -> Optional[str]:
+        """Resolve the data type of the elements of a NumPy array type annotation.
+
+        The measurement service passes arrays as lists, so the data type is used to convert the
+        lists to the NumPy arrays that the measurement function expects.
+
+        Args:
+            annotation: The type annotation.
+
+        Returns:
+            The data type of the elements as Python code, such as `float` or `numpy.int32`, or
+            None if the annotation is not a NumPy array of a supported data type.
+        """
+        unwrapped_annotation = self._unwrap(annotation)
+        if unwrapped_annotation is None:
+            return None
+
+        if not isinstance(unwrapped_annotation, ast.Subscript):
+            if self._get_qualified_name(unwrapped_annotation) in (NDARRAY_TYPE, NDARRAY_ALIAS_TYPE):
+                return DEFAULT_ARRAY_ELEMENT_TYPE
+
+            return None
+
+        generic_type = self._get_qualified_name(unwrapped_annotation.value)
+        arguments = _get_subscript_arguments(unwrapped_annotation)
+        element_annotation = None
+
+        if generic_type == NDARRAY_ALIAS_TYPE and len(arguments) == 1:
+            element_annotation = arguments[0]
+        elif generic_type == NDARRAY_TYPE and len(arguments) == 2:
+            element_annotation = self._get_dtype_argument(arguments[1])
+
+        element_annotation = self._unwrap(element_annotation)
+        if element_annotation is None:
+            return None
+
+        element_type = self._get_qualified_name(element_annotation)
+        if element_type not in SCALAR_TYPES:
+            return None
+
+        module, name = element_type.rsplit(".", 1)
+        return name if module == BUILTINS_MODULE else element_type
+
+    def _unwrap(self, annotation: Optional[ast.expr]) -> Optional[ast.expr]:
+        # Returns the annotation that an alias, a string, `Optional` or `Annotated` stands for.
+        unwrapped_aliases: Set[str] = set()
+
+        while annotation is not None:
+            if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+                annotation = _parse_annotation(annotation.value)
+
+            elif isinstance(annotation, ast.Name) and annotation.id in self._aliases:
+                # An alias that refers to itself does not stand for a type.
+                if annotation.id in unwrapped_aliases:
+                    return None
+
+                unwrapped_aliases.add(annotation.id)
+                annotation = self._aliases[annotation.id]
+
+            elif isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+                optional_member = self._get_optional_member([annotation.left, annotation.right])
+                if optional_member is None:
+                    return annotation
+
+                annotation = optional_member
+
+            elif isinstance(annotation, ast.Subscript):
+                generic_type = self._get_qualified_name(annotation.value)
+                arguments = _get_subscript_arguments(annotation)
+
+                if generic_type in (OPTIONAL_TYPE, ANNOTATED_TYPE):
+                    annotation = arguments[0]
+                elif generic_type == UNION_TYPE:
+                    annotation = self._get_optional_member(arguments)
+                else:
+                    return annotation
+
+            else:
+                return annotation
+
+        return None
+
+    def _get_optional_member(self, members: List[ast.expr]) -> Optional[ast.expr]:
+        # `Union[X, None]` and `X | None` stand for `X`.
+        other_members = [
+            member for member in members if self._get_qualified_name(member) not in NONE_TYPES
+        ]
+        return other_members[0] if len(other_members) == 1 else None
+
+    def _resolve(self, annotation: ast.expr) -> Optional[str]:
+        unwrapped_annotation = self._unwrap(annotation)
+
+        if isinstance(unwrapped_annotation, ast.Subscript):
+            return self._resolve_generic(unwrapped_annotation)
+
+        if unwrapped_annotation is None:
+            return None
+
+        qualified_name = self._get_qualified_name(unwrapped_annotation)
+        if qualified_name in (NDARRAY_TYPE, NDARRAY_ALIAS_TYPE):
+            return ARRAY_TYPE.format(element_type=DEFAULT_ARRAY_ELEMENT_TYPE)
+
+        return SCALAR_TYPES.get(qualified_name or "")
+
+    def _resolve_generic(self, annotation: ast.Subscript) -> Optional[str]:
+        generic_type = self._get_qualified_name(annotation.value)
+        arguments = _get_subscript_arguments(annotation)
+        element_annotation = None
+
+        if generic_type in SEQUENCE_TYPES and len(arguments) == 1:
+            element_annotation = arguments[0]
+        elif generic_type in TUPLE_TYPES and _is_variadic(arguments):
+            element_annotation = arguments[0]
+        elif generic_type == NDARRAY_ALIAS_TYPE and len(arguments) == 1:
+            element_annotation = arguments[0]
+        elif generic_type == NDARRAY_TYPE and len(arguments) == 2:
+            element_annotation = self._get_dtype_argument(arguments[1])
+
+        element_type = self.resolve(element_annotation)
+        if element_type not in SCALAR_TYPES.values():
+            return None
+
+        return ARRAY_TYPE.format(element_type=element_type)
+
+    def _get_dtype_argument(self, annotation: ast.expr) -> Optional[ast.expr]:
+        # `numpy.ndarray[Shape, numpy.dtype[Element]]`.
+        if isinstance(annotation, ast.Subscript):
+            if self._get_qualified_name(annotation.value) == DTYPE_TYPE:
+                return _get_subscript_arguments(annotation)[0]
+
+        return None
+
+
+def _is_variadic(arguments: List[ast.expr]) -> bool:
+    # `Tuple[X, ...]` is a sequence of any number of `X`.
+    return (
+        len(arguments) == 2
+        and isinstance(arguments[1], ast.Constant)
+        and arguments[1].value is Ellipsis
+    )
+
+
+def _parse_annotation(annotation: str) -> Optional[ast.expr]:
+    try:
+        return ast.parse(annotation.strip(), mode="eval").body
+    except SyntaxError:
+        return None
+
+
+def _module_defines(module: str, name: str) -> bool:
+    # Star imports of other modules are not followed, as importing them may have side effects.
+    if module == BUILTINS_MODULE:
+        return hasattr(builtins, name)
+    if module in (TYPING_MODULE, TYPING_EXTENSIONS_MODULE):
+        return hasattr(typing, name)
+
+    return False
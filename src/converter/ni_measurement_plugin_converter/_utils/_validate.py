@@ -0,0 +1,93 @@
+"""Implementation of validation of the conversion inputs."""
+
+from pathlib import Path
+
+import click
+
+from ni_measurement_plugin_converter._constants import TAR_GZ_EXTENSIONS, ZIP_EXTENSION
+from ni_measurement_plugin_converter._utils._analysis_context import AnalysisContext
+
+INVALID_FILE_DIR = "Invalid measurement file path. Please provide valid measurement file path."
+FUNCTION_NOT_FOUND = "Measurement function {function} not found in the file {measurement_file_path}"
+INVALID_ARCHIVE = "Invalid archive path. Supported formats: {formats}"
+INVALID_SCAN_DIR = "Invalid directory path. Please provide a valid directory to scan."
+
+
+def validate_measurement_file(file_path: Path) -> None:
+    """Validate the measurement file path.
+
+    Args:
+        file_path: Path of the measurement file.
+
+    Raises:
+        click.BadParameter: If the measurement file does not exist.
+    """
+    if not file_path.exists() or not file_path.is_file():
+        raise click.BadParameter(INVALID_FILE_DIR)
+
+
+def validate_function(function_name: str, analysis_context: AnalysisContext) -> None:
+    """Validate that the measurement function is defined in the measurement file.
+
+    Args:
+        function_name: Name of the measurement function.
+        analysis_context: Parsed measurement source.
+
+    Raises:
+        click.BadParameter: If the measurement function is not found.
+    """
+    if not analysis_context.has_function(function_name):
+        raise click.BadParameter(
+            FUNCTION_NOT_FOUND.format(
+                function=function_name, measurement_file_path=analysis_context.file_path
+            )
+        )
+
+
+def validate_output_directory(output_dir: Path) -> None:
+    """Create the output directory if it does not exist.
+
+    Args:
+        output_dir: Output directory for measurement plug-in files.
+
+    Raises:
+        click.BadParameter: If the output directory cannot be created or accessed.
+    """
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    except PermissionError:
+        raise click.BadParameter(
+            "Permission denied: Unable to create or access the output directory."
+        )
+    except OSError as e:
+        raise click.BadParameter(f"An error occurred: {e}")
+
+
+def validate_archive_path(archive_path: Path) -> None:
+    """Validate the archive path and create its directory if it does not exist.
+
+    Args:
+        archive_path: Path of the archive of the measurement plug-ins.
+
+    Raises:
+        click.BadParameter: If the archive format is unsupported or its directory cannot be
+            created or accessed.
+    """
+    formats = [ZIP_EXTENSION] + TAR_GZ_EXTENSIONS
+    if not any(archive_path.name.lower().endswith(extension) for extension in formats):
+        raise click.BadParameter(INVALID_ARCHIVE.format(formats=formats))
+
+    validate_output_directory(archive_path.parent)
+
+
+def validate_scan_directory(directory: Path) -> None:
+    """Validate the directory to scan for measurement functions.
+
+    Args:
+        directory: Directory to scan.
+
+    Raises:
+        click.BadParameter: If the directory does not exist.
+    """
+    if not directory.is_dir():
+        raise click.BadParameter(INVALID_SCAN_DIR)
@@ -0,0 +1,186 @@
+"""Implementation of watching a measurement for changes."""
+
+import ast
+import time
+from logging import Logger
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from ni_measurement_plugin_converter._constants import ENCODING
+from ni_measurement_plugin_converter._utils._analysis_context import AnalysisContext
+
+POLL_INTERVAL_IN_SECONDS = 0.5
+DEBOUNCE_INTERVAL_IN_SECONDS = 0.3
+PYTHON_FILE_EXTENSION = ".py"
+PACKAGE_FILE_NAME = "__init__.py"
+
+WATCHING_FILES = "Watching {count} files for changes. Press Ctrl+C to stop."
+FILES_CHANGED = "Detected changes in {file_names}. Converting..."
+CONVERSION_FAILED = "Failed to convert the measurement: {error}"
+WATCH_STOPPED = "Stopped watching for changes."
+
+_FileState = Optional[Tuple[int, int]]
+
+
+def _resolve_module(module_name: str, base_dir: Path) -> Optional[Path]:
+    module_path = base_dir.joinpath(*module_name.split("."))
+
+    for candidate in (
+        module_path.with_name(module_path.name + PYTHON_FILE_EXTENSION),
+        module_path / PACKAGE_FILE_NAME,
+    ):
+        if candidate.is_file():
+            return candidate
+
+    return None
+
+
+def _get_imported_module_names(tree: ast.Module, file_path: Path) -> List[Tuple[str, Path]]:
+    module_names: List[Tuple[str, Path]] = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            module_names += [(alias.name, file_path.parent) for alias in node.names]
+
+        elif isinstance(node, ast.ImportFrom):
+            base_dir = file_path.parent
+            for _ in range(max(node.level - 1, 0)):
+                base_dir = base_dir.parent
+
+            # The imported names may be modules of the package, e.g. `from . import helpers`.
+            prefix = f"{node.module}." if node.module else ""
+            if node.module:
+                module_names.append((node.module, base_dir))
+            module_names += [(prefix + alias.name, base_dir) for alias in node.names]
+
+    return module_names
+
+
+def get_watched_files(analysis_context: AnalysisContext) -> List[Path]:
+    """Get the measurement file and the local modules it imports, directly or indirectly.
+
+    Local modules are the modules that are found relative to the directory of the measurement
+    file. Installed packages are not watched.
+
+    Args:
+        analysis_context: Parsed measurement source read from a file.
+
+    Returns:
+        Paths of the watched files, starting with the measurement file.
+    """
+    if analysis_context.file_path is None:
+        return []
+
+    measurement_file_path = analysis_context.file_path.resolve()
+    watched_files = [measurement_file_path]
+    visited: Set[Path] = {measurement_file_path}
+    pending = [(analysis_context.tree, measurement_file_path)]
+
+    while pending:
+        tree, file_path = pending.pop()
+
+        for module_name, base_dir in _get_imported_module_names(tree, file_path):
+            module_path = _resolve_module(module_name, base_dir)
+            if module_path is None or module_path.resolve() in visited:
+                continue
+
+            module_path = module_path.resolve()
+            visited.add(module_path)
+            watched_files.append(module_path)
+
+            try:
+                pending.append((ast.parse(module_path.read_text(encoding=ENCODING)), module_path))
+            except (OSError, SyntaxError, ValueError):
+                # The module is still watched, so that it is parsed again once it is fixed.
+                continue
+
+    return watched_files
+
+
+def _get_file_states(file_paths: List[Path]) -> Dict[Path, _FileState]:
+    states: Dict[Path, _FileState] = {}
+
+    for file_path in file_paths:
+        try:
+            stat = file_path.stat()
+            states[file_path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            # The file may be missing while an editor replaces it.
+            states[file_path] = None
+
+    return states
+
+
+def _wait_for_changes(
+    states: Dict[Path, _FileState], poll_interval: float, debounce_interval: float
+) -> Dict[Path, _FileState]:
+    file_paths = list(states)
+
+    while True:
+        time.sleep(poll_interval)
+        changed_states = _get_file_states(file_paths)
+        if changed_states != states:
+            break
+
+    # Wait until the files stop changing, e.g. while an editor saves several files.
+    while True:
+        time.sleep(debounce_interval)
+        latest_states = _get_file_states(file_paths)
+        if latest_states == changed_states:
+            return latest_states
+
+        changed_states = latest_states
+
+
+def watch_measurement(
+    analysis_context: AnalysisContext,
+    convert: Callable[[AnalysisContext], None],
+    logger: Logger,
+    poll_interval: float = POLL_INTERVAL_IN_SECONDS,
+    debounce_interval: float = DEBOUNCE_INTERVAL_IN_SECONDS,
+) -> None:
+    """Convert the measurement again whenever it or a local module it imports changes.
+
+    The files are polled for changes of their modification time or size. A conversion starts
+    once the files have not changed for the debounce interval, so that a burst of changes
+    leads to a single conversion. Errors of a conversion are logged and the files are watched
+    again. Watching stops on a keyboard interrupt.
+
+    Args:
+        analysis_context: Parsed measurement source read from a file.
+        convert: Callback that converts the measurement from its parsed source.
+        logger: Logger instance.
+        poll_interval: Interval between polls of the files, in seconds.
+        debounce_interval: Time the files must stay unchanged before a conversion, in seconds.
+    """
+    measurement_file_path = analysis_context.file_path
+    if measurement_file_path is None:
+        return
+
+    watched_files = get_watched_files(analysis_context)
+    states = _get_file_states(watched_files)
+    logger.info(WATCHING_FILES.format(count=len(watched_files)))
+
+    try:
+        while True:
+            changed_states = _wait_for_changes(states, poll_interval, debounce_interval)
+            changed_files = [path for path in watched_files if changed_states[path] != states[path]]
+            logger.info(FILES_CHANGED.format(file_names=[path.name for path in changed_files]))
+
+            try:
+                analysis_context = AnalysisContext.from_file(measurement_file_path)
+                convert(analysis_context)
+                # The imports of the measurement may have changed.
+                watched_files = get_watched_files(analysis_context)
+
+            except Exception as error:
+                logger.debug(error, exc_info=True)
+                logger.error(CONVERSION_FAILED.format(error=error))
+
+            # Keep the states that were converted, so that changes made during the conversion
+            # trigger another conversion.
+            states = _get_file_states(watched_files)
+            states.update({path: state for path, state in changed_states.items() if path in states})
+
+    except KeyboardInterrupt:
+        logger.info(WATCH_STOPPED)
@@ -3,34 +3,37 @@
 from pathlib import Path
 from typing import Any
 
-from mako.template import Template
+from ni_measurement_plugin_ui_creator.utils.file_writer import write_file_atomically
+from ni_measurement_plugin_ui_creator.utils.template_lookup import render_template
 
-from ni_measurement_plugin_converter._constants import ENCODING
+from ni_measurement_plugin_converter._utils._cache import get_cache_directory
 
 TEMPLATE_DIR = "templates"
 
 
-def _render_template(template_name: str, **template_args: Any) -> bytes:
-    file_dir = str(Path(__file__).parent.parent / TEMPLATE_DIR / template_name)
+def render_file(template_name: str, **template_args: Any) -> bytes:
+    """Render a template with provided arguments.
 
-    template = Template(  # nosec: B702
-        filename=file_dir,
-        input_encoding=ENCODING,
-        output_encoding=ENCODING,
-    )
+    Args:
+        template_name: The name of the template file to render.
+        **template_args: Arguments to pass to the template during rendering.
 
-    return template.render(**template_args)
+    Returns:
+        Rendered content of the file.
+    """
+    template_dir = Path(__file__).parent.parent / TEMPLATE_DIR
+    return render_template(template_dir, get_cache_directory(), template_name, **template_args)
 
 
 def create_file(template_name: str, file_path: Path, **template_args: Any) -> None:
     """Create a file by rendering a template with provided arguments.
 
+    The file is written atomically and is not written if its content is unchanged.
+
     Args:
         template_name: The name of the template file to render.
         file_path: The path to the output file.
         **template_args: Arguments to pass to the template during rendering.
     """
-    output = _render_template(template_name, **template_args)
-
-    with open(file_path, "wb") as f:
-        f.write(output)
+    output = render_file(template_name, **template_args)
+    write_file_atomically(file_path, output)
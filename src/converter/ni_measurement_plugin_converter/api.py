@@ -0,0 +1,114 @@
+"""Programmatic interface of the NI Measurement Plug-In Converter.
+
+The interface converts measurements in memory, so that it can be embedded in a long-lived
+process, such as a build service, without writing the measurement plug-in files to disk.
+"""
+
+import threading
+from contextlib import nullcontext
+from logging import getLogger
+from pathlib import Path
+from typing import Optional, Union
+
+from ni_measurement_plugin_converter._constants import DEBUG_LOGGER
+from ni_measurement_plugin_converter._models import (
+    ConversionProfile,
+    ConversionResult,
+    InputInfo,
+    OutputInfo,
+    PinInfo,
+    RelayInfo,
+)
+from ni_measurement_plugin_converter._utils import (
+    AnalysisContext,
+    ConversionStage,
+    FormattingPolicy,
+    Profiler,
+    generate_measurement_plugin,
+)
+
+__all__ = [
+    "ConversionProfile",
+    "ConversionResult",
+    "FormattingPolicy",
+    "InputInfo",
+    "OutputInfo",
+    "PinInfo",
+    "RelayInfo",
+    "convert",
+]
+
+MEASUREMENT_SOURCE_REQUIRED = (
+    "Either the source code or the path of the measurement file is required, but not both."
+)
+
+# `tracemalloc` traces the memory of the whole process, so conversions that trace memory run one
+# at a time.
+_trace_memory_lock = threading.Lock()
+
+
+def convert(
+    display_name: str,
+    function: str,
+    source_code: Optional[str] = None,
+    measurement_file_path: Optional[Union[str, Path]] = None,
+    formatting: Union[FormattingPolicy, str] = FormattingPolicy.FUNCTION_ONLY,
+    trace_memory: bool = False,
+) -> ConversionResult:
+    """Convert a Python measurement function to a measurement plug-in in memory.
+
+    The measurement plug-in files are returned by file name instead of being written to an
+    output directory. Errors are raised instead of being logged. Warnings, such as inputs and
+    outputs that are skipped because their data types are unsupported, are returned with the
+    result. The conversion is thread-safe, so several measurements can be converted at once.
+    Conversions that trace memory run one at a time, as memory is traced for the whole process,
+    and their peak memory includes the memory allocated by other threads meanwhile.
+
+    Args:
+        display_name: Display name for the measurement plug-in.
+        function: Name of the measurement function.
+        source_code: Source code of the measurement.
+        measurement_file_path: Path of the measurement file, if the source code is not given.
+        formatting: Formatting policy of the migrated file.
+        trace_memory: Whether to profile the peak memory of the stages, which slows down the
+            conversion.
+
+    Returns:
+        The generated files, the information extracted from the measurement, the warnings and
+        the profile of the stages of the conversion.
+
+    Raises:
+        ValueError: If neither or both of the source code and the measurement file path are
+            given, if the function is not found or if it does not use a supported driver.
+        SyntaxError: If the measurement cannot be parsed.
+        OSError: If the measurement file cannot be read.
+    """
+    if (source_code is None) == (measurement_file_path is None):
+        raise ValueError(MEASUREMENT_SOURCE_REQUIRED)
+
+    logger = getLogger(DEBUG_LOGGER)
+
+    with _trace_memory_lock if trace_memory else nullcontext():
+        profiler = Profiler(trace_memory=trace_memory)
+
+        try:
+            with profiler.profile_stage(ConversionStage.VALIDATION):
+                if measurement_file_path is not None:
+                    analysis_context = AnalysisContext.from_file(Path(measurement_file_path))
+                else:
+                    analysis_context = AnalysisContext(source_code or "")
+
+            result = generate_measurement_plugin(
+                display_name=display_name,
+                function=function,
+                analysis_context=analysis_context,
+                logger=logger,
+                formatting=FormattingPolicy(formatting),
+                profiler=profiler,
+            )
+            profile = profiler.get_profile()
+
+        finally:
+            profiler.stop()
+
+    return result.model_copy(update={"profile": profile})
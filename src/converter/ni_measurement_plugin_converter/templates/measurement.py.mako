@@ -7,6 +7,9 @@ from typing import List
 
 import click
 import ni_measurement_plugin_sdk_service as nims
+% if any(input_info.array_dtype for input_info in inputs_info):
+import numpy
+% endif
 from ${migrated_file} import ${function_name}
 
 script_or_exe = sys.executable if getattr(sys, "frozen", False) else __file__
@@ -1,19 +1,40 @@
 """Implementation of command line interface of Measurement Plug-in UI Creator."""
 
+import functools
+from logging import getLogger
 from pathlib import Path
-from typing import Callable
+from typing import Callable, List, Optional, Sequence, Tuple
 
 import click
 
+from ni_measurement_plugin_ui_creator.constants import LOGGER
+from ni_measurement_plugin_ui_creator.models import MeasUIResult
+from ni_measurement_plugin_ui_creator.utils.bulk_measui import (
+    create_or_update_measuis,
+    create_or_update_measuis_offline,
+)
 from ni_measurement_plugin_ui_creator.utils.create_measui import create_measui
-from ni_measurement_plugin_ui_creator.utils.exceptions import InvalidCliInputError
+from ni_measurement_plugin_ui_creator.utils.exceptions import (
+    InvalidCliInputError,
+    MeasUICreatedError,
+)
 from ni_measurement_plugin_ui_creator.utils.logger import get_logger
 from ni_measurement_plugin_ui_creator.utils.measui_file import get_metadata_and_service_class
 from ni_measurement_plugin_ui_creator.utils.update_measui import update_measui
 
+BULK_SUMMARY = "{succeeded} of {total} measurement UIs created/updated successfully."
+BULK_CREATED_INSTEAD = "{count} measurement UIs created instead of updated."
 CLI_CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 ERROR_OCCURRED = "Error occurred. Please find the log file at {log_file}."
 GET_ACTIVE_MEASUREMENTS = "Getting the active measurements..."
+MEASUI_FILE_REQUIRES_SINGLE_MEASUREMENT = (
+    "--measui-file requires a single measurement selected using --service-class, "
+    "--display-name, --metadata-file or --measurement-module."
+)
+OFFLINE_SOURCES_WITH_SELECTION = (
+    "--metadata-file and --measurement-module cannot be used with --service-class, "
+    "--display-name or --all."
+)
 PROCESS_COMPLETED = "Process completed."
 START_CLI = "Starting the NI Measurement Plug-In UI Creator..."
 SUPPORTED_ELEMENTS = "Supported UI Elements: {elements}"
@@ -32,8 +53,29 @@ SUPPORTED_UI_ELEMENTS = [
 ]
 
 
-def _create_or_update_ui(process_func: Callable) -> None:
-    """Create or update `measui` file."""
+def _create_or_update_ui(
+    process_func: Callable,
+    service_classes: Sequence[str] = (),
+    display_names: Sequence[str] = (),
+    all_services: bool = False,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    metadata_files: Sequence[str] = (),
+    measurement_modules: Sequence[str] = (),
+) -> bool:
+    """Create or update `measui` file.
+
+    The measurement is prompted for unless measurements are selected by service class, by
+    display name or all at once, in which case their `measui` files are created or updated
+    in bulk. The metadata of the measurements is restored from the cache unless `use_cache`
+    is False. If metadata files or measurement modules are specified, the `measui` files are
+    created or updated from them in bulk, without the measurement services.
+
+    Returns:
+        True if the `measui` files are created or updated successfully. Else False.
+    """
+    succeeded = False
+
     try:
         output_dir = Path.cwd()
         log_file_path = Path(output_dir) / "ui_creator_logs"
@@ -42,13 +84,42 @@ def _create_or_update_ui(process_func: Callable) -> None:
         logger.info(START_CLI)
         logger.info(SUPPORTED_ELEMENTS.format(elements=SUPPORTED_UI_ELEMENTS))
 
+        if metadata_files or measurement_modules:
+            results = create_or_update_measuis_offline(
+                process_func,
+                output_dir,
+                metadata_files=metadata_files,
+                measurement_modules=measurement_modules,
+                workers=workers,
+            )
+            return _log_summary(results)
+
         logger.info(GET_ACTIVE_MEASUREMENTS)
-        metadata_and_service_class = get_metadata_and_service_class()
+
+        if service_classes or display_names or all_services:
+            results = create_or_update_measuis(
+                process_func,
+                output_dir,
+                service_classes=service_classes,
+                display_names=display_names,
+                all_services=all_services,
+                workers=workers,
+                use_cache=use_cache,
+            )
+            return _log_summary(results)
+
+        metadata_and_service_class = get_metadata_and_service_class(use_cache)
 
         if not metadata_and_service_class:
-            return
+            return False
 
         process_func(metadata_and_service_class[0], metadata_and_service_class[1], output_dir)
+        succeeded = True
+
+    except MeasUICreatedError as error:
+        # A measurement UI is still created for the prompted measurement.
+        logger.warning(error.message)
+        succeeded = True
 
     except InvalidCliInputError as error:
         logger.error(error)
@@ -60,17 +131,174 @@ def _create_or_update_ui(process_func: Callable) -> None:
     finally:
         logger.info(PROCESS_COMPLETED)
 
+    return succeeded
+
+
+def _log_summary(results: List[MeasUIResult]) -> bool:
+    succeeded = sum(result.succeeded for result in results)
+    logger = getLogger(LOGGER)
+    logger.info(BULK_SUMMARY.format(succeeded=succeeded, total=len(results)))
+
+    created = sum(result.created_instead_of_updated for result in results)
+    if created:
+        logger.warning(BULK_CREATED_INSTEAD.format(count=created))
+
+    return succeeded == len(results)
+
+
+def _validate_sources(
+    service_classes: Sequence[str],
+    display_names: Sequence[str],
+    all_services: bool,
+    metadata_files: Sequence[str],
+    measurement_modules: Sequence[str],
+) -> None:
+    if (metadata_files or measurement_modules) and (
+        service_classes or display_names or all_services
+    ):
+        raise click.UsageError(OFFLINE_SOURCES_WITH_SELECTION)
+
+
+def _common_options(func: Callable) -> Callable:
+    options = [
+        click.option(
+            "-s",
+            "--service-class",
+            "service_classes",
+            multiple=True,
+            help="Service class of a measurement to be processed without prompting. "
+            "Can be repeated.",
+        ),
+        click.option(
+            "-n",
+            "--display-name",
+            "display_names",
+            multiple=True,
+            help="Display name of a measurement to be processed without prompting. "
+            "Can be repeated.",
+        ),
+        click.option(
+            "-a",
+            "--all",
+            "all_services",
+            is_flag=True,
+            help="Process all registered measurements without prompting.",
+        ),
+        click.option(
+            "-w",
+            "--workers",
+            type=click.IntRange(min=1),
+            help="Number of worker threads used to process several measurements.",
+        ),
+        click.option(
+            "--metadata-file",
+            "metadata_files",
+            multiple=True,
+            type=click.Path(exists=True, dir_okay=False),
+            help="Serialized GetMetadataResponse of a measurement, in the binary or, with the "
+            ".json extension, the JSON protobuf format, to be processed without the "
+            "measurement service. Can be repeated.",
+        ),
+        click.option(
+            "--measurement-module",
+            "measurement_modules",
+            multiple=True,
+            type=click.Path(exists=True, dir_okay=False),
+            help="Python measurement module, such as measurement.py, whose measurements are "
+            "processed without the measurement services. Can be repeated.",
+        ),
+        click.option(
+            "--refresh",
+            is_flag=True,
+            help="Fetch the metadata of the measurements from the measurement services even if "
+            "it is cached.",
+        ),
+    ]
+
+    for option in reversed(options):
+        func = option(func)
+
+    return func
+
 
 @click.command(name="create")
-def _create() -> None:
+@_common_options
+@click.pass_context
+def _create(
+    ctx: click.Context,
+    service_classes: Tuple[str, ...],
+    display_names: Tuple[str, ...],
+    all_services: bool,
+    workers: Optional[int],
+    metadata_files: Tuple[str, ...],
+    measurement_modules: Tuple[str, ...],
+    refresh: bool,
+) -> None:
     """Create a new measurement UI file."""
-    _create_or_update_ui(create_measui)
+    _validate_sources(
+        service_classes, display_names, all_services, metadata_files, measurement_modules
+    )
+
+    if not _create_or_update_ui(
+        create_measui,
+        service_classes=service_classes,
+        display_names=display_names,
+        all_services=all_services,
+        workers=workers,
+        use_cache=not refresh,
+        metadata_files=metadata_files,
+        measurement_modules=measurement_modules,
+    ):
+        ctx.exit(1)
 
 
 @click.command(name="update")
-def _update() -> None:
+@_common_options
+@click.option(
+    "-m",
+    "--measui-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Measurement UI file to be updated, instead of the file registered by the "
+    "measurement. Requires a single measurement selected using --service-class, "
+    "--display-name, --metadata-file or --measurement-module.",
+)
+@click.pass_context
+def _update(
+    ctx: click.Context,
+    service_classes: Tuple[str, ...],
+    display_names: Tuple[str, ...],
+    all_services: bool,
+    workers: Optional[int],
+    metadata_files: Tuple[str, ...],
+    measurement_modules: Tuple[str, ...],
+    refresh: bool,
+    measui_file: Optional[str],
+) -> None:
     """Update the measurement UI file."""
-    _create_or_update_ui(update_measui)
+    _validate_sources(
+        service_classes, display_names, all_services, metadata_files, measurement_modules
+    )
+
+    sources = [*service_classes, *display_names, *metadata_files, *measurement_modules]
+    if measui_file and (all_services or len(sources) != 1):
+        raise click.UsageError(MEASUI_FILE_REQUIRES_SINGLE_MEASUREMENT)
+
+    interactive = not (sources or all_services)
+    process_func = functools.partial(
+        update_measui, measui_file_path=measui_file, interactive=interactive
+    )
+
+    if not _create_or_update_ui(
+        process_func,
+        service_classes=service_classes,
+        display_names=display_names,
+        all_services=all_services,
+        workers=workers,
+        use_cache=not refresh,
+        metadata_files=metadata_files,
+        measurement_modules=measurement_modules,
+    ):
+        ctx.exit(1)
 
 
 @click.group(context_settings=CLI_CONTEXT_SETTINGS)
@@ -58,3 +58,14 @@ class AvailableElement(BaseModel):
         """To allow non pydantic types."""
 
         arbitrary_types_allowed = True
+
+
+class MeasUIResult(BaseModel):
+    """Result of creating or updating the UI of a measurement plug-in in bulk."""
+
+    service_class: str
+    display_name: str
+    succeeded: bool
+    measui_file_path: Optional[str] = None
+    error: Optional[str] = None
+    created_instead_of_updated: bool = False
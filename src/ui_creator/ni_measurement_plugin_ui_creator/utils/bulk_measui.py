@@ -0,0 +1,277 @@
+"""Implementation of creating or updating measurement plug-in UIs in bulk."""
+
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from grpc._channel import _InactiveRpcError
+from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measurement.v1.measurement_service_pb2 import (
+    GetMetadataResponse as V1MetaData,
+)
+from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measurement.v2.measurement_service_pb2 import (
+    GetMetadataResponse as V2MetaData,
+)
+from ni_measurement_plugin_sdk_service.measurement.info import ServiceInfo
+
+from ni_measurement_plugin_ui_creator.constants import LOGGER
+from ni_measurement_plugin_ui_creator.models import MeasUIResult
+from ni_measurement_plugin_ui_creator.utils.client import (
+    create_channel_pool,
+    create_discovery_client,
+    get_active_measurement_services,
+    select_measurement_services,
+)
+from ni_measurement_plugin_ui_creator.utils.exceptions import (
+    InvalidCliInputError,
+    MeasUICreatedError,
+)
+from ni_measurement_plugin_ui_creator.utils.measui_file import get_metadata
+from ni_measurement_plugin_ui_creator.utils.offline_metadata import (
+    load_measurement_module,
+    load_metadata_file,
+)
+
+DEFAULT_WORKERS = 8
+
+INACTIVE_MEASUREMENT = "Measurement service is not running."
+MEASUREMENT_NOT_REGISTERED = "No registered measurement service matches '{name}'."
+MEASUI_CREATED_INSTEAD = "Did not update the UI of '{display_name}': {error}"
+MEASUI_FAILED = "Failed to create/update the UI of '{display_name}': {error}"
+MEASUI_SUCCEEDED = "Created/updated the UI of '{display_name}' at {filepath}."
+NO_MEASUREMENTS_SELECTED = "No registered measurement services match the selection."
+PROCESSING_MEASUREMENTS = "Creating/updating the UIs of {count} measurement services..."
+
+
+def create_or_update_measuis(
+    process_func: Callable[..., Optional[Path]],
+    output_dir: Path,
+    service_classes: Sequence[str] = (),
+    display_names: Sequence[str] = (),
+    all_services: bool = False,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> List[MeasUIResult]:
+    """Create or update the UIs of several registered measurement plug-ins without prompting.
+
+    The metadata of the measurement plug-ins is fetched and their UIs are created or updated
+    concurrently, each in a worker thread. The measurement plug-ins at the same address share
+    a channel, which is closed once all UIs are created or updated.
+
+    Args:
+        process_func: Function that creates or updates the UI of a measurement plug-in from its
+            metadata, service class and output directory, and returns the path of the UI file.
+        output_dir: Output directory of the measurement plug-in UI files.
+        service_classes: Service class names of the measurement plug-ins.
+        display_names: Display names of the measurement plug-ins.
+        all_services: Whether to create or update the UIs of all registered measurement
+            plug-ins.
+        workers: Number of worker threads. Defaults to the number of measurement plug-ins, up
+            to `DEFAULT_WORKERS`.
+        use_cache: Whether to restore the metadata of the measurement plug-ins from the cache
+            if it is cached.
+
+    Returns:
+        The result for each selected measurement plug-in and for each service class or display
+        name that does not match a registered measurement plug-in.
+
+    Raises:
+        InvalidCliInputError: If no registered measurement plug-in is selected.
+    """
+    logger = getLogger(LOGGER)
+
+    with create_channel_pool() as channel_pool:
+        discovery_client = create_discovery_client(channel_pool)
+
+        available_services = get_active_measurement_services(discovery_client)
+        if all_services:
+            selected_services = available_services
+            unmatched_names: List[str] = []
+        else:
+            selected_services, unmatched_names = select_measurement_services(
+                available_services, service_classes, display_names
+            )
+
+        results = [
+            _failed_result(name, name, MEASUREMENT_NOT_REGISTERED.format(name=name))
+            for name in unmatched_names
+        ]
+        for result in results:
+            _log_result(result)
+
+        if not selected_services:
+            raise InvalidCliInputError(NO_MEASUREMENTS_SELECTED)
+
+        logger.info(PROCESSING_MEASUREMENTS.format(count=len(selected_services)))
+
+        def process_service(service: ServiceInfo) -> MeasUIResult:
+            return _create_or_update_measui(
+                process_func,
+                functools.partial(get_metadata, discovery_client, service, channel_pool, use_cache),
+                service.service_class,
+                service.display_name,
+                output_dir,
+            )
+
+        max_workers = workers or min(len(selected_services), DEFAULT_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results += executor.map(process_service, selected_services)
+
+    return results
+
+
+def create_or_update_measuis_offline(
+    process_func: Callable[..., Optional[Path]],
+    output_dir: Path,
+    metadata_files: Sequence[str] = (),
+    measurement_modules: Sequence[str] = (),
+    workers: Optional[int] = None,
+) -> List[MeasUIResult]:
+    """Create or update the UIs of measurement plug-ins without their measurement services.
+
+    The metadata of the measurement plug-ins is read from serialized `GetMetadataResponse`
+    files or built from Python measurement modules, so neither NI Discovery service nor the
+    measurement services are used. The UIs are created or updated concurrently, each in a
+    worker thread.
+
+    Args:
+        process_func: Function that creates or updates the UI of a measurement plug-in from its
+            metadata, service class and output directory, and returns the path of the UI file.
+        output_dir: Output directory of the measurement plug-in UI files.
+        metadata_files: Paths of serialized `GetMetadataResponse` files, in the binary or
+            JSON protobuf format.
+        measurement_modules: Paths of Python measurement modules.
+        workers: Number of worker threads. Defaults to the number of measurement plug-ins, up
+            to `DEFAULT_WORKERS`.
+
+    Returns:
+        The result for each measurement plug-in and for each file whose metadata cannot be
+        read.
+    """
+    logger = getLogger(LOGGER)
+    results: List[MeasUIResult] = []
+    sources: List[Tuple[V2MetaData, str]] = []
+
+    for metadata_file in metadata_files:
+        try:
+            sources.append(load_metadata_file(Path(metadata_file)))
+        except (OSError, ValueError) as error:
+            results.append(_failed_result(metadata_file, metadata_file, str(error)))
+
+    # The measurement modules are run one at a time, as running them changes the modules
+    # of the process.
+    for measurement_module in measurement_modules:
+        try:
+            sources += load_measurement_module(Path(measurement_module))
+        except Exception as error:
+            logger.debug(error, exc_info=True)
+            results.append(
+                _failed_result(
+                    measurement_module, measurement_module, str(error) or type(error).__name__
+                )
+            )
+
+    for result in results:
+        _log_result(result)
+
+    # The UI of a measurement plug-in loaded from several sources is created or updated once,
+    # from its first source, as the same file would be written concurrently otherwise.
+    unique_sources: Dict[str, Tuple[V2MetaData, str]] = {}
+    for metadata, service_class in sources:
+        unique_sources.setdefault(service_class, (metadata, service_class))
+    sources = list(unique_sources.values())
+
+    if not sources:
+        return results
+
+    logger.info(PROCESSING_MEASUREMENTS.format(count=len(sources)))
+
+    def process_source(source: Tuple[V2MetaData, str]) -> MeasUIResult:
+        metadata, service_class = source
+        return _create_or_update_measui(
+            process_func,
+            lambda: metadata,
+            service_class,
+            metadata.measurement_details.display_name,
+            output_dir,
+        )
+
+    max_workers = workers or min(len(sources), DEFAULT_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results += executor.map(process_source, sources)
+
+    return results
+
+
+def _create_or_update_measui(
+    process_func: Callable[..., Optional[Path]],
+    load_metadata: Callable[[], Optional[Union[V1MetaData, V2MetaData]]],
+    service_class: str,
+    display_name: str,
+    output_dir: Path,
+) -> MeasUIResult:
+    logger = getLogger(LOGGER)
+
+    try:
+        metadata = load_metadata()
+        if not metadata:
+            raise InvalidCliInputError(INACTIVE_MEASUREMENT)
+
+        measui_file_path = process_func(metadata, service_class, output_dir)
+        result = MeasUIResult(
+            service_class=service_class,
+            display_name=display_name,
+            succeeded=True,
+            measui_file_path=str(measui_file_path) if measui_file_path else None,
+        )
+
+    except MeasUICreatedError as error:
+        result = MeasUIResult(
+            service_class=service_class,
+            display_name=display_name,
+            succeeded=False,
+            measui_file_path=str(error.measui_file_path),
+            error=error.message,
+            created_instead_of_updated=True,
+        )
+
+    except InvalidCliInputError as error:
+        result = _failed_result(service_class, display_name, error.message)
+
+    except _InactiveRpcError as error:
+        logger.debug(error, exc_info=True)
+        result = _failed_result(service_class, display_name, error.details())
+
+    except Exception as error:
+        logger.debug(error, exc_info=True)
+        result = _failed_result(service_class, display_name, str(error) or type(error).__name__)
+
+    _log_result(result)
+    return result
+
+
+def _failed_result(service_class: str, display_name: str, error: str) -> MeasUIResult:
+    return MeasUIResult(
+        service_class=service_class,
+        display_name=display_name,
+        succeeded=False,
+        error=error,
+    )
+
+
+def _log_result(result: MeasUIResult) -> None:
+    logger = getLogger(LOGGER)
+
+    if result.succeeded:
+        logger.info(
+            MEASUI_SUCCEEDED.format(
+                display_name=result.display_name, filepath=result.measui_file_path
+            )
+        )
+    elif result.created_instead_of_updated:
+        logger.warning(
+            MEASUI_CREATED_INSTEAD.format(display_name=result.display_name, error=result.error)
+        )
+    else:
+        logger.error(MEASUI_FAILED.format(display_name=result.display_name, error=result.error))
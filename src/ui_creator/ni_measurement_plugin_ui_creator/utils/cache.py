@@ -0,0 +1,25 @@
+"""Implementation of the Measurement Plug-In UI Creator's cache directory."""
+
+import os
+from pathlib import Path
+
+CACHE_DIR_ENV_VAR = "NI_MEASUREMENT_PLUGIN_UI_CREATOR_CACHE_DIR"
+CACHE_DIR_NAME = "ni_measurement_plugin_ui_creator"
+
+
+def get_cache_directory() -> Path:
+    """Get the root directory of the UI creator's caches.
+
+    The directory can be overridden with the `NI_MEASUREMENT_PLUGIN_UI_CREATOR_CACHE_DIR`
+    environment variable.
+
+    Returns:
+        Cache directory.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return Path(cache_dir)
+
+    local_app_data = os.environ.get("LOCALAPPDATA")
+    base_dir = Path(local_app_data) if local_app_data else Path.home() / ".cache"
+    return base_dir / CACHE_DIR_NAME
@@ -0,0 +1,108 @@
+"""Implementation of the pool of gRPC channels."""
+
+import threading
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import grpc
+from grpc import Channel
+from ni_measurement_plugin_sdk_service.grpc.channelpool import GrpcChannelPool
+
+# gRPC servers reject the pings of clients that ping more often than every 5 minutes by
+# default, so the connections are checked at that interval.
+KEEPALIVE_TIME_IN_MILLISECONDS = 5 * 60 * 1000
+KEEPALIVE_TIMEOUT_IN_MILLISECONDS = 20 * 1000
+CHANNEL_OPTIONS: List[Tuple[str, Any]] = [
+    ("grpc.keepalive_time_ms", KEEPALIVE_TIME_IN_MILLISECONDS),
+    ("grpc.keepalive_timeout_ms", KEEPALIVE_TIMEOUT_IN_MILLISECONDS),
+    ("grpc.keepalive_permit_without_calls", 0),
+]
+
+
+class _ClientCallDetails(
+    namedtuple(
+        "_ClientCallDetails",
+        ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression"),
+    ),
+    grpc.ClientCallDetails,
+):
+    pass
+
+
+class _DeadlineInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Interceptor that sets a deadline on the calls that do not specify one."""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        if client_call_details.timeout is None:
+            client_call_details = _ClientCallDetails(
+                client_call_details.method,
+                self.timeout,
+                client_call_details.metadata,
+                client_call_details.credentials,
+                getattr(client_call_details, "wait_for_ready", None),
+                getattr(client_call_details, "compression", None),
+            )
+
+        return continuation(client_call_details, request)
+
+
+class ChannelPool(GrpcChannelPool):
+    """Pool of gRPC channels, by address.
+
+    A channel is created once for each address and is reused by all the calls to that address,
+    such as the calls to the measurement services hosted by the same server, so their
+    connection is also reused. The connections are kept alive between calls, and the channels
+    are closed when the pool is closed.
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            timeout: Deadline of the calls that do not specify one, in seconds. Defaults to no
+                deadline.
+        """
+        super().__init__()
+        self._interceptor = _DeadlineInterceptor(timeout) if timeout else None
+        self._channels: Dict[str, Channel] = {}
+        self._channels_lock = threading.Lock()
+
+    def get_channel(self, target: str) -> Channel:
+        """Get the channel of an address.
+
+        Args:
+            target: Address of the server, such as `localhost:50051`.
+
+        Returns:
+            The channel of the address, which is created on the first call.
+        """
+        with self._channels_lock:
+            channel = self._channels.get(target)
+
+            if channel is None:
+                channel = grpc.insecure_channel(target, CHANNEL_OPTIONS)
+                if self._interceptor:
+                    channel = grpc.intercept_channel(channel, self._interceptor)
+
+                self._channels[target] = channel
+
+        return channel
+
+    def close(self) -> None:
+        """Close the channels of the pool."""
+        with self._channels_lock:
+            channels = list(self._channels.values())
+            self._channels.clear()
+
+        for channel in channels:
+            channel.close()
+
+        super().close()
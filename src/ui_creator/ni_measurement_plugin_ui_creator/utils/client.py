@@ -1,9 +1,10 @@
 """Measurement Plug-In Client."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-import grpc
 from grpc import Channel
 from grpc._channel import _InactiveRpcError
 from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measurement.v1.measurement_service_pb2_grpc import (
@@ -16,33 +17,61 @@ from ni_measurement_plugin_sdk_service.discovery import DiscoveryClient
 from ni_measurement_plugin_sdk_service.measurement.info import ServiceInfo
 
 from ni_measurement_plugin_ui_creator.constants import LOGGER
+from ni_measurement_plugin_ui_creator.utils.channel_pool import ChannelPool
 from ni_measurement_plugin_ui_creator.utils.exceptions import InvalidCliInputError
 
 AVAILABLE_MEASUREMENTS = "Registered measurements:"
+# Resolving a measurement service may start it, so the deadline of the calls to the discovery
+# service allows for the start-up of a measurement service.
+DISCOVERY_TIMEOUT_IN_SECONDS = 30.0
 INACTIVE_MEASUREMENNT = "Selected measurement service is not running."
 INVALID_MEASUREMENT_CHOICE = "Invalid measurement plug-in selected."
 MEASUREMENT_SERVICE_INTERFACE_V1 = "ni.measurementlink.measurement.v1.MeasurementService"
 MEASUREMENT_SERVICE_INTERFACE_V2 = "ni.measurementlink.measurement.v2.MeasurementService"
+METADATA_TIMEOUT_IN_SECONDS = 30.0
 NO_MEASUREMENTS_RUNNING = "No measurement services are running."
 SELECT_MEASUREMENT = (
     "Select a measurement service index ({start}-{end}) to create/update measui file: "
 )
 
 
-def get_measurement_service_stub_and_class(
-    discovery_client: DiscoveryClient,
-) -> Optional[Tuple[Union[V1MeasurementServiceStub, V2MeasurementServiceStub], str]]:
-    """Get measurement service stub and measurement service class.
+def create_channel_pool() -> ChannelPool:
+    """Create a pool of the channels to NI Discovery service and to the measurement services.
+
+    The calls on the channels of the pool fail once `DISCOVERY_TIMEOUT_IN_SECONDS` elapse,
+    unless they specify their own deadline, instead of waiting for a busy or unresponsive
+    service.
+
+    Returns:
+        Pool of channels, which closes its channels when its context exits.
+    """
+    os.environ["GRPC_VERBOSITY"] = "NONE"
+    return ChannelPool(timeout=DISCOVERY_TIMEOUT_IN_SECONDS)
+
+
+def create_discovery_client(channel_pool: ChannelPool) -> DiscoveryClient:
+    """Create a client for accessing NI Discovery service.
+
+    Args:
+        channel_pool: Pool of the channels of the client.
+
+    Returns:
+        Client for accessing NI Discovery service.
+    """
+    return DiscoveryClient(grpc_channel_pool=channel_pool)
+
+
+def prompt_measurement_service(discovery_client: DiscoveryClient) -> Optional[ServiceInfo]:
+    """Prompt for a registered measurement service.
 
     Args:
         discovery_client: Client for accessing NI Discovery service.
 
     Returns:
-        if available measurement service stub and service class. None in case of
-        no active measurement services.
+        The selected measurement service. None in case of no active measurement services.
     """
     logger = getLogger(LOGGER)
-    available_services = _get_active_measurement_services(discovery_client)
+    available_services = get_active_measurement_services(discovery_client)
 
     if not available_services:
         logger.warning(NO_MEASUREMENTS_RUNNING)
@@ -58,16 +87,34 @@ def get_measurement_service_stub_and_class(
     logger.info("")
     selected_measurement = _get_measurement_selection(total_measurements=len(measurements))
 
-    measurement_service_class = _get_measurement_service_class(
+    return _get_measurement_service(
         available_services,
         measurements[selected_measurement - 1],
     )
-    if not measurement_service_class:
-        return None
 
+
+def get_measurement_service_stub(
+    discovery_client: DiscoveryClient,
+    measurement_service: ServiceInfo,
+    channel_pool: ChannelPool,
+) -> Optional[Union[V1MeasurementServiceStub, V2MeasurementServiceStub]]:
+    """Get the stub of a registered measurement service.
+
+    Args:
+        discovery_client: Client for accessing NI Discovery service.
+        measurement_service: Registered measurement service, as enumerated by NI Discovery
+            service.
+        channel_pool: Pool of the channels to the measurement services. The stubs of the
+            measurement services at the same address share their channel.
+
+    Returns:
+        Measurement service stub of the latest interface that the service provides. None if the
+        service is not running.
+    """
     channel_and_interface = _get_channel_and_interface(
         discovery_client,
-        measurement_service_class,
+        measurement_service,
+        channel_pool,
     )
 
     if not channel_and_interface:
@@ -76,17 +123,86 @@ def get_measurement_service_stub_and_class(
     channel, measurement_service_interface = channel_and_interface[0], channel_and_interface[1]
 
     if measurement_service_interface == MEASUREMENT_SERVICE_INTERFACE_V2:
-        return V2MeasurementServiceStub(channel), measurement_service_class
+        return V2MeasurementServiceStub(channel)
 
-    return V1MeasurementServiceStub(channel), measurement_service_class
+    return V1MeasurementServiceStub(channel)
 
 
-def _get_active_measurement_services(discovery_client: DiscoveryClient) -> List[ServiceInfo]:
-    v1_measurement_services = discovery_client.enumerate_services(MEASUREMENT_SERVICE_INTERFACE_V1)
-    v2_measurement_services = discovery_client.enumerate_services(MEASUREMENT_SERVICE_INTERFACE_V2)
+def get_measurement_service_interface(measurement_service: ServiceInfo) -> str:
+    """Get the latest measurement service interface that a measurement service provides.
+
+    Args:
+        measurement_service: Registered measurement service, as enumerated by NI Discovery
+            service.
+
+    Returns:
+        gRPC full name of the interface.
+    """
+    if MEASUREMENT_SERVICE_INTERFACE_V2 in measurement_service.provided_interfaces:
+        return MEASUREMENT_SERVICE_INTERFACE_V2
 
-    available_services = list(v1_measurement_services) + list(v2_measurement_services)
-    return available_services
+    return MEASUREMENT_SERVICE_INTERFACE_V1
+
+
+def get_active_measurement_services(discovery_client: DiscoveryClient) -> List[ServiceInfo]:
+    """Get the registered measurement services.
+
+    The services of each interface of the measurement service are enumerated concurrently.
+
+    Args:
+        discovery_client: Client for accessing NI Discovery service.
+
+    Returns:
+        Registered measurement services, each listed once even if it provides several
+        interfaces.
+    """
+    interfaces = [MEASUREMENT_SERVICE_INTERFACE_V1, MEASUREMENT_SERVICE_INTERFACE_V2]
+
+    with ThreadPoolExecutor(max_workers=len(interfaces)) as executor:
+        enumerated_services = list(executor.map(discovery_client.enumerate_services, interfaces))
+
+    available_services: Dict[str, ServiceInfo] = {}
+    for services in enumerated_services:
+        for service in services:
+            available_services.setdefault(service.service_class, service)
+
+    return list(available_services.values())
+
+
+def select_measurement_services(
+    measurement_services: Sequence[ServiceInfo],
+    service_classes: Sequence[str],
+    display_names: Sequence[str],
+) -> Tuple[List[ServiceInfo], List[str]]:
+    """Select measurement services by service class or display name.
+
+    Args:
+        measurement_services: Registered measurement services.
+        service_classes: Service class names of the measurement services to be selected.
+        display_names: Display names of the measurement services to be selected.
+
+    Returns:
+        The selected measurement services, in the order of the registered services, and the
+        service classes and display names that do not match any registered service.
+    """
+    selected_services = [
+        service
+        for service in measurement_services
+        if service.service_class in service_classes or service.display_name in display_names
+    ]
+
+    unmatched_names = [
+        service_class
+        for service_class in service_classes
+        if all(service.service_class != service_class for service in measurement_services)
+    ]
+    unmatched_names += [
+        display_name
+        for display_name in display_names
+        if all(service.display_name != display_name for service in measurement_services)
+    ]
+
+    return selected_services, unmatched_names
 
 
 def _get_measurement_selection(total_measurements: int) -> int:
@@ -113,47 +229,39 @@ def _get_measurement_selection(total_measurements: int) -> int:
         raise InvalidCliInputError(INVALID_MEASUREMENT_CHOICE)
 
 
-def _get_measurement_service_class(
+def _get_measurement_service(
     measurement_services: Sequence[ServiceInfo],
     measurement_name: str,
-) -> Optional[str]:
+) -> Optional[ServiceInfo]:
     for service in measurement_services:
         if service.display_name == measurement_name:
-            return service.service_class
+            return service
 
     return None
 
 
 def _get_channel_and_interface(
     discovery_client: DiscoveryClient,
-    service_class: str,
+    measurement_service: ServiceInfo,
+    channel_pool: ChannelPool,
 ) -> Optional[Tuple[Channel, str]]:
     logger = getLogger(LOGGER)
-    resolved_service = None
-    measurement_service_interface = None
+
+    # The enumerated services list the interfaces they provide, so only the latest interface
+    # of the service is resolved.
+    measurement_service_interface = get_measurement_service_interface(measurement_service)
 
     try:
         resolved_service = discovery_client.resolve_service(
-            MEASUREMENT_SERVICE_INTERFACE_V2,
-            service_class,
-        )
-        measurement_service_interface = MEASUREMENT_SERVICE_INTERFACE_V2
-
-    except _InactiveRpcError:
-        try:
-            resolved_service = discovery_client.resolve_service(
-                MEASUREMENT_SERVICE_INTERFACE_V1,
-                service_class,
-            )
-            measurement_service_interface = MEASUREMENT_SERVICE_INTERFACE_V1
-        except _InactiveRpcError as exp:
-            logger.debug(exp)
-            logger.info(INACTIVE_MEASUREMENNT)
-
-    if resolved_service and measurement_service_interface:
-        return (
-            grpc.insecure_channel(resolved_service.insecure_address),
             measurement_service_interface,
+            measurement_service.service_class,
         )
+    except _InactiveRpcError as exp:
+        logger.debug(exp)
+        logger.info(INACTIVE_MEASUREMENNT)
+        return None
 
-    return None
+    return (
+        channel_pool.get_channel(resolved_service.insecure_address),
+        measurement_service_interface,
+    )
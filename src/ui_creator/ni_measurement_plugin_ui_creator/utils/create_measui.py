@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import Union
 from uuid import UUID
 
-from mako.template import Template
 from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measurement.v1.measurement_service_pb2 import (
     GetMetadataResponse as V1MetaData,
 )
@@ -14,6 +13,9 @@ from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measur
 )
 
 from ni_measurement_plugin_ui_creator.constants import CLIENT_ID, LOGGER, MeasUIFile
+from ni_measurement_plugin_ui_creator.utils.cache import get_cache_directory
+from ni_measurement_plugin_ui_creator.utils.file_writer import write_file_atomically
+from ni_measurement_plugin_ui_creator.utils.template_lookup import render_template
 from ni_measurement_plugin_ui_creator.utils.ui_elements import (
     create_input_elements_from_client,
     create_output_elements_from_client,
@@ -21,19 +23,24 @@ from ni_measurement_plugin_ui_creator.utils.ui_elements import (
 
 CREATING_FILE = "Creating Measurement Plug-In UI..."
 CREATED_UI = "Measurement Plug-In UI created successfully at {filepath}."
+MEASUI_TEMPLATE = "measurement.measui.mako"
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
 
 
 def create_measui(
     metadata: Union[V1MetaData, V2MetaData],
     service_class: str,
     output_dir: Path,
-) -> None:
+) -> Path:
     """Create measurement UI file.
 
     Args:
         metadata: Metadata of a measurement plug-in.
         service_class: Service class name of a measurement plug-in.
         output_dir: Output directory.
+
+    Returns:
+        Path of the created measurement UI file.
     """
     logger = getLogger(LOGGER)
     logger.debug(CREATING_FILE)
@@ -54,6 +61,28 @@ def create_measui(
     filepath = (Path(measui_path).with_suffix(MeasUIFile.MEASUREMENT_UI_FILE_EXTENSION)).resolve()
     logger.info(CREATED_UI.format(filepath=Path(filepath).resolve()))
 
+    return filepath
+
+
+def render_measui(display_name: str, service_class: str, input_output_elements: str) -> bytes:
+    """Render the content of a `measui` file.
+
+    Args:
+        display_name: Display name of the measurement plug-in.
+        service_class: Service class name of the measurement plug-in.
+        input_output_elements: Input and Output XML tags.
+
+    Returns:
+        Content of the `measui` file.
+    """
+    return _render_template(
+        template_name=MEASUI_TEMPLATE,
+        client_id=CLIENT_ID,
+        display_name=display_name,
+        service_class=service_class,
+        input_output_elements=input_output_elements,
+    )
+
 
 def write_measui(filepath: Path, service_class: str, input_output_elements: str) -> None:
     """Write `measui` file.
@@ -63,19 +92,13 @@ def write_measui(filepath: Path, service_class: str, input_output_elements: str)
         service_class: Service class name of the measurement plug-in.
         input_output_elements: Input and Output XML tags.
     """
-    current_dir = Path(__file__).resolve().parent
-    template_file_path = current_dir.parent / "templates" / "measurement.measui.mako"
-
-    file_content = _render_template(
-        template_name=str(template_file_path),
-        client_id=CLIENT_ID,
+    file_content = render_measui(
         display_name=Path(filepath).name,
         service_class=service_class,
         input_output_elements=input_output_elements,
     )
 
-    with open(f"{filepath}{MeasUIFile.MEASUREMENT_UI_FILE_EXTENSION}", "wb") as f:
-        f.write(file_content)
+    write_file_atomically(f"{filepath}{MeasUIFile.MEASUREMENT_UI_FILE_EXTENSION}", file_content)
 
 
 def _render_template(
@@ -85,13 +108,10 @@ def _render_template(
     service_class: str,
     input_output_elements: str,
 ) -> bytes:
-    template = Template(  # nosec: B702
-        filename=template_name,
-        input_encoding=MeasUIFile.ENCODING,
-        output_encoding=MeasUIFile.ENCODING,
-    )
-
-    return template.render(
+    return render_template(
+        TEMPLATE_DIR,
+        get_cache_directory(),
+        template_name,
         client_id=client_id,
         display_name=display_name,
         service_class=service_class,
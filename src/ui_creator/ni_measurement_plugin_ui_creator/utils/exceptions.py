@@ -1,5 +1,7 @@
 """Custom Exceptions."""
 
+from pathlib import Path
+
 
 class InvalidCliInputError(Exception):
     """Invalid CLI arguments error."""
@@ -20,3 +22,18 @@ class InvalidMeasUIError(Exception):
     def __init__(self) -> None:
         """Initialize the exception."""
         super().__init__()
+
+
+class MeasUICreatedError(Exception):
+    """Measurement UI file created instead of updated error."""
+
+    def __init__(self, message: str, measui_file_path: Path) -> None:
+        """Initialize the exception.
+
+        Args:
+            message: Error message to be displayed.
+            measui_file_path: Path of the created measurement UI file.
+        """
+        self.message = message
+        self.measui_file_path = measui_file_path
+        super().__init__(self.message)
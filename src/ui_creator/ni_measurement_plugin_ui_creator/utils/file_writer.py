@@ -0,0 +1,79 @@
+"""Implementation of atomic file writing."""
+
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Union
+
+TEMP_FILE_NAME = ".{file_name}.{suffix}.tmp"
+
+
+def _has_content(file_path: Path, content: bytes) -> bool:
+    try:
+        return file_path.stat().st_size == len(content) and file_path.read_bytes() == content
+    except OSError:
+        return False
+
+
+def write_file_atomically(file_path: Union[str, Path], content: bytes) -> bool:
+    """Write the content to the file atomically, unless the file already has the content.
+
+    The content is written to a temporary file in the same directory, which then replaces
+    the file, so that readers never observe a partially written file. The permissions of the
+    file are kept.
+
+    Args:
+        file_path: Path of the file.
+        content: Content of the file.
+
+    Returns:
+        True if the file is written, False if its content is unchanged.
+    """
+    file_path = Path(file_path)
+    if _has_content(file_path, content):
+        return False
+
+    temp_file_path = file_path.with_name(
+        TEMP_FILE_NAME.format(file_name=file_path.name, suffix=uuid.uuid4().hex)
+    )
+
+    try:
+        # A new file gets the default permissions, as if it were written in place.
+        with open(temp_file_path, "xb") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+
+        # The file that is replaced keeps its permissions.
+        try:
+            shutil.copymode(file_path, temp_file_path)
+        except FileNotFoundError:
+            pass
+
+        os.replace(temp_file_path, file_path)
+
+    except BaseException:
+        try:
+            temp_file_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    return True
+
+
+def write_text_file_atomically(file_path: Union[str, Path], text: str, encoding: str) -> bool:
+    """Write the text to the file atomically, unless the file already has the text.
+
+    Newlines are translated to the platform's line separator, as writing in text mode does.
+
+    Args:
+        file_path: Path of the file.
+        text: Text of the file.
+        encoding: Encoding of the file.
+
+    Returns:
+        True if the file is written, False if its content is unchanged.
+    """
+    return write_file_atomically(file_path, text.replace("\n", os.linesep).encode(encoding))
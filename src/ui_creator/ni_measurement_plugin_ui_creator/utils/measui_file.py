@@ -1,7 +1,8 @@
 """Implementation of read and write measurement plug-in UI file for update command."""
 
-import os
+import io
 import urllib.parse
+import urllib.request
 import xml.etree.ElementTree as ETree  # nosec: B405
 from logging import getLogger
 from pathlib import Path
@@ -17,6 +18,7 @@ from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measur
     GetMetadataResponse as V2MetaData,
 )
 from ni_measurement_plugin_sdk_service.discovery import DiscoveryClient
+from ni_measurement_plugin_sdk_service.measurement.info import ServiceInfo
 
 from ni_measurement_plugin_ui_creator.constants import (
     LOGGER,
@@ -25,37 +27,103 @@ from ni_measurement_plugin_ui_creator.constants import (
     UpdateUI,
 )
 from ni_measurement_plugin_ui_creator.models import AvailableElement
+from ni_measurement_plugin_ui_creator.utils.channel_pool import ChannelPool
 from ni_measurement_plugin_ui_creator.utils.client import (
-    get_measurement_service_stub_and_class,
+    METADATA_TIMEOUT_IN_SECONDS,
+    create_channel_pool,
+    create_discovery_client,
+    get_measurement_service_interface,
+    get_measurement_service_stub,
+    prompt_measurement_service,
 )
 from ni_measurement_plugin_ui_creator.utils.exceptions import (
     InvalidCliInputError,
     InvalidMeasUIError,
 )
+from ni_measurement_plugin_ui_creator.utils.file_writer import (
+    write_file_atomically,
+    write_text_file_atomically,
+)
+from ni_measurement_plugin_ui_creator.utils.metadata_cache import (
+    get_cached_metadata,
+    get_metadata_cache_key,
+    store_metadata,
+)
 
+FILE_URI_SCHEME = "file"
 INVALID_MEASUI_CHOICE = "Invalid .measui file selected."
+LOCAL_HOST = "localhost"
 SELECT_MEASUI_FILE = "Select a measurement plug-in UI file index ({start}-{end}) to update: "
 
 
-def get_metadata_and_service_class() -> Optional[Tuple[Union[V1MetaData, V2MetaData], str]]:
+def get_metadata_and_service_class(
+    use_cache: bool = True,
+) -> Optional[Tuple[Union[V1MetaData, V2MetaData], str]]:
     """Get metadata and service class of the measurement plug-in.
 
+    Args:
+        use_cache: Whether to restore the metadata from the cache if it is cached.
+
     Returns:
         Metadata and service class name if selected measurement plug-in is valid. Else None.
     """
-    os.environ["GRPC_VERBOSITY"] = "NONE"
-    discovery_client = DiscoveryClient()
-    service_stub_and_class = get_measurement_service_stub_and_class(discovery_client)
+    with create_channel_pool() as channel_pool:
+        discovery_client = create_discovery_client(channel_pool)
+        measurement_service = prompt_measurement_service(discovery_client)
+
+        if not measurement_service:
+            return None
+
+        metadata = get_metadata(discovery_client, measurement_service, channel_pool, use_cache)
+
+    if not metadata:
+        return None
+
+    return metadata, measurement_service.service_class
+
+
+def get_metadata(
+    discovery_client: DiscoveryClient,
+    measurement_service: ServiceInfo,
+    channel_pool: ChannelPool,
+    use_cache: bool = True,
+) -> Optional[Union[V1MetaData, V2MetaData]]:
+    """Get metadata of a registered measurement plug-in.
+
+    The metadata is cached, so it is fetched from the measurement service only if the
+    measurement plug-in is redeployed or its cached metadata expires.
+
+    Args:
+        discovery_client: Client for accessing NI Discovery service.
+        measurement_service: Registered measurement service of the measurement plug-in.
+        channel_pool: Pool of the channels to the measurement services.
+        use_cache: Whether to restore the metadata from the cache if it is cached. The fetched
+            metadata is cached either way.
+
+    Returns:
+        Metadata of the measurement plug-in if it is cached or running. Else None.
+    """
+    interface = get_measurement_service_interface(measurement_service)
+    cache_key = get_metadata_cache_key(measurement_service, interface)
+
+    if use_cache:
+        metadata = get_cached_metadata(cache_key, interface, measurement_service.display_name)
+        if metadata:
+            return metadata
 
-    if not service_stub_and_class:
+    measurement_service_stub = get_measurement_service_stub(
+        discovery_client, measurement_service, channel_pool
+    )
+
+    if not measurement_service_stub:
         return None
 
-    measurement_service_stub, measurement_service_class = (
-        service_stub_and_class[0],
-        service_stub_and_class[1],
+    metadata = measurement_service_stub.GetMetadata(
+        v2_measurement_service_pb2.GetMetadataRequest(), timeout=METADATA_TIMEOUT_IN_SECONDS
     )
-    metadata = measurement_service_stub.GetMetadata(v2_measurement_service_pb2.GetMetadataRequest())
-    return metadata, measurement_service_class
+    store_metadata(cache_key, metadata)
+
+    return metadata
 
 
 def get_measui_selection(measui_count: int) -> int:
@@ -109,7 +177,16 @@ def get_measui_files(metadata: Union[V1MetaData, V2MetaData]) -> List[str]:
 
 
 def _uri_to_path(uri: str) -> str:
-    return urllib.parse.unquote(urllib.parse.urlparse(uri).path)
+    parsed_uri = urllib.parse.urlparse(uri)
+    if parsed_uri.scheme != FILE_URI_SCHEME:
+        return uri
+
+    path = parsed_uri.path
+    # `file://server/share/file` is a UNC path on Windows.
+    if parsed_uri.netloc and parsed_uri.netloc != LOCAL_HOST:
+        path = f"//{parsed_uri.netloc}{path}"
+
+    return urllib.request.url2pathname(path)
 
 
 def validate_measui(root: ETree.ElementTree) -> None:
@@ -318,7 +395,10 @@ def write_updated_measui(filepath: Path, updated_ui: List[AvailableElement]) ->
             screen.remove(screen_surface)
 
         screen.append(updated_ui[0].element)
-        tree.write(filepath, encoding=MeasUIFile.ENCODING, xml_declaration=True)
+
+        content = io.BytesIO()
+        tree.write(content, encoding=MeasUIFile.ENCODING, xml_declaration=True)
+        write_file_atomically(filepath, content.getvalue())
 
 
 def insert_created_elements(filepath: Path, elements_str: str) -> None:
@@ -338,5 +418,4 @@ def insert_created_elements(filepath: Path, elements_str: str) -> None:
         xml_content[:insert_position] + elements_str + "\n" + xml_content[insert_position:]
     )
 
-    with open(filepath, "w", encoding=MeasUIFile.ENCODING) as file:
-        file.write(new_content)
+    write_text_file_atomically(filepath, new_content, MeasUIFile.ENCODING)
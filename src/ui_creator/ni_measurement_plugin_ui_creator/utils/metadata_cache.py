@@ -0,0 +1,147 @@
+"""Implementation of the cache of the metadata of measurement plug-ins."""
+
+import hashlib
+import json
+import os
+import time
+from logging import getLogger
+from pathlib import Path
+from typing import Optional, Union
+
+from google.protobuf.message import DecodeError
+from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measurement.v1.measurement_service_pb2 import (
+    GetMetadataResponse as V1MetaData,
+)
+from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measurement.v2.measurement_service_pb2 import (
+    GetMetadataResponse as V2MetaData,
+)
+from ni_measurement_plugin_sdk_service.measurement.info import ServiceInfo
+
+from ni_measurement_plugin_ui_creator.constants import LOGGER, MeasUIFile
+from ni_measurement_plugin_ui_creator.utils.cache import get_cache_directory
+from ni_measurement_plugin_ui_creator.utils.client import MEASUREMENT_SERVICE_INTERFACE_V2
+from ni_measurement_plugin_ui_creator.utils.file_writer import write_file_atomically
+
+METADATA_DIR_NAME = "metadata"
+METADATA_FILE_EXTENSION = ".pb"
+METADATA_CACHE_SIZE_LIMIT_IN_BYTES = 16 * 1024 * 1024  # 16MB
+# The metadata of a measurement plug-in that is redeployed without changing its version or
+# its service configuration is fetched again once its cached metadata expires.
+METADATA_CACHE_TTL_IN_SECONDS = 24 * 60 * 60
+
+CACHE_UNAVAILABLE = "Metadata cache is unavailable: {error}"
+METADATA_CACHE_HIT = "Metadata of '{display_name}' is restored from the cache."
+
+
+def get_metadata_cache_key(measurement_service: ServiceInfo, interface: str) -> str:
+    """Get the cache key of the metadata of a measurement plug-in.
+
+    The key covers the service class, the versions and the rest of the service configuration
+    of the measurement plug-in, as enumerated by NI Discovery service, so redeploying the
+    measurement plug-in with a new version or service configuration never restores its
+    previous metadata.
+
+    Args:
+        measurement_service: Registered measurement service of the measurement plug-in.
+        interface: Interface of the measurement service that provides the metadata.
+
+    Returns:
+        Cache key of the metadata.
+    """
+    service_configuration = json.dumps(
+        {
+            "service_class": measurement_service.service_class,
+            "interface": interface,
+            "versions": list(measurement_service.versions),
+            "provided_interfaces": sorted(measurement_service.provided_interfaces),
+            "annotations": dict(measurement_service.annotations),
+            "display_name": measurement_service.display_name,
+            "description_url": measurement_service.description_url,
+        },
+        sort_keys=True,
+    )
+
+    return hashlib.sha256(service_configuration.encode(MeasUIFile.ENCODING)).hexdigest()
+
+
+def _get_entry_file(cache_key: str) -> Path:
+    return get_cache_directory() / METADATA_DIR_NAME / f"{cache_key}{METADATA_FILE_EXTENSION}"
+
+
+def get_cached_metadata(
+    cache_key: str, interface: str, display_name: str
+) -> Optional[Union[V1MetaData, V2MetaData]]:
+    """Get the metadata of a measurement plug-in from the cache.
+
+    Args:
+        cache_key: Cache key of the metadata.
+        interface: Interface of the measurement service that provided the metadata.
+        display_name: Display name of the measurement plug-in.
+
+    Returns:
+        The metadata on a cache hit, else None. Expired metadata is a cache miss.
+    """
+    logger = getLogger(LOGGER)
+    entry_file = _get_entry_file(cache_key)
+    metadata_type = V2MetaData if interface == MEASUREMENT_SERVICE_INTERFACE_V2 else V1MetaData
+
+    try:
+        # The modification time of an entry is the time its metadata was fetched, and its
+        # access time is the time it was last used, for the LRU eviction.
+        fetched_time = entry_file.stat().st_mtime
+        if time.time() - fetched_time > METADATA_CACHE_TTL_IN_SECONDS:
+            entry_file.unlink(missing_ok=True)
+            return None
+
+        metadata = metadata_type.FromString(entry_file.read_bytes())
+        os.utime(entry_file, (time.time(), fetched_time))
+
+    except FileNotFoundError:
+        return None
+
+    except (OSError, DecodeError) as error:
+        logger.debug(CACHE_UNAVAILABLE.format(error=error))
+        return None
+
+    logger.info(METADATA_CACHE_HIT.format(display_name=display_name))
+    return metadata
+
+
+def store_metadata(cache_key: str, metadata: Union[V1MetaData, V2MetaData]) -> None:
+    """Store the metadata of a measurement plug-in in the cache.
+
+    Errors are logged and ignored because caching must not fail the command.
+
+    Args:
+        cache_key: Cache key of the metadata.
+        metadata: Metadata of the measurement plug-in.
+    """
+    entry_file = _get_entry_file(cache_key)
+
+    try:
+        entry_file.parent.mkdir(parents=True, exist_ok=True)
+        write_file_atomically(entry_file, metadata.SerializeToString(deterministic=True))
+
+        # The entry is marked as fetched now even if its content is unchanged.
+        os.utime(entry_file)
+        _evict_least_recently_used(entry_file.parent, METADATA_CACHE_SIZE_LIMIT_IN_BYTES)
+
+    except OSError as error:
+        getLogger(LOGGER).debug(CACHE_UNAVAILABLE.format(error=error))
+
+
+def _evict_least_recently_used(cache_dir: Path, size_limit: int) -> None:
+    entries = [
+        (entry, entry.stat())
+        for entry in cache_dir.iterdir()
+        if entry.suffix == METADATA_FILE_EXTENSION
+    ]
+    entries.sort(key=lambda entry_and_stat: entry_and_stat[1].st_atime)
+    total_size = sum(stat.st_size for _, stat in entries)
+
+    for entry, stat in entries:
+        if total_size <= size_limit:
+            break
+
+        entry.unlink(missing_ok=True)
+        total_size -= stat.st_size
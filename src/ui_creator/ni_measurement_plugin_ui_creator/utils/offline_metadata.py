@@ -0,0 +1,176 @@
+"""Implementation of reading the metadata of measurement plug-ins without their services."""
+
+import json
+import os
+import runpy
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+from google.protobuf import descriptor_pool, json_format
+from google.protobuf.message import DecodeError
+from ni_measurement_plugin_sdk_service._internal.grpc_servicer import (
+    MeasurementServiceServicerV2,
+)
+from ni_measurement_plugin_sdk_service._internal.parameter.serialization_descriptors import (
+    create_file_descriptor,
+)
+from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measurement.v2.measurement_service_pb2 import (
+    GetMetadataRequest,
+    GetMetadataResponse as V2MetaData,
+)
+from ni_measurement_plugin_sdk_service.measurement.service import MeasurementService
+
+from ni_measurement_plugin_ui_creator.constants import MeasUIFile
+
+CONFIGURATIONS_MESSAGE_TYPE_SUFFIX = ".Configurations"
+# JSON names of the serialized default values of the configuration parameters, whose message
+# type is defined by the measurement service only.
+CONFIGURATION_DEFAULTS_JSON_NAMES = ("configurationDefaults", "configuration_defaults")
+JSON_FILE_EXTENSION = ".json"
+# Name of the measurement modules while they are run, so that they do not host their service.
+MEASUREMENT_MODULE_NAME = "__measurement_module__"
+
+INVALID_METADATA_FILE = "'{metadata_file}' is not a serialized GetMetadataResponse: {error}"
+NOT_A_JSON_OBJECT = "The content is not a JSON object."
+NO_MEASUREMENT_SERVICE = "No measurement service is defined in '{module_path}'."
+NO_SERVICE_CLASS = (
+    "The service class of the metadata in '{metadata_file}' is unknown, as the metadata has no "
+    "configuration parameters message type."
+)
+
+
+def get_service_class(metadata: V2MetaData) -> str:
+    """Get the service class of a measurement plug-in from its metadata.
+
+    Args:
+        metadata: Metadata of the measurement plug-in.
+
+    Returns:
+        Service class name of the measurement plug-in, or an empty string if the metadata does
+        not name the message type of its configuration parameters.
+    """
+    # The message type of the configuration parameters is `<service class>.Configurations`.
+    message_type = metadata.measurement_signature.configuration_parameters_message_type
+
+    if not message_type.endswith(CONFIGURATIONS_MESSAGE_TYPE_SUFFIX):
+        return ""
+
+    return message_type[: -len(CONFIGURATIONS_MESSAGE_TYPE_SUFFIX)]
+
+
+def load_metadata_file(metadata_file: Path) -> Tuple[V2MetaData, str]:
+    """Load the metadata of a measurement plug-in from a serialized `GetMetadataResponse`.
+
+    The response may be serialized in the binary protobuf format or, if the file has the
+    `.json` extension, in the JSON protobuf format. Responses of the v1 measurement service
+    are read as responses of the v2 measurement service, which are a superset of them. The
+    default values of the configuration parameters are not read from JSON files, as they are
+    not used to create the `measui` files.
+
+    Args:
+        metadata_file: Path of the serialized response.
+
+    Returns:
+        Metadata and service class name of the measurement plug-in.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a serialized response or does not name the service
+            class of the measurement plug-in.
+    """
+    metadata = V2MetaData()
+
+    try:
+        if metadata_file.suffix.lower() == JSON_FILE_EXTENSION:
+            response = json.loads(metadata_file.read_text(encoding=MeasUIFile.ENCODING))
+            if not isinstance(response, dict):
+                raise json_format.ParseError(NOT_A_JSON_OBJECT)
+
+            for signature_name in ("measurementSignature", "measurement_signature"):
+                signature = response.get(signature_name)
+                if isinstance(signature, dict):
+                    for name in CONFIGURATION_DEFAULTS_JSON_NAMES:
+                        signature.pop(name, None)
+
+            json_format.ParseDict(response, metadata)
+        else:
+            metadata.ParseFromString(metadata_file.read_bytes())
+
+    except (DecodeError, json_format.ParseError, json.JSONDecodeError) as error:
+        raise ValueError(
+            INVALID_METADATA_FILE.format(metadata_file=metadata_file, error=error)
+        ) from error
+
+    service_class = get_service_class(metadata)
+    if not service_class:
+        raise ValueError(NO_SERVICE_CLASS.format(metadata_file=metadata_file))
+
+    return metadata, service_class
+
+
+def load_measurement_module(module_path: Path) -> List[Tuple[V2MetaData, str]]:
+    """Load the metadata of the measurement plug-ins defined by a Python measurement module.
+
+    The module is run without hosting its services, and the metadata of each measurement
+    service it defines is built as the measurement service would return it. The module and
+    its dependencies, such as the `.serviceconfig` file and the Python packages it imports,
+    must be available, but NI Discovery service is not used.
+
+    Args:
+        module_path: Path of the measurement module, such as `measurement.py`.
+
+    Returns:
+        Metadata and service class name of each measurement plug-in of the module.
+
+    Raises:
+        ValueError: If the module does not define any measurement service.
+    """
+    module_path = module_path.resolve()
+    module_dir = str(module_path.parent)
+    imported_modules = set(sys.modules)
+
+    # The measurement modules import the modules next to them, such as `_helpers.py`.
+    sys.path.insert(0, module_dir)
+    try:
+        module_globals = runpy.run_path(str(module_path), run_name=MEASUREMENT_MODULE_NAME)
+    finally:
+        sys.path.remove(module_dir)
+        # The modules next to a measurement module must not be reused by other measurement
+        # modules that have modules of the same names.
+        for name in set(sys.modules) - imported_modules:
+            module_file = getattr(sys.modules[name], "__file__", None)
+            if module_file and os.path.abspath(module_file).startswith(module_dir + os.sep):
+                del sys.modules[name]
+
+    measurement_services = [
+        value for value in module_globals.values() if isinstance(value, MeasurementService)
+    ]
+    if not measurement_services:
+        raise ValueError(NO_MEASUREMENT_SERVICE.format(module_path=module_path))
+
+    return [
+        (_get_measurement_service_metadata(service), service.service_info.service_class)
+        for service in measurement_services
+    ]
+
+
+def _get_measurement_service_metadata(measurement_service: MeasurementService) -> V2MetaData:
+    # The default values of the configuration parameters are serialized using the message
+    # types that the measurement service registers when it is hosted.
+    create_file_descriptor(
+        service_name=measurement_service.service_info.service_class,
+        output_metadata=measurement_service._output_parameter_list,
+        input_metadata=measurement_service._configuration_parameter_list,
+        pool=descriptor_pool.Default(),
+    )
+    servicer = MeasurementServiceServicerV2(
+        measurement_service.measurement_info,
+        measurement_service._configuration_parameter_list,
+        measurement_service._output_parameter_list,
+        measurement_service._measure_function,
+        None,
+        measurement_service.service_info,
+    )
+    # The servicer does not use the context of the call.
+    return servicer.GetMetadata(GetMetadataRequest(), None)  # type: ignore[arg-type]
@@ -0,0 +1,78 @@
+"""Implementation of the shared lookup of compiled Mako templates."""
+
+import functools
+import hashlib
+from pathlib import Path
+from typing import Any, Optional
+
+from mako.lookup import TemplateLookup
+
+from ni_measurement_plugin_ui_creator.constants import MeasUIFile
+
+COMPILED_TEMPLATES_DIR_NAME = "compiled_templates"
+
+
+def _hash_templates(template_dir: Path) -> str:
+    digest = hashlib.sha256()
+
+    for template_file in sorted(template_dir.glob("*.mako")):
+        digest.update(template_file.name.encode(MeasUIFile.ENCODING))
+        digest.update(template_file.read_bytes())
+
+    return digest.hexdigest()
+
+
+def _get_module_directory(template_dir: Path, cache_dir: Path) -> Optional[str]:
+    # Compiled modules are kept per hash of the templates, so a change to the templates is
+    # never served from stale modules even if the file modification times are unreliable.
+    module_dir = cache_dir / COMPILED_TEMPLATES_DIR_NAME / _hash_templates(template_dir)
+
+    try:
+        module_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # Compile the templates in memory if the cache directory is not writable.
+        return None
+
+    return str(module_dir)
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_lookup(template_dir: Path, cache_dir: Path) -> TemplateLookup:
+    """Get the lookup of the templates in a directory.
+
+    The lookup keeps the compiled templates in memory and their compiled modules in the
+    cache directory. A template is compiled again only when its modification time or the
+    contents of the template directory change.
+
+    Args:
+        template_dir: Directory of the templates.
+        cache_dir: Directory in which the compiled templates are stored.
+
+    Returns:
+        Template lookup of the directory.
+    """
+    return TemplateLookup(  # nosec: B702
+        directories=[str(template_dir)],
+        module_directory=_get_module_directory(template_dir, cache_dir),
+        filesystem_checks=True,
+        input_encoding=MeasUIFile.ENCODING,
+        output_encoding=MeasUIFile.ENCODING,
+    )
+
+
+def render_template(
+    template_dir: Path, cache_dir: Path, template_name: str, **template_args: Any
+) -> bytes:
+    """Render a template of a directory using the shared template lookup.
+
+    Args:
+        template_dir: Directory of the templates.
+        cache_dir: Directory in which the compiled templates are stored.
+        template_name: The name of the template file to render.
+        **template_args: Arguments to pass to the template during rendering.
+
+    Returns:
+        Rendered template.
+    """
+    template = get_template_lookup(template_dir, cache_dir).get_template(template_name)
+    return template.render(**template_args)
@@ -5,7 +5,7 @@ import shutil
 import xml.etree.ElementTree as ETree  # nosec: B405
 from logging import getLogger
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import List, NoReturn, Optional, Tuple, Union
 from uuid import UUID
 
 from ni_measurement_plugin_sdk_service._internal.stubs.ni.measurementlink.measurement.v1.measurement_service_pb2 import (
@@ -33,7 +33,11 @@ from ni_measurement_plugin_ui_creator.constants import (
 from ni_measurement_plugin_ui_creator.models import AvailableElement
 from ni_measurement_plugin_ui_creator.utils.common_elements import get_unique_id
 from ni_measurement_plugin_ui_creator.utils.create_measui import create_measui
-from ni_measurement_plugin_ui_creator.utils.exceptions import InvalidMeasUIError
+from ni_measurement_plugin_ui_creator.utils.exceptions import (
+    InvalidCliInputError,
+    InvalidMeasUIError,
+    MeasUICreatedError,
+)
 from ni_measurement_plugin_ui_creator.utils.measui_file import (
     get_available_elements,
     get_measui_files,
@@ -52,6 +56,11 @@ BINDING_ELEMENTS = "Binding UI controls and indicators..."
 CREATING_ELEMENTS = "Creating new controls and indicators..."
 INPUTS_BOUND = "Inputs are bound successfully."
 INVALID_MEASUI_FILE = "Invalid Measurement Plug-In UI file. Creating a new measui file for the selected measurement..."
+MEASUI_CREATED = "Created a new Measurement Plug-In UI file at {filepath} instead of updating one."
+MULTIPLE_MEASUI_FILES = (
+    "'{display_name}' has several Measurement Plug-In UI files. "
+    "Select the file to be updated using --measui-file."
+)
 NO_MEASUI_FILE = "No Measurement Plug-In UI file available. Creating a new measui file for the selected measurement..."
 OUTPUTS_BOUND = "Outputs are bound successfully."
 UPDATED_UI = "Measurement Plug-In UI updated successfully. Please find at {filepath}."
@@ -61,28 +70,52 @@ def update_measui(
     metadata: Union[V1MetaData, V2MetaData],
     service_class: str,
     output_dir: Path,
-) -> None:
+    measui_file_path: Optional[str] = None,
+    interactive: bool = True,
+) -> Optional[Path]:
     """Update the measurment plug-in UI.
 
     Args:
         metadata: Metadata of the measurement plug-in.
         service_class: Service class name of the measurement plug-in.
         output_dir: Output directory where updated measurement UI is outputted.
+        measui_file_path: Measurement plug-in UI file to be updated. Defaults to one of the
+            measurement plug-in UI files registered by the measurement plug-in.
+        interactive: Whether to prompt for the measurement plug-in UI file. Else the only
+            measurement plug-in UI file registered by the measurement plug-in is updated.
+
+    Returns:
+        Path of the updated measurement plug-in UI file.
+
+    Raises:
+        InvalidCliInputError: If the measurement plug-in UI file cannot be selected without
+            prompting.
+        MeasUICreatedError: If there is no valid measurement plug-in UI file to be updated, in
+            which case a new measurement plug-in UI file is created instead.
     """
     logger = getLogger(LOGGER)
 
-    measui_files = get_measui_files(metadata)
-    if not measui_files:
-        logger.warning(NO_MEASUI_FILE)
-        create_measui(metadata, service_class, output_dir)
-        return
-
-    logger.info(AVAILABLE_MEASUI_FILES)
-    for serial_num, measui_file_path in enumerate(measui_files):
-        logger.info(f"{serial_num + 1}. {measui_file_path[1:]}")
-
-    logger.info("")
-    selected_measui = measui_files[get_measui_selection(len(measui_files)) - 1][1:]
+    if measui_file_path:
+        selected_measui = measui_file_path
+    else:
+        measui_files = get_measui_files(metadata)
+        if not measui_files:
+            logger.warning(NO_MEASUI_FILE)
+            _create_measui_instead(metadata, service_class, output_dir)
+
+        if interactive:
+            logger.info(AVAILABLE_MEASUI_FILES)
+            for serial_num, measui_file in enumerate(measui_files):
+                logger.info(f"{serial_num + 1}. {measui_file}")
+
+            logger.info("")
+            selected_measui = measui_files[get_measui_selection(len(measui_files)) - 1]
+        elif len(measui_files) == 1:
+            selected_measui = measui_files[0]
+        else:
+            raise InvalidCliInputError(
+                MULTIPLE_MEASUI_FILES.format(display_name=metadata.measurement_details.display_name)
+            )
 
     try:
         tree = ETree.parse(selected_measui)  # nosec: B314
@@ -90,8 +123,7 @@ def update_measui(
 
     except (ETree.ParseError, InvalidMeasUIError, FileNotFoundError, PermissionError):
         logger.warning(INVALID_MEASUI_FILE)
-        create_measui(metadata, service_class, output_dir)
-        return
+        _create_measui_instead(metadata, service_class, output_dir)
 
     updated_measui_filepath = Path(output_dir) / (
         Path(selected_measui).stem + f"_updated{MeasUIFile.MEASUREMENT_UI_FILE_EXTENSION}"
@@ -141,7 +173,14 @@ def update_measui(
     insert_created_elements(updated_measui_filepath, elements_representation)
     logger.info(UPDATED_UI.format(filepath=Path(updated_measui_filepath).resolve()))
 
-    return None
+    return updated_measui_filepath.resolve()
+
+
+def _create_measui_instead(
+    metadata: Union[V1MetaData, V2MetaData], service_class: str, output_dir: Path
+) -> NoReturn:
+    measui_file_path = create_measui(metadata, service_class, output_dir)
+    raise MeasUICreatedError(MEASUI_CREATED.format(filepath=measui_file_path), measui_file_path)
 
 
 def _bind_elements(